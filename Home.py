@@ -1,29 +1,16 @@
 import streamlit as st
 
-from extrato.lib.extrato_xls_reader import ExtratoExcelReader
+from common.session_state_cache import SessionStateCache
 
-from positions.lib.closed_dataframes_kit import ClosedPositionKit
 
-
-class SessionStateControl:
+class SessionStateControl(SessionStateCache):
     def __init__(self) -> None:
         """Structure used to control the Session State parameters related to Streamlit.
         
         Session States in Streamlit work as global variables and they are acessed maily by the Streamlit Pages.
+        The Extrato dataframe and the dataframes derived from it are kept as described in 'SessionStateCache'.
         """
-        self.__xls_reader = ExtratoExcelReader()
-        self.__closed_kit = ClosedPositionKit()
-
-    def __saveStreamlitSessionState(self, uploaded_file):
-        st.session_state.extrato_file_path = uploaded_file
-        st.session_state.extrato_dataframe = self.__xls_reader.getRawDataframe()
-        st.session_state.closed_positions_dataframe = self.__closed_kit.getRawDataframe()
-
-    def setUploadedFile(self, uploaded_file) -> None:
-        if uploaded_file is not None:
-            self.__xls_reader.readExcelFile(uploaded_file)
-            self.__closed_kit.setExtratoDataframe(self.__xls_reader.getRawDataframe())
-            self.__saveStreamlitSessionState(uploaded_file)
+        super().__init__(st.session_state)
 
 
 class ExtratoGuiWeb:
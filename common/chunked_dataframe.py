@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+
+class ChunkedDataframe:
+    def __init__(self, dataframe: pd.DataFrame) -> None:
+        """Structure used to grow a dataframe by appended lines, without copying the lines already kept.
+
+        The appended lines are kept as chunks, and the values changed in lines already kept are kept as
+        changed chunks (see 'getUpdatedDataframe'). So, appending lines costs only the new lines: the whole
+        dataframe is concatenated once, when it is read (see 'getDataframe'). Reading some lines
+        ('getLines') or the number of lines does not concatenate them.
+
+        The chunks are never changed in place, so the dataframe given may be shared (such as a cached one).
+
+        Args:
+        - dataframe: the initial lines
+        """
+        self.__chunks_list = [dataframe]
+        self.__changed_chunks_list = []
+        self.__lines_number = len(dataframe)
+
+    def getUpdatedDataframe(self, new_lines_df: pd.DataFrame = None, changed_lines_df: pd.DataFrame = None) -> "ChunkedDataframe":
+        """Return a new 'ChunkedDataframe' with the 'new_lines_df' appended and the 'changed_lines_df' values replaced.
+
+        The 'changed_lines_df' lines must be lines already kept (or in 'new_lines_df'): only its columns are
+        replaced. This object is not changed.
+        """
+        updated_dataframe = ChunkedDataframe.__new__(ChunkedDataframe)
+        updated_dataframe.__chunks_list = self.__chunks_list.copy()
+        updated_dataframe.__changed_chunks_list = self.__changed_chunks_list.copy()
+        updated_dataframe.__lines_number = self.__lines_number
+        if new_lines_df is not None and len(new_lines_df):
+            updated_dataframe.__chunks_list.append(new_lines_df)
+            updated_dataframe.__lines_number += len(new_lines_df)
+        if changed_lines_df is not None and len(changed_lines_df):
+            updated_dataframe.__changed_chunks_list.append(changed_lines_df)
+        return updated_dataframe
+
+    def getLinesNumber(self) -> int:
+        return self.__lines_number
+
+    def getIndexMaximum(self):
+        """Return the maximum index value of all the chunks, or None if there are no lines."""
+        maximums_list = [chunk_df.index.max() for chunk_df in self.__chunks_list if len(chunk_df)]
+        return max(maximums_list) if maximums_list else None
+
+    def getDataframe(self) -> pd.DataFrame:
+        """Return the whole dataframe. The chunks are concatenated once, then the result is kept."""
+        if len(self.__chunks_list) > 1 or self.__changed_chunks_list:
+            dataframe = pd.concat(self.__chunks_list) if len(self.__chunks_list) > 1 else self.__chunks_list[0].copy()
+            self.__setChangedValues(dataframe)
+            self.__chunks_list = [dataframe]
+            self.__changed_chunks_list = []
+        return self.__chunks_list[0]
+
+    def __setChangedValues(self, dataframe: pd.DataFrame) -> None:
+        # The changes are applied in their order, only in the lines of the 'dataframe' (a new one)
+        for changed_lines_df in self.__changed_chunks_list:
+            lines_index = changed_lines_df.index.intersection(dataframe.index)
+            if len(lines_index):
+                dataframe.loc[lines_index, changed_lines_df.columns] = changed_lines_df.loc[lines_index]
+
+    def getLines(self, lines_index: pd.Index) -> pd.DataFrame:
+        """Return the 'lines_index' lines (by label, as 'DataFrame.loc'), without concatenating the whole dataframe."""
+        if len(self.__chunks_list) == 1 and not self.__changed_chunks_list:
+            return self.__chunks_list[0].loc[lines_index]
+        lines_index = pd.Index(lines_index)
+        parts_list = []
+        for chunk_df in self.__chunks_list:
+            positions_array = chunk_df.index.get_indexer(lines_index)
+            positions_array = positions_array[positions_array >= 0]
+            if len(positions_array):
+                parts_list.append(chunk_df.take(np.sort(positions_array)))
+        if not parts_list:
+            return self.__chunks_list[0].loc[lines_index]
+        dataframe = pd.concat(parts_list).loc[lines_index]
+        self.__setChangedValues(dataframe)
+        return dataframe
+
+    def getRows(self, positions_array: np.ndarray) -> pd.DataFrame:
+        """Return the lines in the 'positions_array' positions (as 'DataFrame.take'), without concatenating the whole dataframe."""
+        if len(self.__chunks_list) == 1 and not self.__changed_chunks_list:
+            return self.__chunks_list[0].take(positions_array)
+        positions_array = np.asarray(positions_array, dtype=np.int64)
+        if not len(positions_array):
+            return self.__chunks_list[0].iloc[:0]
+
+        # The positions are taken chunk by chunk, then the lines get back the order of the 'positions_array'
+        first_positions_array = np.cumsum([0] + [len(chunk_df) for chunk_df in self.__chunks_list])
+        chunk_numbers_array = np.searchsorted(first_positions_array, positions_array, side="right") - 1
+        order_array = np.argsort(chunk_numbers_array, kind="stable")
+        sorted_positions_array = positions_array[order_array]
+        sorted_chunk_numbers_array = chunk_numbers_array[order_array]
+        parts_list = []
+        for chunk_number in np.unique(sorted_chunk_numbers_array):
+            chunk_positions_array = sorted_positions_array[sorted_chunk_numbers_array == chunk_number]
+            parts_list.append(self.__chunks_list[chunk_number].take(chunk_positions_array - first_positions_array[chunk_number]))
+        dataframe = pd.concat(parts_list).take(np.argsort(order_array))
+        self.__setChangedValues(dataframe)
+        return dataframe
@@ -1,19 +1,36 @@
+import threading
+
 from common.raw_column import RawColumn
 
 
 class ColumnsInterface:
+    # The shared instance of each columns class (see 'getInstance')
+    __instances_dict = {}
+    __instances_lock = threading.Lock()
+
     def __init__(self) -> None:
         """Structure to define a group of columns to make easier handling Pandas dataframes.
         
         It is useful to help while formatting and applying NaN values in its cells.
+        
+        The columns do not change after they are defined: use 'getInstance' to share a single
+        instance of each columns class, instead of defining the columns again.
         """
         self.__columns_name_list = []
         self.__columns_type_list = []
         self.__columns_nan_list = []
         self.__raw_columns_list = []
+        self.__derived_inputs_dict = {}
+    
+    @classmethod
+    def getInstance(cls) -> "ColumnsInterface":
+        with ColumnsInterface.__instances_lock:
+            if cls not in ColumnsInterface.__instances_dict:
+                ColumnsInterface.__instances_dict[cls] = cls()
+            return ColumnsInterface.__instances_dict[cls]
     
-    def addRawColumn(self, column_name: str, column_type: str) -> RawColumn:
-        raw_column = RawColumn(column_name, column_type)
+    def addRawColumn(self, column_name: str, column_type: str, formula: str = "") -> RawColumn:
+        raw_column = RawColumn(column_name, column_type, formula)
         self.__columns_name_list.append(column_name)
         self.__columns_type_list.append(column_type)
         self.__columns_nan_list.append(self.getNanValueDict().get(column_type, ""))
@@ -40,7 +57,78 @@ class ColumnsInterface:
     
     def getRawColumnsDict(self) -> dict:
         return dict(zip(self.getColumnsNameList(), self.getRawColumnsList()))
+
+    def setDerivedColumnInputs(self, raw_column: RawColumn, inputs_list: list) -> None:
+        """Set the columns used to calculate a column without formula, such as the columns calculated by the kits."""
+        self.__derived_inputs_dict[raw_column.getName()] = list(inputs_list)
+
+    def getColumnInputsList(self, column_name: str) -> list:
+        """Return the columns used to calculate the column: its formula inputs or its derived inputs."""
+        raw_column = self.getRawColumnsDict().get(column_name)
+        inputs_list = raw_column.getFormulaInputsList() if raw_column is not None else []
+        return inputs_list + self.__derived_inputs_dict.get(column_name, [])
+
+    def getRequiredColumnsList(self, columns_list: list) -> list:
+        """Return the columns needed to get the 'columns_list', in the columns order.
+        
+        They are the columns of 'columns_list' and all the columns used to calculate them (directly
+        or through other calculated columns). Titles that are not columns of this object are ignored.
+        """
+        required_columns_set = set()
+        pending_columns_list = list(columns_list)
+        while pending_columns_list:
+            column = pending_columns_list.pop()
+            if column not in required_columns_set:
+                required_columns_set.add(column)
+                pending_columns_list.extend(self.getColumnInputsList(column))
+        return [column for column in self.__columns_name_list if column in required_columns_set]
     
+    def __addFormulaColumnToSortedList(
+        self,
+        raw_column: RawColumn,
+        sorted_columns_list: list,
+        visiting_columns_list: list,
+    ) -> None:
+        # Depth-first search: the formula inputs are added before the column itself
+        if raw_column in sorted_columns_list:
+            return
+        if raw_column in visiting_columns_list:
+            msg = "The formula of the column " + raw_column.getName() + " has a circular reference."
+            raise ValueError(msg)
+        visiting_columns_list.append(raw_column)
+        raw_columns_dict = self.getRawColumnsDict()
+        for input_column in raw_column.getFormulaInputsList():
+            input_raw_column = raw_columns_dict.get(input_column)
+            if input_raw_column is not None and input_raw_column.isFormulaColumn():
+                self.__addFormulaColumnToSortedList(input_raw_column, sorted_columns_list, visiting_columns_list)
+        visiting_columns_list.remove(raw_column)
+        sorted_columns_list.append(raw_column)
+
+    def getFormulaColumnsList(self, changed_columns: list = None) -> list:
+        """Return the 'RawColumn' objects with formula, sorted in the calculation order.
+        
+        A formula column always comes after the formula columns used in its formula.
+        
+        If 'changed_columns' is given, only the formula columns depending on them (directly
+        or through other formula columns) are returned.
+        """
+        sorted_columns_list = []
+        for raw_column in self.__raw_columns_list:
+            if raw_column.isFormulaColumn():
+                self.__addFormulaColumnToSortedList(raw_column, sorted_columns_list, [])
+
+        if changed_columns is None:
+            return sorted_columns_list
+
+        # The sorted list guarantees the inputs are checked before the dependent columns
+        affected_columns_set = set(changed_columns)
+        affected_columns_list = []
+        for raw_column in sorted_columns_list:
+            if affected_columns_set.intersection(raw_column.getFormulaInputsList()):
+                affected_columns_set.add(raw_column.getName())
+                affected_columns_list.append(raw_column)
+        return affected_columns_list
+
     def getNanValueDict(self) -> dict:
         nan_dict = {
             "string": "",
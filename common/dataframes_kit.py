@@ -1,12 +1,28 @@
+import copy
+import hashlib
+import itertools
+import re
+
 import pandas as pd
 import numpy as np
 
+from common.chunked_dataframe import ChunkedDataframe
 from common.columns import ColumnsInterface
+from common.fixed_point import FixedPointConverter
 from common.formatter import DataframesKitFormatter
+from common.inverted_index import InvertedIndex
+from common.lru_cache import SharedResultCache
+from common.sorted_date_index import SortedDateIndex
+from common.token_index import TokenIndex
 
 
 
 class DataframesKitInterface:
+    # Process-unique versions of the source dataframes that can not be hashed (see 'getDataframeFingerprint')
+    __source_versions_counter = itertools.count(1)
+    # The empty results of each kit class, calculated by its first instance (see '__setEmptyResults')
+    __empty_results_dict = {}
+
     def __init__(self, columns_object: ColumnsInterface) -> None:
         """Structure to handle different types of dataframes.
         
@@ -22,39 +38,274 @@ class DataframesKitInterface:
         """
         self.__columns_object = columns_object
         self.__kit_formatter = DataframesKitFormatter(self.__columns_object)
+        self.__raw_chunked_df = None
+        self.__fixed_point_converter = None
+        self.__required_columns_list = None
+        self.__projection_columns_tuple = None
+        self.__source_version = None
+        self.__updates_number = 0
+        self.__setEmptyResults()
+
+    def __setEmptyResults(self) -> None:
+        # All the kits of a class start with the same empty dataframes: they are calculated only once
+        # per process, so creating a kit costs nothing until its data is set
+        results_dict = DataframesKitInterface.__empty_results_dict.get(type(self))
+        if results_dict is None:
+            self._calculateEmptyResults()
+            results_dict = DataframesKitInterface.__empty_results_dict.setdefault(type(self), self._getResultsDict())
+        self._setResultsDict(results_dict)
+
+    @property
+    def _raw_df(self) -> pd.DataFrame:
+        # The appended lines are concatenated only when the whole raw dataframe is read (see '_appendRawLines')
+        return self.__raw_chunked_df.getDataframe()
+
+    @_raw_df.setter
+    def _raw_df(self, dataframe: pd.DataFrame) -> None:
+        self.__raw_chunked_df = ChunkedDataframe(dataframe)
+
+    def _calculateEmptyResults(self) -> None:
+        """Calculate the dataframes of the kit without lines. Subclasses add their calculated columns."""
         self._raw_df = pd.DataFrame(columns=self.__columns_object.getColumnsNameList())
         self.formatDataframes()
 
 
     def setDataframe(self, dataframe: pd.DataFrame) -> None:
-        self._raw_df = self.addColumnIfNotExists(dataframe)
+        self._setDatasetSource(dataframe)
+        if self._loadCachedResults():
+            return
+        self._raw_df = self.addColumnIfNotExists(self._getProjectedDataframe(dataframe))
         self.formatDataframes()
+        self._saveCachedResults()
+
+    @staticmethod
+    def getDataframeFingerprint(dataframe: pd.DataFrame) -> str:
+        """Return a hash of the 'dataframe' contents: its columns, types, index and values.
+        
+        The same contents (such as the dataframe kept in the Session State, in the next Streamlit reruns)
+        have the same fingerprint. Dataframes with values that can not be hashed get a new fingerprint.
+        """
+        try:
+            lines_hash_array = pd.util.hash_pandas_object(dataframe, index=True).to_numpy()
+        except TypeError:
+            return "unhashable_" + str(next(DataframesKitInterface.__source_versions_counter))
+        fingerprint = hashlib.sha1(lines_hash_array.tobytes())
+        fingerprint.update(repr([(str(column), str(dtype)) for column, dtype in dataframe.dtypes.items()]).encode())
+        return fingerprint.hexdigest()
+
+    def _setDatasetSource(self, dataframe: pd.DataFrame) -> None:
+        # The source version is the fingerprint of the contents: the given dataframe is not changed
+        self._setSourceVersion(DataframesKitInterface.getDataframeFingerprint(dataframe))
+
+    def _setSourceVersion(self, source_version: str) -> None:
+        """Set the version of the source dataframe, such as the one of an inner kit (see 'getSourceVersion')."""
+        self.__source_version = source_version
+        self.__updates_number = 0
+
+    def getSourceVersion(self) -> str:
+        """Return the fingerprint of the last dataframe set (see 'getDataframeFingerprint'), or None."""
+        return self.__source_version
+
+    def __getResultsKey(self) -> tuple:
+        # The results of 'setDataframe' depend on the source, the columns projection and the fixed-point mode
+        return ("kit_results", type(self).__name__, self.__source_version, self.__projection_columns_tuple, self.isFixedPointMode())
+
+    def _getResultsDict(self) -> dict:
+        """Return the attributes calculated by 'setDataframe', to be kept by '_saveCachedResults'.
+        
+        Subclasses add their own calculated attributes. The objects that the kit changes in place are copied.
+        """
+        return {
+            "raw_chunked_df": self.__raw_chunked_df,
+            "kit_formatter": copy.copy(self.__kit_formatter),
+            "updates_number": self.__updates_number,
+        }
 
+    def _setResultsDict(self, results_dict: dict) -> None:
+        """Restore the attributes returned by '_getResultsDict' (see '_loadCachedResults')."""
+        self.__raw_chunked_df = results_dict["raw_chunked_df"]
+        self.__kit_formatter = copy.copy(results_dict["kit_formatter"])
+        self.__updates_number = results_dict["updates_number"]
+
+    def _saveCachedResults(self) -> None:
+        SharedResultCache.getInstance().setValue(self.__getResultsKey(), self._getResultsDict())
+
+    def _loadCachedResults(self) -> bool:
+        """Restore the results of a previous 'setDataframe' of the same source, if they are still cached.
+        
+        The 'SharedResultCache' keeps them by the source fingerprint (see 'getDataframeFingerprint'). So, the kits
+        created in each Streamlit rerun for the dataframe kept in the Session State calculate it only once.
+        The cached dataframes are shared: the kits replace them, but never change them in place.
+        """
+        if self.__source_version is None:
+            return False
+        results_dict = SharedResultCache.getInstance().getValue(self.__getResultsKey())
+        if results_dict is None:
+            return False
+        self._setResultsDict(results_dict)
+        return True
+
+
+    def setColumnsProjection(self, columns_list: list = None) -> None:
+        """Set the columns needed by the kit user, such as the columns shown by a page.
+        
+        Only these columns and the columns used to calculate them (see 'ColumnsInterface.getRequiredColumnsList')
+        are kept in the raw dataframe and calculated. The not NaN dataframe has only the 'columns_list' columns.
+        It takes effect in the next 'setDataframe'. If 'columns_list' is None, all the columns are used.
+        """
+        if columns_list is None:
+            self.__required_columns_list = None
+            self.__projection_columns_tuple = None
+        else:
+            self.__required_columns_list = self.__columns_object.getRequiredColumnsList(columns_list)
+            self.__projection_columns_tuple = tuple(
+                column for column in self.__columns_object.getColumnsNameList() if column in columns_list
+            )
+        self.__kit_formatter.setDisplayedColumns(self.__projection_columns_tuple)
+
+    def getRequiredColumnsList(self) -> list:
+        """Return the columns kept in the raw dataframe (see 'setColumnsProjection')."""
+        if self.__required_columns_list is None:
+            return self.__columns_object.getColumnsNameList()
+        return self.__required_columns_list.copy()
+
+    def isColumnsProjection(self) -> bool:
+        return self.__required_columns_list is not None
+
+    def isRequiredColumn(self, column: str) -> bool:
+        return self.__required_columns_list is None or column in self.__required_columns_list
+
+    def _getProjectedDataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        # Only the required columns are taken: the other columns are never copied or calculated
+        # The result is always a new dataframe, so the given one (which may be shared) is never changed
+        if self.__required_columns_list is None:
+            return dataframe.copy()
+        return dataframe.reindex(columns=[column for column in self.__required_columns_list if column in dataframe.columns])
 
     def addColumnIfNotExists(self, dataframe) -> pd.DataFrame:
         # Create the column witn NaN values
-        for column, raw_column_obj in self.__columns_object.getRawColumnsDict().items():
+        for column in self.getRequiredColumnsList():
             if column not in dataframe.columns:
                 dataframe[column] = np.nan
         return dataframe
 
     def formatDataframes(self) -> None:
         self.__kit_formatter.formatDataframes(self._raw_df)
+        self.__updateDatasetVersion()
+
+    def __updateDatasetVersion(self) -> None:
+        # The not NaN dataframe changed: the indexes of the previous version are not used anymore
+        self.__updates_number += 1
+
+    def getDatasetVersion(self) -> tuple:
+        """Return the version of the kit dataframes, or None if no dataframe was set.
+        
+        The version identifies the source dataframe (by its contents), the kit and the updates
+        made since the source was set, such as appended lines. So, the same source calculated by the
+        same steps has the same version, even in different kit instances.
+        """
+        if self.__source_version is None:
+            return None
+        return (type(self).__name__, self.__source_version, self.isFixedPointMode(), self.__updates_number)
+
+    def __getIndex(self, index_class, columns_tuple: tuple):
+        # Each index is a separated entry of the 'SharedResultCache', sized when it is built: the kits
+        # of the same dataset version share it, and it is discarded with the other results by the memory limit
+        dataset_version = self.getDatasetVersion()
+        index_key = ("kit_index", index_class.__name__, dataset_version, self.__projection_columns_tuple, columns_tuple)
+        index_object = None if dataset_version is None else SharedResultCache.getInstance().getValue(index_key)
+        if index_object is None:
+            series_list = [self.__kit_formatter.getNotNanColumnSeries(column) for column in columns_tuple]
+            index_object = index_class(series_list) if index_class is TokenIndex else index_class(series_list[0])
+            if dataset_version is not None:
+                SharedResultCache.getInstance().setValue(index_key, index_object)
+        return index_object
+
+    def getInvertedIndex(self, column: str) -> InvertedIndex:
+        """Return the 'InvertedIndex' of a categorical column of the not NaN dataframe.
+        
+        It is built once per dataset version, when it is first requested, and kept in the 'SharedResultCache'.
+        Its positions are the line positions of the not NaN dataframe.
+        """
+        return self.__getIndex(InvertedIndex, (column,))
+
+    def getSortedDateIndex(self, column: str) -> SortedDateIndex:
+        """Return the 'SortedDateIndex' of a date column of the not NaN dataframe (see 'getInvertedIndex')."""
+        return self.__getIndex(SortedDateIndex, (column,))
+
+    def getTokenIndex(self, columns_list: list) -> TokenIndex:
+        """Return the 'TokenIndex' of text columns of the not NaN dataframe (see 'getInvertedIndex')."""
+        return self.__getIndex(TokenIndex, tuple(columns_list))
 
     def getRawDataframe(self) -> pd.DataFrame:
         return self._raw_df.copy()
-    
+
+    def _getRawLinesNumber(self) -> int:
+        return self.__raw_chunked_df.getLinesNumber()
+
+    def _getRawIndexMaximum(self):
+        """Return the maximum index value of the raw dataframe, or None if it has no lines."""
+        return self.__raw_chunked_df.getIndexMaximum()
+
+    def _getRawLines(self, lines_index: pd.Index) -> pd.DataFrame:
+        """Return a copy of the 'lines_index' lines of the raw dataframe, without concatenating the appended lines."""
+        return self.__raw_chunked_df.getLines(lines_index).copy()
+
+    def _appendRawLines(self, lines_df: pd.DataFrame, changed_lines_df: pd.DataFrame = None) -> None:
+        """Append the 'lines_df' lines to the raw dataframe and replace the 'changed_lines_df' lines already in it.
+        
+        Only these lines are formatted. The lines already kept are not copied: they are concatenated
+        with the new ones only when the whole dataframe is read (see 'ChunkedDataframe').
+        """
+        self.__raw_chunked_df = self.__raw_chunked_df.getUpdatedDataframe(lines_df, changed_lines_df)
+        self.__kit_formatter.appendDataframeLines(lines_df, changed_lines_df)
+        self.__updateDatasetVersion()
+
     def getNotNanDataframe(self) -> pd.DataFrame:
         return self.__kit_formatter.getNotNanDataframe()
+
+    def getNotNanDataframeLines(self, lines_index: pd.Index) -> pd.DataFrame:
+        return self.__kit_formatter.getNotNanDataframeLines(lines_index)
+
+    def getNotNanDataframeRows(self, positions_array: np.ndarray) -> pd.DataFrame:
+        """Return the lines of the not NaN dataframe in the 'positions_array' positions (row ids), such as filtered lines."""
+        return self.__kit_formatter.getNotNanDataframeRows(positions_array)
+
+    def getNotNanLinesNumber(self) -> int:
+        return self.__kit_formatter.getNotNanLinesNumber()
+
+    def getRawColumnSeries(self, column: str) -> pd.Series:
+        """Return a column of the raw dataframe, without copying the dataframe. The series must not be changed."""
+        return self._raw_df[column]
+
+    def getNotNanColumnSeries(self, column: str) -> pd.Series:
+        """Return a column of the not NaN dataframe, without copying the dataframe. The series must not be changed."""
+        return self.__kit_formatter.getNotNanColumnSeries(column)
     
-    def getFormattedDataframe(self) -> pd.DataFrame:
-        return self.__kit_formatter.getFormattedDataframe()
+    def getFormattedDataframe(self, dataframe: pd.DataFrame = None) -> pd.DataFrame:
+        """Return the not NaN dataframe (or the given lines and columns of it) formatted for visualization."""
+        return self.__kit_formatter.getFormattedDataframe(dataframe)
 
 
     def getColumnsObject(self) -> ColumnsInterface:
         return self.__columns_object
 
 
+    def setFixedPointMode(self, enabled: bool, decimal_places: int = 8) -> None:
+        """Enable/disable the fixed-point mode (see 'FixedPointConverter').
+        
+        In fixed-point mode, sums and comparisons of 'number' and '$' columns are calculated
+        with scaled integers. The results are converted back to floats in the raw dataframe.
+        """
+        self.__fixed_point_converter = FixedPointConverter(decimal_places) if enabled else None
+
+    def isFixedPointMode(self) -> bool:
+        return self.__fixed_point_converter is not None
+
+    def getFixedPointConverter(self) -> FixedPointConverter:
+        return self.__fixed_point_converter
+
+
     def getNonDuplicatedListFromColumn(self, target_col: str, dropna=True, sorted=True) -> list:
         """Return a non-duplicated values list from a given column."""
         df_column = self._raw_df[[target_col]].copy()
@@ -72,45 +323,71 @@ class DataframesKitInterface:
         return df_column_list
 
 
-    def subtractTwoColumns(self, col_A: str, col_B: str, result_col: str) -> None:
-        """Subtract the 'col_A' and 'col_B' to put the result in the 'result_col'."""
-        self._raw_df[result_col] = self._raw_df[col_A] - self._raw_df[col_B]
-
-    def sumTwoColumns(self, col_A: str, col_B: str, result_col: str) -> None:
-        """Sum the 'col_A' and 'col_B' to put the result in the 'result_col'."""
-        self._raw_df[result_col] = self._raw_df[col_A] + self._raw_df[col_B]
+    def __getColumnAlias(self, column: str, alias_dict: dict) -> str:
+        return alias_dict.setdefault(column, "column_" + str(len(alias_dict)))
 
-    def multiplyTwoColumns(self, col_A: str, col_B: str, result_col: str) -> None:
-        """Multiply the 'col_A' and 'col_B' to put the result in the 'result_col'."""
-        self._raw_df[result_col] = self._raw_df[col_A] * self._raw_df[col_B]
+    def __getNumericColumnValues(self, dataframe: pd.DataFrame, column: str) -> pd.Series:
+        # Numeric columns with 'object' type (e.g. empty dataframes) are converted to numbers
+        column_values = dataframe[column]
+        column_type = self.__columns_object.getColumnsTypeDict().get(column)
+        if column_values.dtype == object and column_type in ["number", "$", "%"]:
+            return pd.to_numeric(column_values, errors="coerce")
+        return column_values
 
-    def divideTwoColumns(self, col_A: str, col_B: str, result_col: str) -> None:
-        """Divide the 'col_A' per the 'col_B' and put the result in the 'result_col'."""
-        self._raw_df[result_col] = self._raw_df[col_A].div(
-            self._raw_df[col_B].where(self._raw_df[col_B] != 0, np.nan)
-        )
+    def __calculateFormulaColumnsInDataframe(self, dataframe: pd.DataFrame, changed_columns: list = None) -> None:
+        formula_columns_list = [
+            raw_column for raw_column in self.__columns_object.getFormulaColumnsList(changed_columns)
+            if self.isRequiredColumn(raw_column.getName())
+        ]
+        if not formula_columns_list:
+            return
+        
+        # The 'eval' expressions need valid Python names: each column gets an alias
+        alias_dict = {}
+        expression_list = []
+        for raw_column in formula_columns_list:
+            expression = re.sub(
+                r"`([^`]+)`",
+                lambda column_match: self.__getColumnAlias(column_match.group(1), alias_dict),
+                raw_column.getFormula(),
+            )
+            result_alias = self.__getColumnAlias(raw_column.getName(), alias_dict)
+            expression_list.append(result_alias + " = " + expression)
 
+        # Only the formula inputs are copied to the evaluation dataframe
+        formula_columns_set = {raw_column.getName() for raw_column in formula_columns_list}
+        eval_inputs_dict = {
+            alias: self.__getNumericColumnValues(dataframe, column)
+            for column, alias in alias_dict.items() if column not in formula_columns_set
+        }
+        eval_df = pd.DataFrame(eval_inputs_dict, index=dataframe.index)
+        eval_df.eval("\n".join(expression_list), inplace=True)
 
-    def copyColumnToColumn(self, target_col: str, result_col: str) -> None:
-        """Copy the 'target_col' data to the 'result_col'."""
-        self._raw_df[result_col] = self._raw_df[target_col]
+        for raw_column in formula_columns_list:
+            result_values = eval_df[alias_dict[raw_column.getName()]]
+            dataframe[raw_column.getName()] = result_values.replace([np.inf, -np.inf], np.nan)
 
-    def replaceAllValuesInColumnExcept(self, target_col: str, target_val, except_col: str, except_val) -> None:
-        """Put the 'target_val' in all cells of the 'target_col'.
+    def calculateFormulaColumns(self, changed_columns: list = None) -> None:
+        """Calculate the formula columns defined in the 'columns_object' in a single 'eval' pass.
+        
+        The formulas are evaluated in the dependency order (see 'ColumnsInterface.getFormulaColumnsList').
+        Results of divisions by zero are replaced by NaN.
         
-        The exception case occurrs in the line when the 'except_val' is found in the 'except_col'.
+        If 'changed_columns' is given, only the formula columns depending on them are calculated.
         """
-        self._raw_df[target_col] = self._raw_df[target_col].where(
-            self._raw_df[except_col] == except_val, target_val
-        )
+        self.__calculateFormulaColumnsInDataframe(self._raw_df, changed_columns)
 
+    def getCalculatedDataframe(self, dataframe: pd.DataFrame, changed_columns: list = None) -> pd.DataFrame:
+        """Return a copy of the 'dataframe' with the formula columns calculated.
+        
+        The kit dataframes are not changed. It is useful to calculate lines that are not part of the
+        raw dataframe yet, such as chunks of a file.
+        """
+        dataframe = self.addColumnIfNotExists(self._getProjectedDataframe(dataframe))
+        self.__calculateFormulaColumnsInDataframe(dataframe, changed_columns)
+        return dataframe
 
-    def appendNewDataLine(self, data_list: list, column_name_list: list) -> None:
-        """Insert a new data line given the column name and data lists."""
-        data_list = [[data] for data in data_list]
-        df = pd.DataFrame.from_dict(dict(zip(column_name_list, data_list)))
-        self._raw_df = pd.concat([self._raw_df, df])
 
     def resetDataframeIndex(self):
         """Reset the index of the dataframe."""
-        self._raw_df.reset_index(drop=True, inplace=True)
+        self._raw_df = self._raw_df.reset_index(drop=True)
@@ -0,0 +1,26 @@
+class FacetSelection:
+    def __init__(self, session_state, key: str) -> None:
+        """Structure used to keep the selection of a facet widget (see 'FacetSelector') in a Session State.
+
+        The selection is given back only while its values are still options of the widget. Each Side Bar
+        key prefix has its own selections: a page using its own prefix (such as "history_side_bar") does
+        not take the selections made in the other pages.
+
+        Args:
+        - session_state: the Streamlit Session State, or any 'dict' used in the same way
+        - key (str): Session State key of the selection
+        """
+        self.__session_state = session_state
+        self.__key = key
+
+    def getSelectedOption(self, options_list: list, all_option):
+        """Return the kept option, or the 'all_option' (such as "Exibir todos") when it is not an option anymore."""
+        selected_option = self.__session_state.get(self.__key, all_option)
+        return selected_option if selected_option in options_list else all_option
+
+    def getSelectedList(self, options_list: list) -> list:
+        """Return the kept values that are still options."""
+        return [value for value in self.__session_state.get(self.__key, []) if value in options_list]
+
+    def setSelection(self, selection) -> None:
+        self.__session_state[self.__key] = selection
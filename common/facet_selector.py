@@ -0,0 +1,51 @@
+import streamlit as st
+
+from common.facet_selection import FacetSelection
+
+
+class FacetSelector:
+    def __init__(self, key: str) -> None:
+        """Structure used to show a Side Bar widget to select values of a filter column, with their number of lines.
+
+        The options are the raw values of the column; the labels show their number of lines, such as
+        "PETR4 (37)" (see 'FilterInterface.getFacetsDict'). The numbers change with the other filters,
+        and Streamlit creates the widget again (with its default value) when its options or labels change.
+        So, the selection is also kept in the Session State and given back as the default value: it is
+        kept while its values are still options (see 'FacetSelection').
+
+        Args:
+        - key (str): unique name of the widget, used as Session State key
+        """
+        self.__key = key
+        self.__selection = FacetSelection(st.session_state, key + "_selection")
+
+    def __getLabel(self, value, facets_dict: dict) -> str:
+        # Values with number of lines, such as "PETR4 (37)"; the "Exibir ..." options have no number
+        return str(value) + " (" + str(facets_dict[value]) + ")" if value in facets_dict else str(value)
+
+    def showSelectbox(self, label: str, facets_dict: dict, all_option: str):
+        """Show a 'selectbox' with the 'all_option' (such as "Exibir todos") and the facets, returning the selected option."""
+        options_list = [all_option] + list(facets_dict)
+        selected_option = self.__selection.getSelectedOption(options_list, all_option)
+        selected_option = st.sidebar.selectbox(
+            label,
+            options_list,
+            index=options_list.index(selected_option),
+            format_func=lambda value: self.__getLabel(value, facets_dict),
+            key=self.__key,
+        )
+        self.__selection.setSelection(selected_option)
+        return selected_option
+
+    def showMultiselect(self, label: str, facets_dict: dict) -> list:
+        """Show a 'multiselect' with the facets, returning the selected values."""
+        options_list = list(facets_dict)
+        selected_list = st.sidebar.multiselect(
+            label,
+            options_list,
+            default=self.__selection.getSelectedList(options_list),
+            format_func=lambda value: self.__getLabel(value, facets_dict),
+            key=self.__key,
+        )
+        self.__selection.setSelection(selected_list)
+        return selected_list
@@ -1,16 +1,34 @@
+import numpy as np
 import pandas as pd
 
+from common.lru_cache import LRUCache
+from common.token_index import TokenIndex
+
 from extrato.lib.extrato_columns import ExtratoColumns
 from extrato.lib.extrato_dataframes_kit import ExtratoKit
 
 
 class FilterInterface:
+    # Row ids of the filter chains recently applied, shared by all filters of the process
+    __chain_cache = LRUCache(16)
+    # Facets of the filter chains recently applied (see 'getFacetsDict')
+    __facets_cache = LRUCache(64)
+
     def __init__(self, df_interface_object: ExtratoKit, columns_object: ExtratoColumns) -> None:
         """Structure to apply filters to different types of ExtratoDataframesKitInterface objects.
                 
         The main outputs of this class are:
         - filtered dataframe
-        - filtered formatted dataframe
+        - filtered formatted dataframe, built only when it is requested
+        
+        The filters do not copy the dataframe: each filter keeps, from the row ids (positions) of the
+        lines still selected, only the ones matching its predicate. The predicates are evaluated only
+        in the selected lines, and the filtered dataframe is taken from the row ids once, when it is
+        requested.
+        
+        The row ids of each filter chain prefix are memoized by the dataset version and the filters
+        applied so far. So, when only the last filter changes (such as the period slider), the previous
+        filters are not applied again.
         
         This class is very useful to work together with 'SideBar' classes.
         
@@ -23,27 +41,150 @@ class FilterInterface:
         self._updateMainDataframes()
     
     def _updateMainDataframes(self) -> None:
-        self._filtered_df = self.__df_interface_object.getNotNanDataframe()
-        self._filtered_fmtdf = self.__df_interface_object.getFormattedDataframe()
+        # Only the row ids are kept: the lines are read from the kit when they are requested
+        self.__lines_number = self.__df_interface_object.getNotNanLinesNumber()
+        self.__rows_array = np.arange(self.__lines_number)
+        self.__filtered_df = None
+        dataset_version = self.__df_interface_object.getDatasetVersion()
+        self.__chain_key = None if dataset_version is None else (type(self).__name__, dataset_version)
+
+    def __applyChainStep(self, step_key: tuple, apply_function) -> None:
+        # The filter chain key gets the new step: its row ids are taken from the cache or calculated
+        # Chains with steps that can not be identified (see '_applyMask') are not cached
+        self.__chain_key = None if self.__chain_key is None else self.__chain_key + (step_key,)
+        rows_array = None if self.__chain_key is None else FilterInterface.__chain_cache.getValue(self.__chain_key)
+        if rows_array is None:
+            apply_function()
+            if self.__chain_key is not None:
+                FilterInterface.__chain_cache.setValue(self.__chain_key, self.__rows_array)
+        else:
+            self.__rows_array = rows_array
+            self.__filtered_df = None
+
+    def _applyMask(self, mask) -> None:
+        """Keep only the selected lines where the 'mask' (aligned to 'getColumnSeries') is True."""
+        self.__rows_array = self.__rows_array[np.asarray(mask, dtype=bool)]
+        self.__filtered_df = None
+        self.__chain_key = None
+
+    def _applyPositions(self, positions_array: np.ndarray) -> None:
+        """Keep only the selected lines whose row ids are in the sorted 'positions_array'."""
+        if len(self.__rows_array) == self.__lines_number:
+            self.__rows_array = positions_array
+        else:
+            self.__rows_array = np.intersect1d(self.__rows_array, positions_array, assume_unique=True)
+        self.__filtered_df = None
+
+    def getColumnSeries(self, column: str) -> pd.Series:
+        """Return the values of the 'column' in the selected lines, without taking the other columns."""
+        return self.__df_interface_object.getNotNanColumnSeries(column).take(self.__rows_array)
+
+    def getRowsArray(self) -> np.ndarray:
+        """Return the row ids (positions in the not NaN dataframe) of the selected lines."""
+        return self.__rows_array.copy()
+
+    def getLinesNumber(self) -> int:
+        """Return the number of selected lines."""
+        return len(self.__rows_array)
+
+    def getSelectedLines(self, positions_array: np.ndarray) -> pd.DataFrame:
+        """Return the selected lines in the 'positions_array' positions (such as the lines of a page), without taking the others."""
+        return self.__df_interface_object.getNotNanDataframeRows(self.__rows_array[positions_array])
+
+    def isEmpty(self) -> bool:
+        return len(self.__rows_array) == 0
+
+    def getFilteredVersion(self) -> tuple:
+        """Return a version of the selected lines, such as the version of a 'TableView', or None if no dataframe was set.
+        
+        It is the filter chain key (the dataset version and the filters applied). Chains with steps that
+        can not be identified (see '_applyMask') use the row ids instead.
+        """
+        if self.__chain_key is not None:
+            return self.__chain_key
+        dataset_version = self.__df_interface_object.getDatasetVersion()
+        if dataset_version is None:
+            return None
+        return (type(self).__name__, dataset_version, hash(self.__rows_array.tobytes()))
+    
+    def applyCategoryFilter(self, column: str, values_list: list) -> None:
+        """Keep only the selected lines with any of the 'values_list' in the categorical 'column'.
+        
+        The lines are found by the 'InvertedIndex' of the column (see 'DataframesKitInterface.getInvertedIndex').
+        """
+        self.__applyChainStep(
+            ("category", column, tuple(values_list)),
+            lambda: self._applyPositions(self.__df_interface_object.getInvertedIndex(column).getPositionsArray(values_list)),
+        )
+    
+    def applyDateRangeFilter(self, column: str, start_date=None, end_date=None) -> None:
+        """Keep only the selected lines with 'start_date <= column <= end_date'.
+        
+        The lines are found by binary search in the 'SortedDateIndex' of the column
+        (see 'DataframesKitInterface.getSortedDateIndex'). A None bound does not limit the period.
+        """
+        self.__applyChainStep(
+            ("date", column, start_date, end_date),
+            lambda: self._applyPositions(self.__df_interface_object.getSortedDateIndex(column).getPositionsArray(start_date, end_date)),
+        )
+
+    def applyTextSearchFilter(self, columns_list: list, query: str) -> None:
+        """Keep only the selected lines with all the words of the 'query' in the text columns of 'columns_list'.
+        
+        The lines are found by the 'TokenIndex' of the columns (see 'DataframesKitInterface.getTokenIndex').
+        A query without words does not filter the lines.
+        """
+        # The query words are the chain step: the index is searched only if its row ids are not cached
+        words_list = TokenIndex.getTokensList(query)
+        if words_list:
+            self.__applyChainStep(
+                ("search", tuple(columns_list), tuple(words_list)),
+                lambda: self._applyPositions(self.__df_interface_object.getTokenIndex(columns_list).getPositionsArray(query)),
+            )
+
+    def getFacetsDict(self, column: str) -> dict:
+        """Return the distinct values of the categorical 'column' in the selected lines, sorted, with their number of lines.
+        
+        The facets are counted in a single pass of the 'InvertedIndex' codes, and memoized by the
+        dataset version and the filters applied so far.
+        """
+        facets_key = None if self.__chain_key is None else (self.__chain_key, column)
+        facets_dict = None if facets_key is None else FilterInterface.__facets_cache.getValue(facets_key)
+        if facets_dict is None:
+            inverted_index = self.__df_interface_object.getInvertedIndex(column)
+            if len(self.__rows_array) == self.__lines_number:
+                facets_dict = inverted_index.getCountsDict()
+            else:
+                facets_dict = inverted_index.getCountsDict(self.__rows_array)
+            if facets_key is not None:
+                FilterInterface.__facets_cache.setValue(facets_key, facets_dict)
+        return facets_dict.copy()
+
+    def getDateBounds(self, column: str) -> tuple:
+        """Return the first and last dates of the 'column' in the selected lines, such as the slider bounds."""
+        date_index = self.__df_interface_object.getSortedDateIndex(column)
+        if len(self.__rows_array) == self.__lines_number:
+            return date_index.getBounds()
+        return date_index.getBounds(self.__rows_array)
     
     def applyMarketFilter(self, market_list: list) -> None:
         column = self.__columns_object._market_col.getName()
         if market_list:
-            self._filtered_df = self._filtered_df.loc[self._filtered_df[column].isin(market_list)]
-            self._filtered_fmtdf = self._filtered_fmtdf.loc[self._filtered_fmtdf[column].isin(market_list)]
+            self.applyCategoryFilter(column, market_list)
     
     def applyTickerFilter(self, ticker: str) -> None:
         column = self.__columns_object._ticker_col.getName()
         if ticker != "Exibir todos":
-            self._filtered_df = self._filtered_df.loc[self._filtered_df[column] == ticker]
-            self._filtered_fmtdf = self._filtered_fmtdf.loc[self._filtered_fmtdf[column] == ticker]
+            self.applyCategoryFilter(column, [ticker])
 
     def updateDataframe(self, dataframe: pd.DataFrame) -> None:
         self.__df_interface_object.setDataframe(dataframe)
         self._updateMainDataframes()
 
     def getDataframe(self) -> pd.DataFrame:
-        return self._filtered_df.copy()
+        if self.__filtered_df is None:
+            self.__filtered_df = self.__df_interface_object.getNotNanDataframeRows(self.__rows_array)
+        return self.__filtered_df.copy()
     
     def getFormattedDataframe(self) -> pd.DataFrame:
-        return self._filtered_fmtdf.copy()
+        return self.__df_interface_object.getFormattedDataframe(self.getDataframe())
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+
+class FixedPointConverter:
+    def __init__(self, decimal_places: int = 8) -> None:
+        """Structure used to represent 'number' and '$' values as scaled integers.
+        
+        Fractional quantities (such as Treasury Bonds and crypto) accumulate rounding errors
+        when summed as floats, so comparisons like 'buy_quantity == sell_quantity' may fail.
+        The scaled 'int64' values are exact for sums and comparisons, and still vectorized.
+        
+        Args:
+        - decimal_places (int): number of decimal places kept by the scaled integers
+        """
+        self.__decimal_places = decimal_places
+        self.__scale = 10 ** decimal_places
+
+    def isFixedPointType(self, column_type: str) -> bool:
+        return column_type in ["number", "$"]
+
+    def getFixedPointSeries(self, series: pd.Series) -> pd.Series:
+        """Return the values as scaled 'int64', where NaN values are replaced by zero.
+        
+        The 'int64' values (and their sums) wrap around silently above 2**63, such as values above 9.2e10
+        with 8 decimal places. So, a ValueError is raised when the sum of the absolute scaled values (the
+        largest sum of any of its lines) is not below 2**62, or when there are infinite values.
+        """
+        float_values = pd.to_numeric(series, errors="coerce").fillna(0.0).astype(float).to_numpy()
+        scaled_values = float_values * self.__scale
+        if not self.isInt64Range(scaled_values):
+            raise ValueError(
+                "The values of '" + str(series.name) + "' are too large for the fixed-point mode with "
+                + str(self.__decimal_places) + " decimal places: use fewer decimal places or disable the fixed-point mode."
+            )
+        return pd.Series(np.round(scaled_values).astype(np.int64), index=series.index)
+
+    @staticmethod
+    def isInt64Range(scaled_values: np.ndarray) -> bool:
+        """Check if the scaled values, and any sum of them, can be represented as 'int64' (infinite values can not).
+        
+        The limit is 2**62 (half of the 'int64' range), so the rounding errors of the float sum are covered.
+        """
+        return bool(np.abs(scaled_values).sum() < 2.0 ** 62)
+
+    def getFloatSeries(self, series: pd.Series) -> pd.Series:
+        """Return the scaled 'int64' values as floats."""
+        return series / self.__scale
+
+    def getFloatValue(self, value: int) -> float:
+        """Return a single scaled integer value as float."""
+        return float(value) / float(self.__scale)
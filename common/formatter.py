@@ -1,30 +1,137 @@
-import locale
-
+import numpy as np
 import pandas as pd
 
+from common.chunked_dataframe import ChunkedDataframe
 from common.columns import ColumnsInterface
 
 
 class SingleFormatter:
     def __init__(self) -> None:
-        """Structure used to format values to perform 'nice visualization'."""
-        self.__setFormatterLocalParameters()
+        """Structure used to format values to perform 'nice visualization'.
+        
+        The values are formatted with the Brazilian Portuguese (pt-BR) conventions, as 'locale.currency'
+        and 'locale.str' do with the 'pt_BR.UTF-8' locale, but without depending on the system locale.
+        """
+        self.__currency_symbol = "R$"
+        self.__thousands_separator = "."
+        self.__decimal_point = ","
 
-    def __setFormatterLocalParameters(self) -> None:
-        locale.setlocale(locale.LC_ALL, "pt_BR.UTF-8")
+    def __getGroupedString(self, integer_string: str) -> str:
+        # Thousands separator every 3 digits, from right to left
+        groups_list = []
+        while len(integer_string) > 3:
+            groups_list.insert(0, integer_string[-3:])
+            integer_string = integer_string[:-3]
+        groups_list.insert(0, integer_string)
+        return self.__thousands_separator.join(groups_list)
 
     def getMoneyString(self, value: str) -> str:
         try:
-            return locale.currency(float(value), grouping=True)
+            float_value = float(value)
         except ValueError:
             if value == "":
-                return locale.currency(0.0, grouping=True)
+                float_value = 0.0
+            else:
+                return None
+        value_string = f"{abs(float_value):.2f}"
+        if "." in value_string:
+            integer_string, decimal_string = value_string.split(".")
+            value_string = self.__getGroupedString(integer_string) + self.__decimal_point + decimal_string
+        sign_string = "-" if float_value < 0 else ""
+        return sign_string + self.__currency_symbol + " " + value_string
     
     def getPercentageString(self, value: str) -> str:
         return '{:.2%}'.format(value) if (value != "") else ""
     
     def getNumberString(self, value: str) -> str:
-        return locale.str(value)
+        return ("%.12g" % value).replace(".", self.__decimal_point)
+
+
+class SeriesFormatter:
+    def __init__(self) -> None:
+        """Structure used to format whole columns with the same strings of 'SingleFormatter'.
+        
+        Finite values are rounded to integer cents with NumPy and the strings are built from lookup
+        tables of digit groups, column by column. The 'SingleFormatter' is used only for the values
+        that can not be formatted this way exactly: NaN, infinite, huge or non-numeric values, and
+        values too close to the half cent, where the rounding of the cents could differ.
+        """
+        self.__single_formatter = SingleFormatter()
+        self.__max_cents = 1e12
+        self.__half_cent_tolerance = 1e-3
+        self.__plain_group_array = np.array([str(group) for group in range(1000)], dtype=object)
+        self.__padded_group_array = np.array(["%03d" % group for group in range(1000)], dtype=object)
+        self.__money_cents_array = np.array([",%02d" % cents for cents in range(100)], dtype=object)
+        self.__percentage_cents_array = np.array([".%02d%%" % cents for cents in range(100)], dtype=object)
+
+    def __getCentsArrays(self, values: np.ndarray) -> tuple:
+        # Return the absolute values as integer cents, and the mask of the values that can use them
+        with np.errstate(invalid="ignore", over="ignore"):
+            scaled_values = np.abs(values) * 100
+            fraction = scaled_values - np.floor(scaled_values)
+            fast_mask = (scaled_values < self.__max_cents) & (np.abs(fraction - 0.5) > self.__half_cent_tolerance)
+        cents = np.rint(np.where(fast_mask, scaled_values, 0)).astype(np.int64)
+        return cents, fast_mask
+
+    def __getGroupedArray(self, integer_values: np.ndarray, separator: str) -> np.ndarray:
+        # Groups of 3 digits (from right to left) joined by the 'separator'
+        remaining_values = integer_values // 1000
+        grouped_array = np.where(
+            remaining_values > 0,
+            self.__padded_group_array[integer_values % 1000],
+            self.__plain_group_array[integer_values % 1000],
+        )
+        active_mask = remaining_values > 0
+        while active_mask.any():
+            group_values = remaining_values[active_mask] % 1000
+            next_values = remaining_values[active_mask] // 1000
+            group_array = np.where(
+                next_values > 0, self.__padded_group_array[group_values], self.__plain_group_array[group_values]
+            )
+            grouped_array[active_mask] = group_array + separator + grouped_array[active_mask]
+            remaining_values[active_mask] = next_values
+            active_mask = remaining_values > 0
+        return grouped_array
+
+    def __getNumericValues(self, series: pd.Series) -> np.ndarray:
+        return pd.to_numeric(series, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+    def __getFormattedSeries(self, series: pd.Series, strings_array: np.ndarray, fast_mask: np.ndarray, format_function) -> pd.Series:
+        # The lines out of the 'fast_mask' are formatted one by one
+        result_array = np.empty(len(series), dtype=object)
+        result_array[fast_mask] = strings_array
+        original_values = series.to_numpy(dtype=object)
+        result_array[~fast_mask] = [format_function(value) for value in original_values[~fast_mask]]
+        return pd.Series(result_array, index=series.index, dtype=object)
+
+    def getMoneySeries(self, series: pd.Series) -> pd.Series:
+        values = self.__getNumericValues(series)
+        cents, fast_mask = self.__getCentsArrays(values)
+        cents = cents[fast_mask]
+        strings_array = "R$ " + self.__getGroupedArray(cents // 100, ".") + self.__money_cents_array[cents % 100]
+        negative_mask = values[fast_mask] < 0
+        strings_array[negative_mask] = "-" + strings_array[negative_mask]
+        return self.__getFormattedSeries(series, strings_array, fast_mask, self.__single_formatter.getMoneyString)
+
+    def getPercentageSeries(self, series: pd.Series) -> pd.Series:
+        # The same steps of '{:.2%}': multiply by 100 and keep the sign, including the negative zero
+        percentage_values = self.__getNumericValues(series) * 100
+        cents, fast_mask = self.__getCentsArrays(percentage_values)
+        cents = cents[fast_mask]
+        strings_array = self.__getGroupedArray(cents // 100, "") + self.__percentage_cents_array[cents % 100]
+        negative_mask = np.signbit(percentage_values[fast_mask])
+        strings_array[negative_mask] = "-" + strings_array[negative_mask]
+        return self.__getFormattedSeries(series, strings_array, fast_mask, self.__single_formatter.getPercentageString)
+
+    def getNumberSeries(self, series: pd.Series) -> pd.Series:
+        # Integer values with up to 12 digits are written without decimal places by '%.12g'
+        values = self.__getNumericValues(series)
+        with np.errstate(invalid="ignore"):
+            fast_mask = (np.abs(values) < 1e12) & (values == np.trunc(values)) & ~((values == 0) & np.signbit(values))
+        strings_array = self.__getGroupedArray(np.abs(values[fast_mask]).astype(np.int64), "")
+        negative_mask = values[fast_mask] < 0
+        strings_array[negative_mask] = "-" + strings_array[negative_mask]
+        return self.__getFormattedSeries(series, strings_array, fast_mask, self.__single_formatter.getNumberString)
 
 
 class DataframesKitFormatter:
@@ -37,28 +144,37 @@ class DataframesKitFormatter:
         - numbers
         
         Besides that, this class defines the 'columns order' when displaying dataframes.
+        
+        Only the not NaN dataframe is kept: the formatted strings are built at display time, just for
+        the lines and columns being displayed. It is set by 'formatDataframes'.
         """
         self.__columns_object = columns_object
-        self.__formatter = SingleFormatter()
-        self.formatDataframes(self.__getRawDataframe(pd.DataFrame(columns=self.__columns_object.getColumnsNameList())))
+        self.__formatter = SeriesFormatter()
+        self.__displayed_columns_list = None
+        self.__not_nan_df = None
 
-    def __getRawDataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        return self.__defineDisplayedColumns(dataframe)
+    def setDisplayedColumns(self, columns_list: list = None) -> None:
+        """Set the columns of the not NaN dataframe (all the columns of the 'columns_object' if None)."""
+        self.__displayed_columns_list = None if columns_list is None else list(columns_list)
 
     def __defineDisplayedColumns(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         # There are cases the User spreadsheet has a lot more columns than expected
         # We want to display only the target columns in the defined order
-        return dataframe[self.__columns_object.getColumnsNameList()].copy()
+        if self.__displayed_columns_list is None:
+            return dataframe[self.__columns_object.getColumnsNameList()].copy()
+        return dataframe[self.__displayed_columns_list].copy()
 
     def __setupDateColumns(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        for column, type_value in self.__columns_object.getColumnsTypeDict().items():
-            if self.__columns_object.isDateType(type_value):
+        columns_type_dict = self.__columns_object.getColumnsTypeDict()
+        for column in dataframe.columns:
+            if self.__columns_object.isDateType(columns_type_dict.get(column)):
                 dataframe[column] = pd.to_datetime(dataframe[column]).dt.date
         return dataframe
     
     def __setupNanColumns(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        for column, nan_value in self.__columns_object.getColumnsNanDict().items():
-            dataframe[column] = dataframe[column].fillna(nan_value)
+        columns_nan_dict = self.__columns_object.getColumnsNanDict()
+        for column in dataframe.columns:
+            dataframe[column] = dataframe[column].fillna(columns_nan_dict[column])
         return dataframe
 
     def __getNotNanDataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -70,21 +186,51 @@ class DataframesKitFormatter:
     def __getFormattedDataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         df = dataframe.copy()
         if not df.empty:
-            for column, type_value in self.__columns_object.getColumnsTypeDict().items():
+            columns_type_dict = self.__columns_object.getColumnsTypeDict()
+            for column in df.columns:
+                type_value = columns_type_dict.get(column)
                 if self.__columns_object.isCurrencyType(type_value):
-                    df[column] = df[column].apply(self.__formatter.getMoneyString)
+                    df[column] = self.__formatter.getMoneySeries(df[column])
                 elif self.__columns_object.isPercentageType(type_value):
-                    df[column] = df[column].apply(self.__formatter.getPercentageString)
+                    df[column] = self.__formatter.getPercentageSeries(df[column])
                 elif self.__columns_object.isNumberType(type_value):
-                    df[column] = df[column].apply(self.__formatter.getNumberString)
+                    df[column] = self.__formatter.getNumberSeries(df[column])
         return df
 
     def formatDataframes(self, raw_dataframe) -> None:
-        self.__not_nan_df = self.__getNotNanDataframe(raw_dataframe)
-        self.__formatted_df = self.__getFormattedDataframe(self.__not_nan_df)
+        self.__not_nan_df = ChunkedDataframe(self.__getNotNanDataframe(raw_dataframe))
+
+    def appendDataframeLines(self, raw_lines_df: pd.DataFrame, raw_changed_lines_df: pd.DataFrame = None) -> None:
+        """Append the 'raw_lines_df' lines and replace the 'raw_changed_lines_df' lines, formatting only them.
+        
+        The not NaN lines already kept are not copied (the dataframe may be shared by other kits).
+        """
+        changed_lines_df = None
+        if raw_changed_lines_df is not None and len(raw_changed_lines_df):
+            changed_lines_df = self.__getNotNanDataframe(raw_changed_lines_df)
+        self.__not_nan_df = self.__not_nan_df.getUpdatedDataframe(self.__getNotNanDataframe(raw_lines_df), changed_lines_df)
 
     def getNotNanDataframe(self) -> pd.DataFrame:
-        return self.__not_nan_df.copy()
+        return self.__not_nan_df.getDataframe().copy()
+
+    def getNotNanColumnSeries(self, column: str) -> pd.Series:
+        return self.__not_nan_df.getDataframe()[column]
+
+    def getNotNanDataframeLines(self, lines_index: pd.Index) -> pd.DataFrame:
+        return self.__not_nan_df.getLines(lines_index)
+
+    def getNotNanDataframeRows(self, positions_array: np.ndarray) -> pd.DataFrame:
+        return self.__not_nan_df.getRows(positions_array)
+
+    def getNotNanLinesNumber(self) -> int:
+        return self.__not_nan_df.getLinesNumber()
     
-    def getFormattedDataframe(self) -> pd.DataFrame:
-        return self.__formatted_df.copy()
+    def getFormattedDataframe(self, dataframe: pd.DataFrame = None) -> pd.DataFrame:
+        """Return the not NaN dataframe formatted for visualization.
+        
+        If 'dataframe' is given, it is formatted instead: any lines and columns of the not NaN dataframe,
+        such as the filtered lines and the displayed columns.
+        """
+        if dataframe is None:
+            dataframe = self.__not_nan_df.getDataframe()
+        return self.__getFormattedDataframe(dataframe)
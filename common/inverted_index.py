@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+
+class InvertedIndex:
+    def __init__(self, series: pd.Series) -> None:
+        """Structure to find the lines of a categorical column (such as 'Ticker') by their values.
+
+        Each value of the 'series' is mapped to the sorted array of its line positions, so the lines
+        of a value are found without scanning the column. The values are also kept as integer codes
+        (the value order), so the number of lines of each value in any group of lines is counted in
+        a single pass.
+
+        Args:
+        - series: the column values, in the lines order
+        """
+        self.__codes_array, values_array = pd.factorize(series.to_numpy(), sort=True)
+        self.__values_list = list(values_array)
+        self.__counts_array = np.bincount(self.__codes_array[self.__codes_array >= 0], minlength=len(self.__values_list))
+
+        # The stable sort keeps the positions of each value sorted; NaN values (code -1) come first
+        order_array = np.argsort(self.__codes_array, kind="stable")
+        end_array = np.cumsum(self.__counts_array) + np.count_nonzero(self.__codes_array < 0)
+        self.__positions_dict = {
+            value: order_array[end - count:end]
+            for value, count, end in zip(self.__values_list, self.__counts_array.tolist(), end_array.tolist())
+        }
+
+    def getLinesNumber(self) -> int:
+        return len(self.__codes_array)
+
+    def getValuesList(self) -> list:
+        """Return the distinct values of the column, sorted."""
+        return self.__values_list.copy()
+
+    def getCount(self, value) -> int:
+        return len(self.__positions_dict.get(value, []))
+
+    def getCountsDict(self, positions_array: np.ndarray = None) -> dict:
+        """Return the values found in the 'positions_array' lines (all the lines if None), sorted, with their number of lines."""
+        if positions_array is None:
+            counts_array = self.__counts_array
+        else:
+            codes_array = self.__codes_array[positions_array]
+            counts_array = np.bincount(codes_array[codes_array >= 0], minlength=len(self.__values_list))
+        return {
+            value: count for value, count in zip(self.__values_list, counts_array.tolist()) if count > 0
+        }
+
+    def getPositionsArray(self, values_list: list) -> np.ndarray:
+        """Return the sorted positions of the lines with any of the values in 'values_list'."""
+        arrays_list = [self.__positions_dict[value] for value in values_list if value in self.__positions_dict]
+        if not arrays_list:
+            return np.array([], dtype=np.int64)
+        if len(arrays_list) == 1:
+            return arrays_list[0]
+        # The values have disjoint lines, so the merged positions are just sorted
+        return np.sort(np.concatenate(arrays_list))
@@ -0,0 +1,145 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+class LRUCache:
+    def __init__(self, max_entries: int = 16, max_bytes: int = None) -> None:
+        """Structure to keep the most recently used values of a calculation, by key.
+
+        When the cache is full, the least recently used values are discarded. The cache can be shared
+        by the Streamlit sessions (threads) of the process.
+
+        Args:
+        - max_entries (int): maximum number of values kept
+        - max_bytes (int): maximum memory of the values kept (see 'getValueBytes'); no limit if None
+        """
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__values_dict = OrderedDict()
+        self.__bytes_dict = {}
+        self.__total_bytes = 0
+        self.__hits_number = 0
+        self.__misses_number = 0
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def getValueBytes(value) -> int:
+        """Return the memory used by dataframes, series and arrays of the 'value' (also inside tuples, lists, dicts and object attributes)."""
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True, deep=True).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(index=True, deep=True))
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (tuple, list)):
+            return sum(LRUCache.getValueBytes(item) for item in value)
+        if isinstance(value, dict):
+            return sum(LRUCache.getValueBytes(item) for item in value.values())
+        if hasattr(value, "__dict__"):
+            return LRUCache.getValueBytes(vars(value))
+        return 0
+
+    def getValue(self, key, default=None):
+        with self.__lock:
+            if key not in self.__values_dict:
+                self.__misses_number += 1
+                return default
+            self.__hits_number += 1
+            self.__values_dict.move_to_end(key)
+            return self.__values_dict[key]
+
+    def __removeValue(self, key) -> None:
+        del self.__values_dict[key]
+        self.__total_bytes -= self.__bytes_dict.pop(key)
+
+    def setValue(self, key, value) -> None:
+        # With a memory limit, values larger than the limit are not kept
+        value_bytes = LRUCache.getValueBytes(value) if self.__max_bytes is not None else 0
+        with self.__lock:
+            if key in self.__values_dict:
+                self.__removeValue(key)
+            if self.__max_bytes is not None and value_bytes > self.__max_bytes:
+                return
+            self.__values_dict[key] = value
+            self.__bytes_dict[key] = value_bytes
+            self.__total_bytes += value_bytes
+            while len(self.__values_dict) > self.__max_entries or (
+                self.__max_bytes is not None and self.__total_bytes > self.__max_bytes
+            ):
+                self.__removeValue(next(iter(self.__values_dict)))
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__values_dict.clear()
+            self.__bytes_dict.clear()
+            self.__total_bytes = 0
+
+    def getEntriesNumber(self) -> int:
+        return len(self.__values_dict)
+
+    def getTotalBytes(self) -> int:
+        return self.__total_bytes
+
+    def getHitsNumber(self) -> int:
+        return self.__hits_number
+
+    def getMissesNumber(self) -> int:
+        return self.__misses_number
+
+
+class SharedResultCache(LRUCache):
+    # The single cache of the process (see 'getInstance')
+    __instance = None
+    __instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """Structure to define the 'LRUCache' shared by all Streamlit sessions of the process.
+
+        It keeps read-only results, such as the dataframes calculated from an Extrato file, by a
+        fingerprint of their source (such as the hash of the file bytes). So, the sessions (users or
+        browser tabs) opening the same Extrato share the same dataframes: they must not be changed, and
+        their arrays are made read-only when they are kept (see 'setReadOnly').
+
+        The memory limit is read from the 'EXTRATO_CACHE_MAX_MB' environment variable (512 MB by default).
+        Use 'getInstance' to get the cache of the process.
+        """
+        max_bytes = int(float(os.environ.get("EXTRATO_CACHE_MAX_MB", "512")) * 1024 * 1024)
+        super().__init__(max_entries=64, max_bytes=max_bytes)
+
+    @staticmethod
+    def setReadOnly(value) -> None:
+        """Make the arrays of dataframes, series and arrays of the 'value' read-only (also inside tuples, lists, dicts and object attributes).
+        
+        Changing them in place, such as by 'DataFrame.loc', raises a ValueError. Operations returning new
+        dataframes (such as 'copy', 'concat' or 'take') are not affected.
+        """
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            # Extension arrays, such as the dates, keep their values in a NumPy array
+            for array in value._mgr.arrays:
+                SharedResultCache.setReadOnly(getattr(array, "_ndarray", array))
+        elif isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        elif isinstance(value, (tuple, list)):
+            for item in value:
+                SharedResultCache.setReadOnly(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                SharedResultCache.setReadOnly(item)
+        elif hasattr(value, "__dict__"):
+            SharedResultCache.setReadOnly(vars(value))
+
+    def setValue(self, key, value) -> None:
+        """Method Overridden from 'LRUCache' class: the kept value is made read-only (see 'setReadOnly')."""
+        SharedResultCache.setReadOnly(value)
+        super().setValue(key, value)
+
+    @staticmethod
+    def getInstance() -> "SharedResultCache":
+        with SharedResultCache.__instance_lock:
+            if SharedResultCache.__instance is None:
+                SharedResultCache.__instance = SharedResultCache()
+            return SharedResultCache.__instance
@@ -0,0 +1,56 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+class PartitionExecutor:
+    def __init__(self, max_workers: int = None, min_partition_lines: int = 100000) -> None:
+        """Structure used to run a function over partitions of a dataframe in a process pool.
+
+        The dataframe must be sorted by the partition column (such as 'Ticker'), so each partition
+        has contiguous lines with whole groups of that column. Then, the results of the partitions
+        can be concatenated in the original order.
+
+        The partitions are sent to the worker processes by 'pickle'. Small dataframes are not worth
+        the processes overhead, so they are calculated in the current process: with partitions of
+        about 20 thousand lines, an Extrato of 48 thousand lines was slower in parallel (0.91 s)
+        than in the current process (0.52 s).
+
+        Args:
+        - max_workers (int): number of worker processes (all cores if None)
+        - min_partition_lines (int): minimum number of lines of each partition
+        """
+        self.__max_workers = max_workers
+        self.__min_partition_lines = min_partition_lines
+
+    def __getWorkersNumber(self) -> int:
+        return self.__max_workers or os.cpu_count() or 1
+
+    def getPartitionsList(self, dataframe: pd.DataFrame, partition_col: str) -> list:
+        """Return the 'dataframe' split in partitions with similar lengths and whole groups of 'partition_col'."""
+        lines_number = len(dataframe)
+        partitions_number = min(self.__getWorkersNumber(), lines_number // self.__min_partition_lines)
+        if partitions_number <= 1:
+            return [dataframe]
+
+        # Each partition ends in the first group start after its target length
+        partition_values = dataframe[partition_col].to_numpy()
+        group_start_array = np.flatnonzero(partition_values[1:] != partition_values[:-1]) + 1
+        target_end_array = np.arange(1, partitions_number) * math.ceil(lines_number / partitions_number)
+        group_position_array = np.searchsorted(group_start_array, target_end_array)
+        cut_index_array = group_start_array[group_position_array[group_position_array < len(group_start_array)]]
+        cut_list = [0] + sorted(set(cut_index_array.tolist())) + [lines_number]
+        return [dataframe.iloc[start:end] for start, end in zip(cut_list[:-1], cut_list[1:])]
+
+    def mapPartitions(self, function, partitions_list: list) -> list:
+        """Return the results of 'function(partition)' for each partition, in the same order.
+
+        The 'function' must be picklable, such as a static method or a method of a picklable object.
+        """
+        if len(partitions_list) <= 1:
+            return [function(partition) for partition in partitions_list]
+        with ProcessPoolExecutor(min(len(partitions_list), self.__getWorkersNumber())) as executor:
+            return list(executor.map(function, partitions_list))
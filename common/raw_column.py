@@ -1,16 +1,33 @@
+import re
+
+
 class RawColumn:
-    def __init__(self, column_name: str, column_type: str) -> None:
+    def __init__(self, column_name: str, column_type: str, formula: str = "") -> None:
         """Structure to define some column parameters.
 
         Args:
             column_name (str): the column title
             column_type (str): 'string', 'date', '$', '%', 'number'
+            formula (str): expression used to calculate the column from other columns,
+                where the column titles are quoted by backticks, such as
+                '`Quantidade` * `Preço Unitário`'. Empty for non-calculated columns.
         """
         self.__column_name = column_name
         self.__column_type = column_type
+        self.__formula = formula
 
     def getName(self) -> str:
         return self.__column_name
 
     def getType(self) -> str:
         return self.__column_type
+
+    def getFormula(self) -> str:
+        return self.__formula
+
+    def isFormulaColumn(self) -> bool:
+        return self.__formula != ""
+
+    def getFormulaInputsList(self) -> list:
+        """Return the column titles used in the formula, without repetition."""
+        return list(dict.fromkeys(re.findall(r"`([^`]+)`", self.__formula)))
@@ -0,0 +1,109 @@
+import hashlib
+import os
+
+import pandas as pd
+
+from common.lru_cache import SharedResultCache
+
+from extrato.lib.extrato_columns import ExtratoColumns
+from extrato.lib.extrato_xls_reader import ExtratoExcelReader
+
+from positions.lib.closed_dataframes_kit import ClosedPositionKit
+from positions.lib.open_dataframes_kit import OpenPositionKit
+from positions.lib.realized_dataframes_kit import RealizedResultKit
+
+
+class SessionStateCache:
+    def __init__(self, session_state) -> None:
+        """Structure used to keep the Extrato dataframe, and the dataframes derived from it, in a Session State.
+
+        The uploaded file is the same in every rerun: the Extrato dataframe is read only when its content
+        (identified by a hash of its bytes) changes. A file path (see 'Home(local).py') is hashed only when
+        its modification time or size changes. The dataframe is kept by hash in the 'SharedResultCache', so
+        the sessions opening the same file share it, without reading it again.
+
+        The dataframes derived from the Extrato (such as the Closed Positions) are calculated only when a page
+        asks for them, once per file: see 'getClosedPositionsDataframe', 'getOpenPositionsDataframe' and
+        'getRealizedResultsDataframe'.
+
+        Args:
+        - session_state: the Streamlit Session State, or any 'dict' used in the same way
+        """
+        self.__session_state = session_state
+        self.__xls_reader = ExtratoExcelReader()
+        # Only the Extrato columns are read: other columns of the User spreadsheet are skipped by the parser
+        self.__xls_reader.setColumnsProjection(ExtratoColumns.getInstance().getColumnsNameList())
+        self.__shared_cache = SharedResultCache.getInstance()
+
+    def __getFileSignature(self, uploaded_file) -> tuple:
+        # Only a file path has a signature: the Streamlit 'UploadedFile' is always hashed
+        if not isinstance(uploaded_file, str):
+            return None
+        file_stat = os.stat(uploaded_file)
+        return (uploaded_file, file_stat.st_mtime_ns, file_stat.st_size)
+
+    def __getFileHash(self, uploaded_file) -> str:
+        # The Streamlit 'UploadedFile' keeps the file bytes; the local version ('Home(local).py') gives the file path
+        if isinstance(uploaded_file, str):
+            with open(uploaded_file, "rb") as file:
+                return hashlib.sha256(file.read()).hexdigest()
+        return hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+
+    def __getExtratoDataframe(self, uploaded_file) -> pd.DataFrame:
+        self.__xls_reader.readExcelFile(uploaded_file)
+        return self.__xls_reader.getRawDataframe()
+
+    def __saveSessionState(self, uploaded_file, file_signature: tuple, file_hash: str, extrato_df: pd.DataFrame):
+        self.__session_state["extrato_file_path"] = uploaded_file
+        self.__session_state["extrato_file_signature"] = file_signature
+        self.__session_state["extrato_file_hash"] = file_hash
+        self.__session_state["extrato_dataframe"] = extrato_df
+
+    def setUploadedFile(self, uploaded_file) -> None:
+        if uploaded_file is None:
+            return
+        # The same file (or a copy of the same content) keeps the dataframe: only its path is updated
+        file_signature = self.__getFileSignature(uploaded_file)
+        if file_signature is not None and self.__session_state.get("extrato_file_signature") == file_signature:
+            self.__session_state["extrato_file_path"] = uploaded_file
+            return
+        file_hash = self.__getFileHash(uploaded_file)
+        if self.__session_state.get("extrato_file_hash") == file_hash:
+            self.__session_state["extrato_file_path"] = uploaded_file
+            self.__session_state["extrato_file_signature"] = file_signature
+            return
+        cache_key = ("extrato_file", file_hash)
+        extrato_df = self.__shared_cache.getValue(cache_key)
+        if extrato_df is None:
+            extrato_df = self.__getExtratoDataframe(uploaded_file)
+            self.__shared_cache.setValue(cache_key, extrato_df)
+        self.__saveSessionState(uploaded_file, file_signature, file_hash, extrato_df)
+
+    def __getDerivedDataframe(self, state_key: str, kit_class, *kit_arguments) -> pd.DataFrame:
+        # The derived dataframe is kept in the Session State with the hash of the file it came from,
+        # and in the 'SharedResultCache' for the other sessions: it is calculated once per file
+        file_hash = self.__session_state["extrato_file_hash"]
+        derived_tuple = self.__session_state.get(state_key)
+        if derived_tuple is not None and derived_tuple[0] == file_hash:
+            return derived_tuple[1]
+        cache_key = (state_key, file_hash)
+        dataframe = self.__shared_cache.getValue(cache_key)
+        if dataframe is None:
+            kit = kit_class(*kit_arguments)
+            kit.setExtratoDataframe(self.__session_state["extrato_dataframe"])
+            dataframe = kit.getRawDataframe()
+            self.__shared_cache.setValue(cache_key, dataframe)
+        self.__session_state[state_key] = (file_hash, dataframe)
+        return dataframe
+
+    def getClosedPositionsDataframe(self) -> pd.DataFrame:
+        """Return the Closed Positions of the uploaded Extrato, calculated in the first call for each file."""
+        return self.__getDerivedDataframe("closed_positions_dataframe", ClosedPositionKit)
+
+    def getOpenPositionsDataframe(self) -> pd.DataFrame:
+        """Return the Open Positions of the uploaded Extrato, calculated in the first call for each file."""
+        return self.__getDerivedDataframe("open_positions_dataframe", OpenPositionKit)
+
+    def getRealizedResultsDataframe(self, matching_method: str) -> pd.DataFrame:
+        """Return the Realized Results of the uploaded Extrato, calculated in the first call for each file and 'LotMatchingMethod'."""
+        return self.__getDerivedDataframe("realized_results_dataframe_" + matching_method, RealizedResultKit, matching_method)
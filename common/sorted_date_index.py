@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+
+class SortedDateIndex:
+    def __init__(self, series: pd.Series) -> None:
+        """Structure to find the lines of a date column inside a period by binary search.
+
+        The dates are kept as a sorted 'datetime64' array, with the line positions in that order.
+        So, the lines of a period are a contiguous range of the sorted dates, found by 'searchsorted',
+        and the first and last dates are read directly. When the lines are already sorted by date
+        (as the Extrato usually is), the range is the line positions itself.
+
+        Empty dates are not part of any period.
+
+        Args:
+        - series: the column values, in the lines order
+        """
+        dates_array = pd.to_datetime(series, errors="coerce").to_numpy(dtype="datetime64[ns]")
+        self.__order_array = np.argsort(dates_array, kind="mergesort")
+        self.__sorted_dates_array = dates_array[self.__order_array]
+        self.__rank_array = np.empty(len(dates_array), dtype=np.int64)
+        self.__rank_array[self.__order_array] = np.arange(len(dates_array))
+        self.__is_sorted = bool((self.__order_array == np.arange(len(dates_array))).all())
+        # 'NaT' values are sorted after all the dates
+        self.__dates_number = int(np.count_nonzero(~np.isnat(dates_array)))
+
+    def __getDate(self, rank: int):
+        return pd.Timestamp(self.__sorted_dates_array[rank]).date()
+
+    def __getSortedPosition(self, date, side: str) -> int:
+        return int(np.searchsorted(self.__sorted_dates_array[:self.__dates_number], np.datetime64(pd.Timestamp(date)), side))
+
+    def getFirstDate(self):
+        return self.__getDate(0) if self.__dates_number else None
+
+    def getLastDate(self):
+        return self.__getDate(self.__dates_number - 1) if self.__dates_number else None
+
+    def getBounds(self, positions_array: np.ndarray = None) -> tuple:
+        """Return the first and last dates of the lines in 'positions_array' (all the lines if None)."""
+        if positions_array is None:
+            return self.getFirstDate(), self.getLastDate()
+        ranks_array = self.__rank_array[positions_array]
+        ranks_array = ranks_array[ranks_array < self.__dates_number]
+        if not len(ranks_array):
+            return None, None
+        return self.__getDate(ranks_array.min()), self.__getDate(ranks_array.max())
+
+    def getPositionsArray(self, start_date=None, end_date=None) -> np.ndarray:
+        """Return the sorted positions of the lines with 'start_date <= date <= end_date'.
+
+        A None bound does not limit the period on its side.
+        """
+        start = 0 if start_date is None else self.__getSortedPosition(start_date, "left")
+        end = self.__dates_number if end_date is None else self.__getSortedPosition(end_date, "right")
+        end = max(start, end)
+        if self.__is_sorted:
+            return np.arange(start, end)
+        return np.sort(self.__order_array[start:end])
@@ -0,0 +1,122 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from common.filter import FilterInterface
+
+
+class TableView:
+    def __init__(self, page_size: int = 50) -> None:
+        """Structure used to show a dataframe page by page, sorted by any column.
+
+        The sorted order of each column is calculated once per dataframe version, so changing the
+        page (or the sort direction) just takes the lines of the page: only them need to be formatted
+        and shown. The lines may also be the lines selected by a filter (see 'setFilter'): then, only the
+        lines of the page are read, and the filtered dataframe is never built.
+
+        Args:
+        - page_size (int): number of lines of each page
+        """
+        self.__page_size = page_size
+        self.__dataframe = pd.DataFrame()
+        self.__filter_object = None
+        self.__columns_list = None
+        self.__version = None
+        self.__sorted_positions_dict = {}
+
+    def __getFingerprint(self, dataframe: pd.DataFrame) -> tuple:
+        return (
+            tuple(dataframe.columns),
+            len(dataframe),
+            int(pd.util.hash_pandas_object(dataframe, index=True).sum()),
+        )
+
+    def setDataframe(self, dataframe: pd.DataFrame, version=None) -> None:
+        """Set the dataframe to be shown.
+
+        The sorted orders are kept while the 'version' (and the columns) do not change. If 'version'
+        is None, a fingerprint of the dataframe contents is used as version, which reads all the lines.
+        """
+        if version is None:
+            version = self.__getFingerprint(dataframe)
+        else:
+            version = (tuple(dataframe.columns), version)
+        self.__setVersion(version)
+        self.__dataframe = dataframe
+        self.__filter_object = None
+        self.__columns_list = list(dataframe.columns)
+
+    def setFilter(self, filter_object: FilterInterface, columns_list: list) -> None:
+        """Set the lines selected by the 'filter_object' to be shown, with the 'columns_list' columns.
+
+        The sorted orders are kept while the filtered version (see 'FilterInterface.getFilteredVersion')
+        and the columns do not change. Only the sorted column and the lines of the page are read from the filter.
+        """
+        self.__setVersion((tuple(columns_list), filter_object.getFilteredVersion()))
+        self.__dataframe = None
+        self.__filter_object = filter_object
+        self.__columns_list = list(columns_list)
+
+    def __setVersion(self, version: tuple) -> None:
+        if version != self.__version:
+            self.__sorted_positions_dict = {}
+            self.__version = version
+
+    def setPageSize(self, page_size: int) -> None:
+        self.__page_size = max(1, int(page_size))
+
+    def getPageSize(self) -> int:
+        return self.__page_size
+
+    def getLinesNumber(self) -> int:
+        if self.__filter_object is not None:
+            return self.__filter_object.getLinesNumber()
+        return len(self.__dataframe)
+
+    def getColumnsList(self) -> list:
+        return self.__columns_list.copy()
+
+    def getPagesNumber(self) -> int:
+        return max(1, math.ceil(self.getLinesNumber() / self.__page_size))
+
+    def __getColumnSeries(self, column: str) -> pd.Series:
+        if self.__filter_object is not None:
+            return self.__filter_object.getColumnSeries(column)
+        return self.__dataframe[column]
+
+    def __getLines(self, positions_array: np.ndarray) -> pd.DataFrame:
+        if self.__filter_object is not None:
+            return self.__filter_object.getSelectedLines(positions_array)[self.__columns_list]
+        return self.__dataframe.iloc[positions_array]
+
+    def __getSortedPositions(self, sort_column: str) -> np.ndarray:
+        # Stable ascending order of the column values
+        # Columns mixing types (such as dates and empty strings) are sorted by their strings
+        if sort_column not in self.__sorted_positions_dict:
+            column_values = self.__getColumnSeries(sort_column).reset_index(drop=True)
+            try:
+                sorted_values = column_values.sort_values(kind="mergesort")
+            except TypeError:
+                sorted_values = column_values.astype(str).sort_values(kind="mergesort")
+            self.__sorted_positions_dict[sort_column] = sorted_values.index.to_numpy()
+        return self.__sorted_positions_dict[sort_column]
+
+    def getPageDataframe(self, page_number: int, sort_column: str = None, ascending: bool = True) -> pd.DataFrame:
+        """Return the lines of the page.
+
+        Args:
+        - page_number (int): page index, starting from zero
+        - sort_column (str): column used to sort the lines; if None, the dataframe order is kept
+        - ascending (bool): sort direction
+        """
+        page_number = min(max(0, int(page_number)), self.getPagesNumber() - 1)
+        start = page_number * self.__page_size
+        end = min(start + self.__page_size, self.getLinesNumber())
+        if sort_column is None:
+            return self.__getLines(np.arange(start, end))
+
+        sorted_positions = self.__getSortedPositions(sort_column)
+        if not ascending:
+            sorted_positions = sorted_positions[::-1]
+        return self.__getLines(sorted_positions[start:end])
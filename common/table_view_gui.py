@@ -0,0 +1,61 @@
+import pandas as pd
+import streamlit as st
+
+from common.dataframes_kit import DataframesKitInterface
+from common.filter import FilterInterface
+from common.table_view import TableView
+
+
+class TableViewGUI:
+    def __init__(self, table_key: str, kit_object: DataframesKitInterface) -> None:
+        """Structure used to show a 'TableView' with sort and page controls.
+
+        The 'TableView' is kept in the Streamlit Session State, so its sorted orders are reused
+        in the next reruns of the page. Only the lines of the visible page are formatted.
+
+        Args:
+        - table_key (str): unique name of the table, used as Session State key
+        - kit_object: the 'DataframesKitInterface' instance used to format the lines
+        """
+        self.__table_key = table_key
+        self.__kit_object = kit_object
+        if self.__table_key not in st.session_state:
+            st.session_state[self.__table_key] = TableView()
+        self.__table_view = st.session_state[self.__table_key]
+
+    def __showSortControls(self, columns_list: list) -> tuple:
+        sort_column, sort_direction, page_size = st.columns(3)
+        sort_column = sort_column.selectbox('Ordenar por:', ["Ordem original"] + columns_list, key=self.__table_key + "_sort")
+        sort_direction = sort_direction.selectbox('Ordem:', ["Crescente", "Decrescente"], key=self.__table_key + "_direction")
+        page_size = page_size.selectbox('Linhas por página:', [25, 50, 100, 500], index=1, key=self.__table_key + "_size")
+        self.__table_view.setPageSize(page_size)
+        sort_column = None if sort_column == "Ordem original" else sort_column
+        return sort_column, sort_direction == "Crescente"
+
+    def __showPageControl(self) -> int:
+        pages_number = self.__table_view.getPagesNumber()
+        page_key = self.__table_key + "_page"
+        # The filters may reduce the number of pages below the last selected page
+        if st.session_state.get(page_key, 1) > pages_number:
+            st.session_state[page_key] = pages_number
+        page_number = st.number_input('Página:', min_value=1, max_value=pages_number, step=1, key=page_key)
+        st.caption(
+            "Página " + str(page_number) + " de " + str(pages_number) +
+            " (" + str(self.__table_view.getLinesNumber()) + " linhas)"
+        )
+        return page_number - 1
+
+    def __showPage(self) -> None:
+        sort_column, ascending = self.__showSortControls(self.__table_view.getColumnsList())
+        page_df = self.__table_view.getPageDataframe(self.__showPageControl(), sort_column, ascending)
+        st.write("", self.__kit_object.getFormattedDataframe(page_df).astype(str))
+
+    def showDataframe(self, dataframe: pd.DataFrame, version=None) -> None:
+        """Show the 'dataframe' page selected by the User (see 'TableView.setDataframe')."""
+        self.__table_view.setDataframe(dataframe, version)
+        self.__showPage()
+
+    def showFilteredLines(self, filter_object: FilterInterface, columns_list: list) -> None:
+        """Show the page of the lines selected by the 'filter_object' (see 'TableView.setFilter')."""
+        self.__table_view.setFilter(filter_object, columns_list)
+        self.__showPage()
@@ -0,0 +1,75 @@
+import bisect
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+
+class TokenIndex:
+    def __init__(self, series_list: list) -> None:
+        """Structure to search words in text columns (such as 'Notas') without scanning the lines.
+
+        The texts are split in tokens (words in lower case, without accents) and each token is mapped
+        to the sorted array of the line positions where it is found, in any of the columns.
+
+        A query matches the lines having all of its words, where each word may be the beginning of
+        a token: "petr div" finds "PETR4" lines with the note "Dividendos recebidos".
+
+        Args:
+        - series_list: the text columns, in the lines order
+        """
+        # Each distinct text is split only once; its lines are found by the text code
+        token_arrays_dict = {}
+        for series in series_list:
+            texts = pd.Series(series.to_numpy(), dtype=object).fillna("").astype(str)
+            codes_array, texts_array = pd.factorize(texts)
+            counts_array = np.bincount(codes_array, minlength=len(texts_array))
+            order_array = np.argsort(codes_array, kind="stable")
+            end_array = np.cumsum(counts_array)
+            for text, count, end in zip(texts_array, counts_array.tolist(), end_array.tolist()):
+                for token in set(TokenIndex.getTokensList(text)):
+                    token_arrays_dict.setdefault(token, []).append(order_array[end - count:end])
+        self.__positions_dict = {
+            token: np.unique(np.concatenate(arrays_list)) for token, arrays_list in token_arrays_dict.items()
+        }
+        self.__sorted_tokens_list = sorted(self.__positions_dict)
+
+    @staticmethod
+    def getTokensList(text: str) -> list:
+        """Return the words of the 'text', in lower case and without accents."""
+        normalized_text = unicodedata.normalize("NFKD", text.lower())
+        normalized_text = "".join(char if char.isalnum() else " " for char in normalized_text if not unicodedata.combining(char))
+        return normalized_text.split()
+
+    def getTokensNumber(self) -> int:
+        return len(self.__sorted_tokens_list)
+
+    def __getPrefixPositionsArray(self, prefix: str) -> np.ndarray:
+        # The tokens starting with the 'prefix' are contiguous in the sorted tokens list
+        start = bisect.bisect_left(self.__sorted_tokens_list, prefix)
+        end = bisect.bisect_left(self.__sorted_tokens_list, prefix + "\U0010ffff", start)
+        arrays_list = [self.__positions_dict[token] for token in self.__sorted_tokens_list[start:end]]
+        if not arrays_list:
+            return np.array([], dtype=np.int64)
+        if len(arrays_list) == 1:
+            return arrays_list[0]
+        return np.unique(np.concatenate(arrays_list))
+
+    def getPositionsArray(self, query: str) -> np.ndarray:
+        """Return the sorted positions of the lines matching all the words of the 'query'.
+
+        Return None if the query has no words (no lines are filtered).
+        """
+        words_list = TokenIndex.getTokensList(query)
+        if not words_list:
+            return None
+        positions_array = None
+        for word in sorted(set(words_list), key=len, reverse=True):
+            word_positions_array = self.__getPrefixPositionsArray(word)
+            if positions_array is None:
+                positions_array = word_positions_array
+            else:
+                positions_array = np.intersect1d(positions_array, word_positions_array, assume_unique=True)
+            if not len(positions_array):
+                break
+        return positions_array
@@ -85,6 +85,7 @@ class ExtratoColumns(ColumnsInterface):
         Basically, our target is splitting the 'Extrato' columns in several new ones.
         """
         super().__init__()
+        operations_object = ExtratoOperations()
         
         # Date of the spreadsheet entries
         self._date_col = self.addRawColumn("Data", "date")
@@ -105,7 +106,7 @@ class ExtratoColumns(ColumnsInterface):
 
         # "Preço Total": It could be not present in the User spreadsheet, but it is
         # Anyway, the app may calculate it easily
-        self._total_price_col = self.addRawColumn("Preço Total", "$")
+        self._total_price_col = self.addRawColumn("Preço Total", "$", "`Quantidade` * `Preço Unitário`")
 
         # Costs
         self._taxes_col = self.addRawColumn("Taxas", "$")
@@ -113,24 +114,46 @@ class ExtratoColumns(ColumnsInterface):
 
         # "Custo Total": It could be not present in the User spreadsheet, but it is
         # Anyway, the app may calculate it easily
-        self._total_costs_col = self.addRawColumn("Custo Total", "$")
+        self._total_costs_col = self.addRawColumn("Custo Total", "$", "`IR` + `Taxas`")
 
         # Earnings
         self._dividends_col = self.addRawColumn("Dividendos", "$")
         self._JCP_col = self.addRawColumn("JCP", "$")
 
         # "Proventos Totais": It is NOT present in the User spreadsheet, but the app may calculate it easily
-        self._total_earnings_col = self.addRawColumn("Proventos Totais", "$")
+        self._total_earnings_col = self.addRawColumn("Proventos Totais", "$", "`Dividendos` + `JCP`")
 
         # User notes
         self._notes_col = self.addRawColumn("Notas", "string")
 
         # The below columns can be extracted from the column 'Operação' and 'Preço Total'
-        self._contributions_col = self.addRawColumn("Transferência", "$")
-        self._rescues_col = self.addRawColumn("Resgate", "$")
-        self._buy_price_col = self.addRawColumn("Compra", "$")
-        self._sell_price_col = self.addRawColumn("Venda", "$")
+        # The 'Preço Total' is kept only in the lines of the related operation; other lines are zero
+        self._contributions_col = self.addRawColumn(
+            "Transferência", "$", self.__getOperationPriceFormula(operations_object.getContributionOperation())
+        )
+        self._rescues_col = self.addRawColumn(
+            "Resgate", "$", self.__getOperationPriceFormula(operations_object.getRescueOperation())
+        )
+        self._buy_price_col = self.addRawColumn(
+            "Compra", "$", self.__getOperationPriceFormula(operations_object.getBuyOperation())
+        )
+        self._sell_price_col = self.addRawColumn(
+            "Venda", "$", self.__getOperationPriceFormula(operations_object.getSellOperation())
+        )
 
         # Slice columns
         self._slice_index_col = self.addRawColumn("Posição", "number")
         self._slice_type_col = self.addRawColumn("Tipo de Posição", "string")
+
+        # The slices are found by 'ExtratoKit' from the cumulative quantities of each ticker
+        slice_inputs_list = [
+            self._ticker_col.getName(),
+            self._date_col.getName(),
+            self._quantity_col.getName(),
+            self._operation_col.getName(),
+        ]
+        self.setDerivedColumnInputs(self._slice_index_col, slice_inputs_list)
+        self.setDerivedColumnInputs(self._slice_type_col, slice_inputs_list)
+
+    def __getOperationPriceFormula(self, operation_name: str) -> str:
+        return "`Preço Total` * (`Operação` == '" + operation_name + "')"
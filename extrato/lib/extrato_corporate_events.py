@@ -0,0 +1,135 @@
+import pandas as pd
+
+from common.columns import ColumnsInterface
+
+from extrato.lib.extrato_columns import ExtratoColumns
+
+
+class CorporateEventType:
+    def __init__(self) -> None:
+        """Structure to define possible values for the column 'Evento'."""
+        self.__events_list = []
+        self.__split = self.__addEventType("Desdobramento")
+        self.__reverse_split = self.__addEventType("Grupamento")
+        self.__bonus_shares = self.__addEventType("Bonificação")
+
+    def __addEventType(self, event_string: str) -> str:
+        self.__events_list.append(event_string)
+        return event_string
+
+    def getEventsList(self) -> list:
+        return self.__events_list.copy()
+
+    def getSplitEvent(self) -> str:
+        return self.__split
+
+    def getReverseSplitEvent(self) -> str:
+        return self.__reverse_split
+
+    def getBonusSharesEvent(self) -> str:
+        return self.__bonus_shares
+
+
+class CorporateEventsColumns(ColumnsInterface):
+    def __init__(self) -> None:
+        """Structure to define all columns related to the 'Corporate Events Database'.
+        
+        The corporate events are registered by the User in the 'Eventos' sheet of the Extrato
+        spreadsheet (or in a separated file), one line per event:
+        - 'Data': the first day the ticker is traded with the new quantities
+        - 'Fator': new quantity per old quantity, such as 2.0 for a 1:2 'Desdobramento',
+          0.1 for a 10:1 'Grupamento' and 1.1 for a 10% 'Bonificação'
+        """
+        super().__init__()
+        self._date_col = self.addRawColumn("Data", "date")
+        self._ticker_col = self.addRawColumn("Ticker", "string")
+        self._event_col = self.addRawColumn("Evento", "string")
+        self._factor_col = self.addRawColumn("Fator", "number")
+
+    def getSheetName(self) -> str:
+        return "Eventos"
+
+
+class CorporateEventsAdjuster:
+    def __init__(self) -> None:
+        """Structure to adjust Extrato dataframes according to the corporate events.
+        
+        Events such as 'Desdobramento', 'Grupamento' and 'Bonificação' change the quantity of a ticker
+        without 'buy' or 'sell' operations. So, every Extrato line dated before an event is expressed in
+        the quantities after it: 'Quantidade' is multiplied by the event 'Fator' and 'Preço Unitário' is
+        divided by it ('Preço Total' does not change).
+        
+        The factor of a line is the product of the factors of all later events of its ticker: it is
+        calculated by a cumulative product over the events and an 'as of' merge with the Extrato lines.
+        """
+        self.__events_columns = CorporateEventsColumns.getInstance()
+        self.__extrato_columns = ExtratoColumns.getInstance()
+        self.__cumulative_factor_col = "Fator Acumulado"
+        self.__events_df = pd.DataFrame(columns=self.__events_columns.getColumnsNameList())
+
+    def setEventsDataframe(self, events_df: pd.DataFrame) -> None:
+        """Set the corporate events, ignoring the lines without date, ticker or a positive factor."""
+        date_col = self.__events_columns._date_col.getName()
+        ticker_col = self.__events_columns._ticker_col.getName()
+        factor_col = self.__events_columns._factor_col.getName()
+        
+        events_df = events_df.loc[:, [date_col, ticker_col, factor_col]].copy()
+        events_df[date_col] = pd.to_datetime(events_df[date_col])
+        events_df[factor_col] = pd.to_numeric(events_df[factor_col], errors="coerce")
+        valid_lines = events_df[date_col].notna() & events_df[ticker_col].notna() & (events_df[factor_col] > 0)
+        self.__events_df = events_df.loc[valid_lines]
+
+    def getEventsDataframe(self) -> pd.DataFrame:
+        return self.__events_df.copy()
+
+    def __getCumulativeFactorDataframe(self) -> pd.DataFrame:
+        # For each event: the product of its factor and the factors of all later events of the ticker
+        date_col = self.__events_columns._date_col.getName()
+        ticker_col = self.__events_columns._ticker_col.getName()
+        factor_col = self.__events_columns._factor_col.getName()
+        
+        events_df = self.__events_df.sort_values(by=date_col, ascending=False, kind="mergesort")
+        events_df[self.__cumulative_factor_col] = events_df.groupby(ticker_col, sort=False)[factor_col].cumprod()
+        return events_df.iloc[::-1]
+
+    def __getLinesFactorSeries(self, extrato_df: pd.DataFrame) -> pd.Series:
+        # Each Extrato line gets the cumulative factor of the first event after its date
+        date_col = self.__extrato_columns._date_col.getName()
+        ticker_col = self.__extrato_columns._ticker_col.getName()
+        
+        lines_df = extrato_df.loc[extrato_df[date_col].notna() & extrato_df[ticker_col].notna(), [date_col, ticker_col]]
+        lines_df = lines_df.astype({date_col: "datetime64[ns]", ticker_col: object})
+        lines_df = lines_df.sort_values(by=date_col, kind="mergesort")
+        
+        events_df = self.__getCumulativeFactorDataframe()
+        events_df = events_df.rename(columns={
+            self.__events_columns._date_col.getName(): date_col,
+            self.__events_columns._ticker_col.getName(): ticker_col,
+        })
+        events_df = events_df.astype({ticker_col: object})
+        
+        merged_df = pd.merge_asof(
+            lines_df,
+            events_df[[date_col, ticker_col, self.__cumulative_factor_col]],
+            on=date_col,
+            by=ticker_col,
+            direction="forward",
+            allow_exact_matches=False,
+        )
+        lines_factor = pd.Series(merged_df[self.__cumulative_factor_col].to_numpy(), index=lines_df.index)
+        return lines_factor.reindex(extrato_df.index).fillna(1.0)
+
+    def getAdjustedDataframe(self, extrato_df: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of the 'extrato_df' with quantities and unit prices adjusted to the events."""
+        extrato_df = extrato_df.copy()
+        if self.__events_df.empty or extrato_df.empty:
+            return extrato_df
+        
+        quantity_col = self.__extrato_columns._quantity_col.getName()
+        unit_price_col = self.__extrato_columns._unit_price_col.getName()
+        lines_factor = self.__getLinesFactorSeries(extrato_df)
+        if quantity_col in extrato_df.columns:
+            extrato_df[quantity_col] = extrato_df[quantity_col] * lines_factor
+        if unit_price_col in extrato_df.columns:
+            extrato_df[unit_price_col] = extrato_df[unit_price_col] / lines_factor
+        return extrato_df
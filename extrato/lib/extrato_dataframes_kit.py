@@ -1,7 +1,11 @@
+import copy
+
 import numpy as np
 import pandas as pd
 
 from common.dataframes_kit import DataframesKitInterface
+from common.fixed_point import FixedPointConverter
+from common.parallel import PartitionExecutor
 from common.raw_column import RawColumn
 
 from extrato.lib.extrato_columns import (ExtratoOperations, InvestmentPositionType, ExtratoColumns)
@@ -9,129 +13,211 @@ from extrato.lib.extrato_columns import (ExtratoOperations, InvestmentPositionTy
 
 class ExtratoSlicer:
     def __init__(self) -> None:
-        """Structure to create slices based on Extrato dataframes.
+        """Structure to aggregate slices based on Extrato dataframes.
         
-        Slices are small filtered dataframes used to get useful information such as
+        Slices are groups of Extrato lines used to get useful information such as
         Opened and Closed Investment Position.
+        
+        All the slices of a given position type are aggregated at once: each aggregation
+        added by 'addAggregation' becomes a column of the aggregated dataframe, which
+        has one line per slice.
         """
-        self.__columns_object = ExtratoColumns()
+        self.__columns_object = ExtratoColumns.getInstance()
         self.__extrato_slice_index_col = self.__columns_object._slice_index_col.getName()
         self.__extrato_slice_type_col = self.__columns_object._slice_type_col.getName()
+        self.__extrato_operation_col = self.__columns_object._operation_col.getName()
+        self.__extrato_ticker_col = self.__columns_object._ticker_col.getName()
 
-        self.__postitions_type = InvestmentPositionType()
         self.__operations_object = ExtratoOperations()
+        self.__aggregations_list = []
+        self.__fixed_point_converter = None
+        self.__partition_executor = None
 
         self.extrato_df = pd.DataFrame()
-        self.extrato_sliced_df = pd.DataFrame()
-        self.slice_index = None
 
     def setExtratoDataframe(self, extrato_df: pd.DataFrame) -> None:
-        self.extrato_df = extrato_df.copy()
-        self.extrato_sliced_df = None
-
-    def getExtratoSliceIndexList(self) -> list:
-        """Return a list of all slice indexes."""
-        df_column = self.extrato_df[[self.__extrato_slice_index_col]].copy()
-        df_column = df_column.dropna()
-        df_column = df_column.drop_duplicates()
-        df_column_list = df_column[self.__extrato_slice_index_col].to_list()
-        if df_column_list:
-            df_column_list.sort()
-        return df_column_list
-
-    def updateSlicedDataframeByIndex(self, slice_index: int) -> pd.DataFrame:
-        self.slice_index = slice_index
-        self.extrato_sliced_df = self.getSlicedDataframe()
-
-    def getSlicedDataframe(self) -> pd.DataFrame:
-        """Return a filtered dataframe per slice index: 'sliced dataframe'."""
-        return self.extrato_df.loc[self.extrato_df[self.__extrato_slice_index_col].isin([self.slice_index])]
-
-    def isClosedPositionSlicedDataframe(self) -> bool:
-        """Check if the specified 'sliced dataframe' is related to Closed Positions."""
-        return not self.extrato_sliced_df.loc[
-            self.extrato_sliced_df[self.__extrato_slice_type_col].isin([self.__postitions_type.getClosedPosition()])
-        ].empty
-
-    def getUniqueValueFromSlicedDataframe(
-        self,
-        extrato_raw_column_obj: RawColumn,
-        first_line_value=True,
-    ):
-        """Return an unique value from the 'sliced dataframe'.
-        
-        This method is useful to get information such as Ticker, Market and other repeated data cells.
-        
-        If 'first_line_value==True': return the value from the first line
+        self.extrato_df = extrato_df
+
+    def setFixedPointConverter(self, fixed_point_converter: FixedPointConverter) -> None:
+        """Set the 'FixedPointConverter' used to sum 'number' and '$' columns exactly.
         
-        If 'first_line_value==False': return the value from the last line
+        If 'fixed_point_converter' is None, the sums are calculated with floats.
         """
-        extrato_column_value_list = self.extrato_sliced_df[extrato_raw_column_obj.getName()].to_list()
-        if first_line_value:
-            return extrato_column_value_list[0]
-        else:
-            return extrato_column_value_list[-1]
+        self.__fixed_point_converter = fixed_point_converter
 
-    def getMinMaxValueFromSlicedDataframe(
-        self,
-        extrato_raw_column_obj: RawColumn,
-        only_buy_operation=True,
-        minimum_value_flag=True,
-    ):
-        """Return a minimum/maximum value from the 'sliced dataframe'.
-        
-        This method is useful to get data such as Prices, Yield and other number's cells.
+    def setPartitionExecutor(self, partition_executor: PartitionExecutor) -> None:
+        """Set the 'PartitionExecutor' used to aggregate the slices of different tickers in parallel.
         
-        If 'minimum_value_flag==True': return the minimum value in the given column.
-        If 'minimum_value_flag==False': return the maximum value in the given column.
-        
-        If 'only_buy_operation==True': consider only lines with the tag 'buy'
-        If 'only_buy_operation==False': consider all lines of the 'sliced dataframe'
+        If 'partition_executor' is None, all the slices are aggregated in the current process.
         """
-        extrato_df_filtered = self.extrato_sliced_df.copy()
-
-        # Filter per Buy Operation
-        if only_buy_operation:
-            buy_operation = self.__operations_object.getBuyOperation()
-            operation_col = self.__columns_object._operation_col.getName()
-            extrato_df_filtered = extrato_df_filtered.loc[extrato_df_filtered[operation_col].isin([buy_operation])]
-
-        extrato_col_data_list = extrato_df_filtered[extrato_raw_column_obj.getName()].to_list()
-        if extrato_col_data_list:
-            # Return Minimum/Maximum value
-            if minimum_value_flag:
-                return min(extrato_df_filtered[extrato_raw_column_obj.getName()].to_list())
-            else:
-                return max(extrato_df_filtered[extrato_raw_column_obj.getName()].to_list())
-        else:
-            return 0.0
+        self.__partition_executor = partition_executor
+
+    def __isFixedPointAggregation(self, extrato_raw_column_obj: RawColumn, function: str) -> bool:
+        if self.__fixed_point_converter is None:
+            return False
+        return function == "sum" and self.__fixed_point_converter.isFixedPointType(extrato_raw_column_obj.getType())
 
-    def getSumValueFromSlicedDataframe(
+    def addAggregation(
         self,
+        result_col: str,
         extrato_raw_column_obj: RawColumn,
+        function: str,
         operation_type: str = "ALL",
-    ):
-        """Return the sum value from the 'sliced dataframe'.
+    ) -> None:
+        """Add the 'result_col' to the aggregated dataframe.
         
-        This method is useful to get the sum of columns such as Prices, Taxes and other related.
+        The 'function' is applied to the 'extrato_raw_column_obj' values of each slice:
+        - 'first': the value from the first line
+        - 'min' / 'max': the minimum / maximum value
+        - 'sum': the sum of the values
         
         The 'operation_type (str)' is any operation string related to the 'ExtratoOperations' class.
         
-        If ' operation_type=="ALL" ', then no subfilter is applied to the sliced dataframe.
-        If ' operation_type==some_operation_type ', then a subfilter is applied to the sliced dataframe.
+        If ' operation_type=="ALL" ', then all lines of the slice are considered.
+        If ' operation_type==some_operation_type ', then only the lines of that operation are considered.
         """
-        extrato_df_filtered = self.extrato_sliced_df.copy()
-
-        # Filter per Operation type
         if operation_type != "ALL":
-            if operation_type in self.__operations_object.getOperationsList():
-                operation_col = self.__columns_object._operation_col.getName()
-                extrato_df_filtered = extrato_df_filtered.loc[extrato_df_filtered[operation_col].isin([operation_type])]
-            else:
+            if operation_type not in self.__operations_object.getOperationsList():
                 msg = "The " + str(operation_type) + " is not a valid operation type. See the ExtratoOperations class."
                 raise ValueError(msg)
+        self.__aggregations_list.append((result_col, extrato_raw_column_obj, function, operation_type))
+
+    def getAggregationInputDataframe(self, sliced_df: pd.DataFrame) -> pd.DataFrame:
+        """Return one column per aggregation, where the lines of other operations are replaced by NaN.
+        
+        In fixed-point mode, the summed 'number' and '$' columns are scaled integers.
+        """
+        input_dict = {}
+        for result_col, extrato_raw_column_obj, function, operation_type in self.__aggregations_list:
+            column_values = sliced_df[extrato_raw_column_obj.getName()]
+            lines_of_other_operations = np.nan
+            if self.__columns_object.isDateType(extrato_raw_column_obj.getType()):
+                column_values = pd.to_datetime(column_values)
+            if self.__isFixedPointAggregation(extrato_raw_column_obj, function):
+                # Zero instead of NaN: the scaled integers must not be converted to floats
+                column_values = self.__fixed_point_converter.getFixedPointSeries(column_values)
+                lines_of_other_operations = 0
+            if operation_type != "ALL":
+                column_values = column_values.where(
+                    sliced_df[self.__extrato_operation_col] == operation_type, lines_of_other_operations
+                )
+            input_dict[result_col] = column_values
+        return pd.DataFrame(input_dict, index=sliced_df.index)
+
+    def getSliceAccumulator(self) -> "ExtratoSliceAccumulator":
+        """Return an empty 'ExtratoSliceAccumulator' with the aggregations of this slicer."""
+        return ExtratoSliceAccumulator(
+            [function for result_col, extrato_raw_column_obj, function, operation_type in self.__aggregations_list],
+            [
+                self.__isFixedPointAggregation(extrato_raw_column_obj, function)
+                for result_col, extrato_raw_column_obj, function, operation_type in self.__aggregations_list
+            ],
+            self.__fixed_point_converter,
+        )
+
+    def getAggregationsNameList(self) -> list:
+        return [aggregation[0] for aggregation in self.__aggregations_list]
+
+    def getAggregatedDataframe(self, position_type: str) -> pd.DataFrame:
+        """Return a dataframe with one line per slice of the given position type.
+        
+        The 'position_type (str)' is any position string related to the 'InvestmentPositionType' class.
+        
+        The dataframe is indexed (and sorted) by the slice index.
+        """
+        result_col_list = [aggregation[0] for aggregation in self.__aggregations_list]
+        sliced_df = self.extrato_df.loc[self.extrato_df[self.__extrato_slice_type_col] == position_type]
+        if sliced_df.empty:
+            return pd.DataFrame(columns=result_col_list)
+        if self.__partition_executor is None:
+            return self._getAggregatedPartitionDataframe(sliced_df)
+        
+        # Each slice has lines of a single ticker: the partitions have whole tickers (and slices)
+        # The slicer is sent to the worker processes without its Extrato dataframe
+        sliced_df = sliced_df.sort_values(by=self.__extrato_slice_index_col, kind="mergesort")
+        partition_slicer = copy.copy(self)
+        partition_slicer.extrato_df = pd.DataFrame()
+        aggregated_df_list = self.__partition_executor.mapPartitions(
+            partition_slicer._getAggregatedPartitionDataframe,
+            self.__partition_executor.getPartitionsList(sliced_df, self.__extrato_ticker_col),
+        )
+        return pd.concat(aggregated_df_list)
 
-        return sum(extrato_df_filtered[extrato_raw_column_obj.getName()].to_list())
+    def _getAggregatedPartitionDataframe(self, sliced_df: pd.DataFrame) -> pd.DataFrame:
+        # Aggregate the slices in a single 'groupby' pass
+        named_aggregations_dict = {
+            result_col: (result_col, function)
+            for result_col, extrato_raw_column_obj, function, operation_type in self.__aggregations_list
+        }
+        aggregation_input_df = self.getAggregationInputDataframe(sliced_df)
+        aggregated_df = aggregation_input_df.groupby(sliced_df[self.__extrato_slice_index_col], sort=True).agg(
+            **named_aggregations_dict
+        )
+        
+        # Scaled integers are converted back to floats
+        for result_col, extrato_raw_column_obj, function, operation_type in self.__aggregations_list:
+            if self.__isFixedPointAggregation(extrato_raw_column_obj, function):
+                aggregated_df[result_col] = self.__fixed_point_converter.getFloatSeries(aggregated_df[result_col])
+        return aggregated_df
+
+
+class ExtratoSliceAccumulator:
+    def __init__(self, functions_list: list, fixed_point_list: list, fixed_point_converter: FixedPointConverter) -> None:
+        """Structure to aggregate the lines of a single slice, one line at a time.
+        
+        Only one value per aggregation is kept, instead of the slice lines. The results are the same
+        ones of 'ExtratoSlicer.getAggregatedDataframe': NaN values are skipped and the float sums use
+        the same compensated (Kahan) summation of the Pandas 'groupby'.
+        
+        Args:
+        - functions_list (list): the aggregation functions ('first', 'min', 'max' or 'sum')
+        - fixed_point_list (list): True for the sums of scaled integers (see 'FixedPointConverter')
+        - fixed_point_converter: the 'FixedPointConverter' used by the slicer, or None
+        """
+        self.__functions_list = functions_list
+        self.__fixed_point_list = fixed_point_list
+        self.__fixed_point_converter = fixed_point_converter
+        self.__values_list = [0 if function == "sum" else np.nan for function in functions_list]
+        self.__compensations_list = [0.0 for function in functions_list]
+        self.__has_first_value_list = [False for function in functions_list]
+
+    def addLine(self, line_values: tuple) -> None:
+        """Add a line, where 'line_values' follows the 'ExtratoSlicer.getAggregationInputDataframe' columns."""
+        for aggregation, value in enumerate(line_values):
+            # NaN and NaT are the only values different from themselves
+            if value != value:
+                continue
+            function = self.__functions_list[aggregation]
+            current_value = self.__values_list[aggregation]
+            if function == "sum":
+                if self.__fixed_point_list[aggregation]:
+                    self.__values_list[aggregation] = current_value + value
+                else:
+                    compensated_value = value - self.__compensations_list[aggregation]
+                    new_value = current_value + compensated_value
+                    self.__compensations_list[aggregation] = new_value - current_value - compensated_value
+                    self.__values_list[aggregation] = new_value
+            elif function == "first":
+                if not self.__has_first_value_list[aggregation]:
+                    self.__values_list[aggregation] = value
+                    self.__has_first_value_list[aggregation] = True
+            elif current_value != current_value:
+                self.__values_list[aggregation] = value
+            elif function == "min":
+                self.__values_list[aggregation] = min(current_value, value)
+            elif function == "max":
+                self.__values_list[aggregation] = max(current_value, value)
+
+    def getValuesList(self) -> list:
+        """Return the aggregated values, in the order of the slicer aggregations."""
+        values_list = []
+        for aggregation, value in enumerate(self.__values_list):
+            if self.__fixed_point_list[aggregation]:
+                value = self.__fixed_point_converter.getFloatValue(value)
+            elif self.__functions_list[aggregation] == "sum":
+                value = float(value)
+            values_list.append(value)
+        return values_list
 
 
 class ExtratoKit(DataframesKitInterface):
@@ -141,180 +227,278 @@ class ExtratoKit(DataframesKitInterface):
         'DBKit' means a data gotten with an extra calculation effort of the generated class.
         """
         self.__operations_object = ExtratoOperations()
-        self.__columns_object = ExtratoColumns()
+        self.__columns_object = ExtratoColumns.getInstance()
+        self.__partition_executor = None
         super().__init__(self.__columns_object)
+
+    def _calculateEmptyResults(self) -> None:
+        """Method Overridden from 'DataframesKitInterface' class."""
+        super()._calculateEmptyResults()
         self.__addValuesToCalculatedColumns()
         self.formatDataframes()
 
-    def __addValuesToCalculatedColumns(self) -> None:
-        self.__setTotalPriceColumn()
-        self.__setTotalCostsColumn()
-        self.__setTotalEarningsColumn()
-        self.__setContributionsColumn()
-        self.__setRescuesColumn()
-        self.__setBuyPriceColumn()
-        self.__setSellPriceColumn()
-        self.__setSliceIndexColumn()
-        self.__setSliceTypeColumn()
-
-    def __setTotalPriceColumn(self) -> None:
-        # 'Total Price' = 'Quantity' * 'Unit Price'
-        self.multiplyTwoColumns(
-            self.__columns_object._quantity_col.getName(), 
-            self.__columns_object._unit_price_col.getName(),
-            self.__columns_object._total_price_col.getName(),
+    def __isSliceRequired(self) -> bool:
+        # The slices are found only if a slice column is in the columns projection
+        return (
+            self.isRequiredColumn(self.__columns_object._slice_index_col.getName()) or
+            self.isRequiredColumn(self.__columns_object._slice_type_col.getName())
         )
 
-    def __setTotalCostsColumn(self) -> None:
-        # 'Total Costs' = 'IR' + 'Taxes'
-        self.sumTwoColumns(
-            self.__columns_object._IR_col.getName(), 
-            self.__columns_object._taxes_col.getName(),
-            self.__columns_object._total_costs_col.getName(),
-        )
-
-    def __setTotalEarningsColumn(self) -> None:
-        # 'Total Earns' = 'Dividends' + 'JCP'
-        self.sumTwoColumns(
-            self.__columns_object._dividends_col.getName(),
-            self.__columns_object._JCP_col.getName(),
-            self.__columns_object._total_earnings_col.getName(),
-        )
-
-    def __copyTotalPriceToColumn(self, operation_name: str, operation_col_name: str) -> None:
-        # Copy the 'Total Price' data to the column 'operation_col_name', where:
-        # - the 'Operation' is equal to 'operation_name'
-        # - replace values in other conditions to 0 or NaN
-        operation_col = self.__columns_object._operation_col.getName()
-        total_price_col = self.__columns_object._total_price_col.getName()
-        self.copyColumnToColumn(total_price_col, operation_col_name)
-        self.replaceAllValuesInColumnExcept(operation_col_name, np.nan, operation_col, operation_name)
-
-    def __setContributionsColumn(self) -> None:
-        # Copy the 'Total Price' data to the column 'Contributions', where
-        # the column 'Operation' is equal to 'Contribution';
-        # Replace values in other conditions to 0 or NaN
-        self.__copyTotalPriceToColumn(
-            self.__operations_object.getContributionOperation(),
-            self.__columns_object._contributions_col.getName(),
-        )
-    
-    def __setRescuesColumn(self) -> None:
-        # Copy the 'Total Price' data to the column 'Rescues', where
-        # the column 'Operation' is equal to 'Rescue';
-        # Replace values in other conditions to 0 or NaN
-        self.__copyTotalPriceToColumn(
-            self.__operations_object.getRescueOperation(),
-            self.__columns_object._rescues_col.getName(),
-        )
-
-    def __setBuyPriceColumn(self) -> None:
-        # Copy the 'Total Price' data to the column 'Buy Price', where
-        # the column 'Operation' is equal to 'Buy';
-        # Replace values in other conditions to 0 or NaN
-        self.__copyTotalPriceToColumn(
-            self.__operations_object.getBuyOperation(),
-            self.__columns_object._buy_price_col.getName(),
-        )
+    def __addValuesToCalculatedColumns(self) -> None:
+        self.calculateFormulaColumns()
+        if self.__isSliceRequired():
+            self.__setSliceColumns()
+        else:
+            self.__new_closed_lines_index = pd.Index([])
 
-    def __setSellPriceColumn(self) -> None:
-        # Copy the 'Total Price' data to the column 'Sell Price', where
-        # the column 'Operation' is equal to 'Sell';
-        # Replace values in other conditions to 0 or NaN
-        self.__copyTotalPriceToColumn(
-            self.__operations_object.getSellOperation(),
-            self.__columns_object._sell_price_col.getName(),
-        )
+    @staticmethod
+    def _getSliceEndArrays(quantities_df: pd.DataFrame) -> tuple:
+        # Return the 'Closing Operation' and 'End of the ticker lines' arrays
+        # The 'quantities_df' columns are the ticker, the buy quantity and the sell quantity
+        ticker_values, buy_quantity, sell_quantity = [quantities_df.iloc[:, column] for column in range(3)]
+        buy_cumsum = buy_quantity.groupby(ticker_values, sort=False).cumsum()
+        sell_cumsum = sell_quantity.groupby(ticker_values, sort=False).cumsum()
+        closing_line = (buy_cumsum == sell_cumsum).to_numpy()
+        ticker_last_line = (ticker_values != ticker_values.shift(-1)).to_numpy()
+        return closing_line, ticker_last_line
 
-    def __setSliceIndexColumn(self) -> None:
-        # Run row-per-row in order to find 'slices'.
+    def __setSliceColumns(self) -> None:
+        # Find the 'slices' of all tickers in a single vectorized pass.
         # Slices are group of lines to create an 'Opened Position' or 'Closed Position'
         # 'Closed Positions' are identified by groups of lines that 'quantitiy_buy==quantity_sell'
         # 'Opened Positions' are the rest of them
-        
-        # Column variables       
+        #
+        # The lines are sorted per ticker (alphabetical order) and date. For each ticker, the buy
+        # and sell quantities are accumulated: a slice ends in the 'Closing Operation' line
+        # (cumulative buy == cumulative sell) or in the last line of the ticker. So, the slice
+        # index of a line is the number of slice ends found before it.
+
+        # Column variables
         ticker_col = self.__columns_object._ticker_col.getName()
         date_col = self.__columns_object._date_col.getName()
         quantity_col = self.__columns_object._quantity_col.getName()
         operation_col = self.__columns_object._operation_col.getName()
         slice_index_col = self.__columns_object._slice_index_col.getName()
-        
-        # Operation variables
-        buy_operation = self.__operations_object.getBuyOperation()
-        sell_operation = self.__operations_object.getSellOperation()
-        
-        # Non-duplicated ticker list
-        unique_ticker_list = self.getNonDuplicatedListFromColumn(ticker_col)
-        
-        # Prepare the dataframe
-        df = self._raw_df.copy()
-        df = df.fillna(0)
-        df = df.sort_values(by=date_col)
-        
-        # Iterate over the dataframe to identify the 'slices'
-        slice_index = 0
-        
-        for ticker in unique_ticker_list:
-            
-            df_filter_by_ticker = df.loc[df[ticker_col].isin([ticker])]
-            
-            # Iterate over each line of the filtered dataframe
-            buy_ticker_quantity = 0.0
-            sell_ticker_quantity = 0.0
-            checked_rows = 0
-            df_filter_by_ticker_max_rows = len(df_filter_by_ticker[date_col].to_list())
-            for index, df_line in df_filter_by_ticker.iterrows():
-                
-                # Buy and sell operations
-                if df_line[operation_col] == buy_operation:
-                    buy_ticker_quantity += df_line[quantity_col]
-                elif df_line[operation_col] == sell_operation:
-                    sell_ticker_quantity += df_line[quantity_col]
-                
-                # Set the slice index
-                df.at[index, slice_index_col] = slice_index
-                self._raw_df.at[index, slice_index_col] = slice_index
-                
-                # 'Closing Operation' or 'End of the filtered frame'
-                checked_rows += 1
-                if (buy_ticker_quantity == sell_ticker_quantity) or (checked_rows == df_filter_by_ticker_max_rows):
-                    slice_index += 1
-
-    def __setSliceTypeColumn(self) -> None:
-        # Column variables    
-        slice_index_col = self.__columns_object._slice_index_col.getName()
         slice_type_col = self.__columns_object._slice_type_col.getName()
+
+        # Position variables
+        position_type = InvestmentPositionType()
+        closed_position = position_type.getClosedPosition()
+        opened_position = position_type.getOpenedPosition()
+
+        # Prepare the dataframe: only lines with ticker, sorted by ticker and date
+        df = self._raw_df.loc[self._raw_df[ticker_col].notna(), [ticker_col, date_col, quantity_col, operation_col]]
+        df = df.sort_values(by=date_col, kind="mergesort")
+        df = df.sort_values(by=ticker_col, kind="mergesort")
+
+        # Cumulative buy and sell quantities per ticker
+        quantities_df = self.__getQuantitiesDataframe(df)
+
+        # 'Closing Operation' or 'End of the ticker lines'
+        # In parallel mode, each partition has whole tickers, so the partitions results are just concatenated
+        if self.__partition_executor is None:
+            slice_end_list = [ExtratoKit._getSliceEndArrays(quantities_df)]
+        else:
+            slice_end_list = self.__partition_executor.mapPartitions(
+                ExtratoKit._getSliceEndArrays,
+                self.__partition_executor.getPartitionsList(quantities_df, ticker_col),
+            )
+        closing_line = np.concatenate([closing_array for closing_array, ticker_last_array in slice_end_list])
+        ticker_last_line = np.concatenate([ticker_last_array for closing_array, ticker_last_array in slice_end_list])
+        slice_end = closing_line | ticker_last_line
+
+        # Slice index: number of slice ends before the line
+        # Slice type: the slice is closed when its last line is a 'Closing Operation'
+        slice_index = np.cumsum(slice_end) - slice_end
+        slice_closed = closing_line[slice_end][slice_index]
+
+        self._raw_df[slice_index_col] = pd.Series(slice_index, index=df.index, dtype=float)
+        self._raw_df[slice_type_col] = pd.Series(
+            np.where(slice_closed, closed_position, opened_position), index=df.index, dtype=object
+        )
+        self.__setTickersState(quantities_df, slice_index, slice_closed, ticker_last_line)
+
+    def __getQuantitiesDataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        # The ticker, the buy quantity and the sell quantity of each line
+        # In fixed-point mode, the quantities are scaled integers: the 'Closing Operation' check is exact
+        ticker_col = self.__columns_object._ticker_col.getName()
         quantity_col = self.__columns_object._quantity_col.getName()
         operation_col = self.__columns_object._operation_col.getName()
-        
-        # Operation variables
         buy_operation = self.__operations_object.getBuyOperation()
         sell_operation = self.__operations_object.getSellOperation()
-        
-        # Position variables
+
+        quantity = df[quantity_col].fillna(0).astype(float)
+        if self.isFixedPointMode():
+            quantity = self.getFixedPointConverter().getFixedPointSeries(quantity)
+        return pd.DataFrame({
+            ticker_col: df[ticker_col],
+            buy_operation: quantity.where(df[operation_col] == buy_operation, 0),
+            sell_operation: quantity.where(df[operation_col] == sell_operation, 0),
+        })
+
+    def __setTickersState(
+        self,
+        quantities_df: pd.DataFrame,
+        slice_index: np.ndarray,
+        slice_closed: np.ndarray,
+        ticker_last_line: np.ndarray,
+    ) -> None:
+        # Running state of each ticker, used by 'appendDataframe':
+        # (cumulative buy, buy compensation, cumulative sell, sell compensation, open slice index, open slice lines)
+        # The open slice index is None when the last slice of the ticker is closed
+        # The states are tuples: they are shared with the cached results, and replaced (not changed) by 'appendDataframe'
+        self.__tickers_state_dict = {}
+        self.__tickers_state_fixed_point = self.isFixedPointMode()
+        self.__next_slice_index = int(slice_index[-1]) + 1 if len(slice_index) else 0
+        self.__new_closed_lines_index = pd.Index([])
+
+        ticker_col, buy_col, sell_col = quantities_df.columns
+        cumulative_df = quantities_df.groupby(ticker_col, sort=False)[[buy_col, sell_col]].sum()
+        open_lines = ~slice_closed
+        open_lines_dict = pd.Series(quantities_df.index[open_lines]).groupby(slice_index[open_lines]).agg(list)
+        for ticker, last_slice_index, last_slice_closed in zip(
+            quantities_df[ticker_col].to_numpy()[ticker_last_line],
+            slice_index[ticker_last_line],
+            slice_closed[ticker_last_line],
+        ):
+            self.__tickers_state_dict[ticker] = (
+                cumulative_df.at[ticker, buy_col],
+                0.0,
+                cumulative_df.at[ticker, sell_col],
+                0.0,
+                None if last_slice_closed else last_slice_index,
+                () if last_slice_closed else tuple(open_lines_dict[last_slice_index]),
+            )
+
+    def __addQuantity(self, cumulative_quantity, compensation: float, quantity) -> tuple:
+        # Compensated (Kahan) cumulative sum, as in the Pandas 'groupby'
+        # The scaled integers are summed as Python integers: the appended lines can not wrap around the 'int64' range
+        if self.__tickers_state_fixed_point:
+            return int(cumulative_quantity) + int(quantity), compensation
+        compensated_quantity = quantity - compensation
+        new_quantity = cumulative_quantity + compensated_quantity
+        return new_quantity, new_quantity - cumulative_quantity - compensated_quantity
+
+    def __appendSliceColumns(self, new_df: pd.DataFrame) -> list:
+        # Extend the open slices (or open new ones) with the new lines, from the running state of each ticker
+        # Return the lines of the slices closed by the new lines
+        ticker_col = self.__columns_object._ticker_col.getName()
+        date_col = self.__columns_object._date_col.getName()
+        slice_index_col = self.__columns_object._slice_index_col.getName()
+        slice_type_col = self.__columns_object._slice_type_col.getName()
         position_type = InvestmentPositionType()
-        closed_position = position_type.getClosedPosition()
-        opened_position = position_type.getOpenedPosition()
+
+        df = new_df.loc[new_df[ticker_col].notna()].sort_values(by=date_col, kind="mergesort")
+        if self.isFixedPointMode() != self.__tickers_state_fixed_point:
+            raise ValueError("The fixed-point mode changed after the last 'setDataframe'.")
+        quantities_df = self.__getQuantitiesDataframe(df)
+
+        # The tickers of the new lines are changed in lists, then put back as tuples in a new dict
+        changed_states_dict = {}
+        slice_index_list = []
+        closed_lines_list = []
+        for line, ticker, buy_quantity, sell_quantity in zip(
+            quantities_df.index, *[quantities_df.iloc[:, column].to_list() for column in range(3)]
+        ):
+            if ticker not in changed_states_dict:
+                state = self.__tickers_state_dict.get(ticker, (0, 0.0, 0, 0.0, None, ()))
+                changed_states_dict[ticker] = list(state[:5]) + [list(state[5])]
+            state = changed_states_dict[ticker]
+            state[0], state[1] = self.__addQuantity(state[0], state[1], buy_quantity)
+            state[2], state[3] = self.__addQuantity(state[2], state[3], sell_quantity)
+            if state[4] is None:
+                state[4] = self.__next_slice_index
+                self.__next_slice_index += 1
+            slice_index_list.append(state[4])
+            state[5].append(line)
+
+            # 'Closing Operation': the next line of the ticker opens a new slice
+            if state[0] == state[2]:
+                closed_lines_list.extend(state[5])
+                state[4] = None
+                state[5] = []
+
+        tickers_state_dict = dict(self.__tickers_state_dict)
+        for ticker, state in changed_states_dict.items():
+            tickers_state_dict[ticker] = tuple(state[:5]) + (tuple(state[5]),)
+        self.__tickers_state_dict = tickers_state_dict
+
+        new_df[slice_index_col] = pd.Series(slice_index_list, index=df.index, dtype=float)
+        new_df[slice_type_col] = pd.Series(position_type.getOpenedPosition(), index=df.index, dtype=object)
+        return closed_lines_list
+
+    def setParallelMode(self, enabled: bool, max_workers: int = None) -> None:
+        """Enable or disable the parallel mode, where the slices of different tickers are found in a process pool.
+        
+        It is worth only for large Extrato dataframes (see 'PartitionExecutor'). It takes effect in the next 'setDataframe'.
         
-        # Iterate over the slices
-        slice_index_list = self.getNonDuplicatedListFromColumn(slice_index_col)
-        for slice_index in slice_index_list:
-            
-            df_filtered_by_slice_index = self._raw_df.loc[self._raw_df[slice_index_col].isin([slice_index])]
-            
-            df_filtered_by_buy = df_filtered_by_slice_index.loc[df_filtered_by_slice_index[operation_col].isin([buy_operation])]
-            buy_ticker_quantity = df_filtered_by_buy[quantity_col].sum()
-            
-            df_filtered_by_sell = df_filtered_by_slice_index.loc[df_filtered_by_slice_index[operation_col].isin([sell_operation])]
-            sell_ticker_quantity = df_filtered_by_sell[quantity_col].sum()
-            
-            if buy_ticker_quantity == sell_ticker_quantity:
-                self._raw_df.loc[self._raw_df[slice_index_col] == slice_index, [slice_type_col]] = closed_position
-            else:
-                self._raw_df.loc[self._raw_df[slice_index_col] == slice_index, [slice_type_col]] = opened_position
+        Args:
+        - enabled (bool): True to use the parallel mode
+        - max_workers (int): number of worker processes (all cores if None)
+        """
+        self.__partition_executor = PartitionExecutor(max_workers) if enabled else None
+
+    def getPartitionExecutor(self) -> PartitionExecutor:
+        """Return the 'PartitionExecutor' of the parallel mode, or None if it is disabled."""
+        return self.__partition_executor
 
     def setDataframe(self, dataframe: pd.DataFrame) -> None:
         """Method Overridden from 'ExtratoDataframesKitInterface' class."""
-        self._raw_df = self.addColumnIfNotExists(dataframe)
+        self._setDatasetSource(dataframe)
+        if self._loadCachedResults():
+            return
+        self._raw_df = self.addColumnIfNotExists(self._getProjectedDataframe(dataframe))
         self.__addValuesToCalculatedColumns()
         self.formatDataframes()
+        self._saveCachedResults()
+
+    def _getResultsDict(self) -> dict:
+        """Method Overridden from 'DataframesKitInterface' class."""
+        # The tickers state is not changed in place (see '__setTickersState'), so it is not copied
+        results_dict = super()._getResultsDict()
+        results_dict["tickers_state_dict"] = self.__tickers_state_dict
+        results_dict["tickers_state_fixed_point"] = self.__tickers_state_fixed_point
+        results_dict["next_slice_index"] = self.__next_slice_index
+        results_dict["new_closed_lines_index"] = self.__new_closed_lines_index
+        return results_dict
+
+    def _setResultsDict(self, results_dict: dict) -> None:
+        """Method Overridden from 'DataframesKitInterface' class."""
+        super()._setResultsDict(results_dict)
+        self.__tickers_state_dict = results_dict["tickers_state_dict"]
+        self.__tickers_state_fixed_point = results_dict["tickers_state_fixed_point"]
+        self.__next_slice_index = results_dict["next_slice_index"]
+        self.__new_closed_lines_index = results_dict["new_closed_lines_index"]
+
+    def appendDataframe(self, dataframe: pd.DataFrame) -> None:
+        """Append new Extrato lines, calculating and formatting only them.
+        
+        The Extrato grows by appending operations at the end: the new lines must not be older than the
+        lines of the same ticker already in the dataframe. The slices are extended (or new ones are opened)
+        from the running state of each ticker, so the cost is proportional to the new lines and to the
+        open slices they close.
+        
+        The new slices get the next slice indexes, so they are not in the ticker order of 'setDataframe'.
+        In floating-point mode, the quantities accumulated before the call are not compensated: use the
+        fixed-point mode for exact 'Closing Operation' checks.
+        """
+        slice_type_col = self.__columns_object._slice_type_col.getName()
+        closed_position = InvestmentPositionType().getClosedPosition()
+        last_line = self._getRawIndexMaximum()
+        first_line = 0 if last_line is None else int(last_line) + 1
+        new_df = self.getCalculatedDataframe(dataframe)
+        new_df.index = pd.RangeIndex(first_line, first_line + len(new_df))
+        closed_lines_list = self.__appendSliceColumns(new_df) if self.__isSliceRequired() else []
+        self.__new_closed_lines_index = pd.Index(closed_lines_list)
+
+        # The closed lines are changed in the new lines, or in a copy of the older lines (which are not copied)
+        changed_lines_df = None
+        if closed_lines_list:
+            new_df.loc[self.__new_closed_lines_index.intersection(new_df.index), slice_type_col] = closed_position
+            changed_lines_df = self._getRawLines(self.__new_closed_lines_index.difference(new_df.index))
+            changed_lines_df[slice_type_col] = closed_position
+        self._appendRawLines(new_df, changed_lines_df)
+
+    def getNewClosedLinesIndex(self) -> pd.Index:
+        """Return the lines of the slices closed by the last 'appendDataframe'."""
+        return self.__new_closed_lines_index.copy()
@@ -7,25 +7,31 @@ from extrato.lib.extrato_dataframes_kit import ExtratoKit
 
 
 class ExtratoFilter(FilterInterface):
-    def __init__(self) -> None:
+    def __init__(self, columns_list: list = None) -> None:
         """Structure to apply filters based on Extrato objects.
         
         Args:
-        - columns_object: any object instance inherited from 'ColumnsInterface'
-        - df_interface_object: any object instance inherited from 'DataframesKitInterface'
+        - columns_list (list): columns needed by the filters and the page (see 'ExtratoKit.setColumnsProjection');
+        all the columns if None
         """
-        self.__columns_object = ExtratoColumns()
+        self.__columns_object = ExtratoColumns.getInstance()
         self.__df_interface_object = ExtratoKit()
+        self.__df_interface_object.setColumnsProjection(columns_list)
         super().__init__(self.__df_interface_object, self.__columns_object)
     
     def applyOperationFilter(self, operation: str) -> None:
         column = self.__columns_object._operation_col.getName()
         if operation != "Exibir todas":
-            self._filtered_df = self._filtered_df.loc[self._filtered_df[column] == operation]
-            self._filtered_fmtdf = self._filtered_fmtdf.loc[self._filtered_fmtdf[column] == operation]
+            self.applyCategoryFilter(column, [operation])
+    
+    def applySearchFilter(self, query: str) -> None:
+        """Keep only the lines with all the words of the 'query' in the 'Notas' or 'Ticker' columns."""
+        self.applyTextSearchFilter(self.getSearchColumnsList(), query)
+
+    def getSearchColumnsList(self) -> list:
+        return [self.__columns_object._notes_col.getName(), self.__columns_object._ticker_col.getName()]
     
     def applyDateFilter(self, start_date: pd.Timestamp, end_date: pd.Timestamp) -> None:
         column = self.__columns_object._date_col.getName()
         if start_date and end_date:
-            self._filtered_df = self._filtered_df.loc[(start_date <= self._filtered_df[column]) & (self._filtered_df[column] <= end_date)]
-            self._filtered_fmtdf = self._filtered_fmtdf.loc[(start_date <= self._filtered_fmtdf[column]) & (self._filtered_fmtdf[column] <= end_date)]
+            self.applyDateRangeFilter(column, start_date, end_date)
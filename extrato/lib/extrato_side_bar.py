@@ -1,6 +1,9 @@
 import pandas as pd
 import streamlit as st
 
+from common.facet_selector import FacetSelector
+from common.filter import FilterInterface
+
 from extrato.lib.extrato_columns import ExtratoColumns
 from extrato.lib.extrato_filter import ExtratoFilter
 
@@ -12,43 +15,74 @@ class ExtratoSideBar:
         ticker_filter = True,
         operation_filter = True,
         period_filter = True,
+        search_filter = False,
+        columns_list: list = None,
+        key_prefix: str = "extrato_side_bar",
     ) -> None:
-        """Structure to draw an 'Extrato Filter' Side Bar."""
-        self.__columns_object = ExtratoColumns()
-        self.__filter_object = ExtratoFilter()
+        """Structure to draw an 'Extrato Filter' Side Bar.
+        
+        Args:
+        - search_filter (bool): show a search box for words in the 'Notas' and 'Ticker' columns
+        - columns_list (list): columns needed by the page; the columns of the enabled filters are added to them.
+        If None, all the Extrato columns are calculated.
+        - key_prefix (str): prefix of the widgets keys; each page using this Side Bar gives its own prefix,
+        so the filters selected in a page are not taken by the other pages
+        """
+        self.__columns_object = ExtratoColumns.getInstance()
+        self.__key_prefix = key_prefix
         self.__market_filter = market_filter
         self.__ticker_filter = ticker_filter
         self.__operation_filter = operation_filter
         self.__period_filter = period_filter
+        self.__search_filter = search_filter
+        self.__filter_object = ExtratoFilter(self.__getProjectionColumnsList(columns_list))
+
+    def __getProjectionColumnsList(self, columns_list: list) -> list:
+        if columns_list is None:
+            return None
+        filters_columns_dict = {
+            self.__columns_object._market_col.getName(): self.__market_filter,
+            self.__columns_object._ticker_col.getName(): self.__ticker_filter,
+            self.__columns_object._operation_col.getName(): self.__operation_filter,
+            self.__columns_object._date_col.getName(): self.__period_filter,
+        }
+        projection_columns_list = list(columns_list) + [column for column, enabled in filters_columns_dict.items() if enabled]
+        if self.__search_filter:
+            projection_columns_list.extend([
+                self.__columns_object._notes_col.getName(),
+                self.__columns_object._ticker_col.getName(),
+            ])
+        return projection_columns_list
     
     def __showSubHearder(self) -> None:
         st.sidebar.subheader('Filtros')
-    
+
     def __showMarketFilter(self) -> list:
         column = self.__columns_object._market_col.getName()
-        market_default_series = self.__filter_object.getDataframe()[column].drop_duplicates()
-        market_list_filter = st.sidebar.multiselect('Mercado:', market_default_series.sort_values())
+        market_facets_dict = self.__filter_object.getFacetsDict(column)
+        market_list_filter = FacetSelector(self.__key_prefix + "_market").showMultiselect('Mercado:', market_facets_dict)
         self.__filter_object.applyMarketFilter(market_list_filter)
 
     def __showTickerFilter(self) -> str:
         column = self.__columns_object._ticker_col.getName()
-        ticker_default_list = ["Exibir todos"]
-        ticker_default_list.extend(self.__filter_object.getDataframe()[column].drop_duplicates().sort_values())
-        ticker_filter = st.sidebar.selectbox('Ticker:', ticker_default_list)
+        ticker_facets_dict = self.__filter_object.getFacetsDict(column)
+        ticker_filter = FacetSelector(self.__key_prefix + "_ticker").showSelectbox('Ticker:', ticker_facets_dict, "Exibir todos")
         self.__filter_object.applyTickerFilter(ticker_filter)
 
     def __showOperationFilter(self) -> str:
         column = self.__columns_object._operation_col.getName()
-        op_default_list = ["Exibir todas"]
-        op_default_list.extend(self.__filter_object.getDataframe()[column].drop_duplicates().sort_values())
-        operation_filter = st.sidebar.selectbox('Operação:', op_default_list)
+        operation_facets_dict = self.__filter_object.getFacetsDict(column)
+        operation_filter = FacetSelector(self.__key_prefix + "_operation").showSelectbox('Operação:', operation_facets_dict, "Exibir todas")
         self.__filter_object.applyOperationFilter(operation_filter)
     
+    def __showSearchFilter(self) -> str:
+        search_query = st.sidebar.text_input('Buscar em Notas e Ticker:')
+        self.__filter_object.applySearchFilter(search_query)
+    
     def __showPeriodFilter(self) -> tuple:
         column = self.__columns_object._date_col.getName()
-        start_date = self.__filter_object.getDataframe()[column].min()
-        end_date = self.__filter_object.getDataframe()[column].max()
-        if self.__filter_object.getDataframe().empty:
+        start_date, end_date = self.__filter_object.getDateBounds(column)
+        if self.__filter_object.isEmpty():
             date_option = st.sidebar.slider('Período:', disabled=True)
             init_date = None
             finish_date = None
@@ -70,6 +104,8 @@ class ExtratoSideBar:
             self.__showTickerFilter()
         if self.__operation_filter:
             self.__showOperationFilter()
+        if self.__search_filter:
+            self.__showSearchFilter()
         if self.__period_filter:
             self.__showPeriodFilter()
     
@@ -77,8 +113,15 @@ class ExtratoSideBar:
         self.__filter_object.updateDataframe(dataframe)
         self.__showSideBar()
     
+    def getFilterObject(self) -> FilterInterface:
+        """Return the filter with the lines selected in the Side Bar, such as for a 'TableView'."""
+        return self.__filter_object
+
     def getFilteredDataframe(self) -> pd.DataFrame:
-        return self.__filter_object.getDataframe().copy()
+        return self.__filter_object.getDataframe()
+
+    def getFilteredVersion(self) -> tuple:
+        return self.__filter_object.getFilteredVersion()
     
     def getFilteredFormattedDataframe(self) -> pd.DataFrame:
-        return self.__filter_object.getFormattedDataframe().copy()
+        return self.__filter_object.getFormattedDataframe()
@@ -3,7 +3,6 @@ import pandas as pd
 from common.formatter import SingleFormatter
 
 from extrato.lib.extrato_columns import ExtratoColumns
-from extrato.lib.extrato_dataframes_kit import ExtratoKit
 
 
 class StatisticsCell:
@@ -70,11 +69,12 @@ class StatisticsInterface:
         self.__initDataframes()
 
     def __initColumnVariables(self) -> None:
-        columns_object = ExtratoColumns()
+        columns_object = ExtratoColumns.getInstance()
         self.__date_column = columns_object._date_col.getName()
 
     def __initDataframes(self) -> None:
-        self.__input_dataframe = ExtratoKit().getNotNanDataframe()
+        # No lines until 'setDataframe'
+        self.__input_dataframe = pd.DataFrame(columns=self.getColumnsList())
         self.__output_dataframe = self.__getResultDataframe()
 
     def __getResultDataframe(self) -> pd.DataFrame:
@@ -109,6 +109,10 @@ class StatisticsInterface:
     def getDeltaOperationString(self) -> str:
         return self.__getFormattedString(self.__statistics.getDeltaSum(), self.__statistics.getDeltaCount())
 
+    def getColumnsList(self) -> list:
+        """Return the columns used by the statistics."""
+        return [self.__date_column, self.__pos_operation, self.__neg_operation]
+
     def getResultDataframe(self) -> pd.DataFrame:
         return self.__output_dataframe.copy()
 
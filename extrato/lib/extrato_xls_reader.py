@@ -1,13 +1,102 @@
+import openpyxl
 import pandas as pd
 
+from extrato.lib.extrato_corporate_events import CorporateEventsAdjuster, CorporateEventsColumns
 from extrato.lib.extrato_dataframes_kit import ExtratoKit
 
 
 class ExtratoExcelReader(ExtratoKit):
     def __init__(self) -> None:
-        """Structure used to read Excel files related to Extrato."""
+        """Structure used to read Excel files related to Extrato.
+        
+        The Extrato is read from the first sheet of the file. The corporate events are read from the
+        'Eventos' sheet (when it exists) or from the file set by 'setCorporateEventsFile', and the
+        Extrato quantities and unit prices are adjusted to them before any calculation.
+        """
         super().__init__()
+        self.__events_columns = CorporateEventsColumns.getInstance()
+        self.__events_adjuster = CorporateEventsAdjuster()
+        self.__events_file = None
+
+    def setCorporateEventsFile(self, file) -> None:
+        """Set the Excel file with the corporate events, used instead of the 'Eventos' sheet."""
+        self.__events_file = file
+
+    def __readCorporateEventsDataframe(self, excel_file: pd.ExcelFile) -> pd.DataFrame:
+        if self.__events_file is not None:
+            events_df = pd.read_excel(self.__events_file)
+        elif self.__events_columns.getSheetName() in excel_file.sheet_names:
+            events_df = excel_file.parse(self.__events_columns.getSheetName())
+        else:
+            events_df = pd.DataFrame()
+        return events_df.reindex(columns=self.__events_columns.getColumnsNameList())
+
+    def getCorporateEventsDataframe(self) -> pd.DataFrame:
+        return self.__events_adjuster.getEventsDataframe()
+
+    def __getUsedColumnsSet(self) -> set:
+        # The required columns (see 'setColumnsProjection') and the columns used to adjust them to the events
+        # None if there is no columns projection: all the columns are read
+        if not self.isColumnsProjection():
+            return None
+        extrato_columns = self.getColumnsObject()
+        used_columns_set = set(self.getRequiredColumnsList())
+        used_columns_set.update([extrato_columns._date_col.getName(), extrato_columns._ticker_col.getName()])
+        return used_columns_set
 
     def readExcelFile(self, file: str) -> None:
-        self._raw_df = self.addColumnIfNotExists(pd.read_excel(file))
+        """Read the Extrato file. With a columns projection, only the required columns are read."""
+        used_columns_set = self.__getUsedColumnsSet()
+        usecols = None if used_columns_set is None else lambda column: column in used_columns_set
+        with pd.ExcelFile(file) as excel_file:
+            extrato_df = excel_file.parse(0, usecols=usecols)
+            self.__events_adjuster.setEventsDataframe(self.__readCorporateEventsDataframe(excel_file))
+        self._raw_df = self.addColumnIfNotExists(self.__events_adjuster.getAdjustedDataframe(extrato_df))
+        self._setDatasetSource(self._raw_df)
         self.formatDataframes()
+
+    def __getSheetRowsDataframe(self, header: tuple, rows_list: list) -> pd.DataFrame:
+        return pd.DataFrame(rows_list, columns=list(header)).infer_objects()
+
+    def readExcelFileChunks(self, file: str, chunk_size: int = 10000):
+        """Read the Extrato file as a generator of raw dataframes with up to 'chunk_size' lines.
+        
+        The sheet is read in 'read_only' mode, so only one chunk is kept in memory. The chunks are
+        adjusted to the corporate events, but the formula and slice columns are not calculated.
+        The kit dataframes are not changed.
+        """
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        try:
+            # Corporate events: the table is small, so it is fully read before the Extrato lines
+            events_sheet_name = self.__events_columns.getSheetName()
+            if self.__events_file is not None:
+                events_df = pd.read_excel(self.__events_file)
+            elif events_sheet_name in workbook.sheetnames:
+                events_rows = workbook[events_sheet_name].iter_rows(values_only=True)
+                events_df = self.__getSheetRowsDataframe(next(events_rows, ()), list(events_rows))
+            else:
+                events_df = pd.DataFrame()
+            self.__events_adjuster.setEventsDataframe(
+                events_df.reindex(columns=self.__events_columns.getColumnsNameList())
+            )
+
+            # With a columns projection, only the cells of the used columns are kept
+            extrato_rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(extrato_rows, ())
+            used_columns_set = self.__getUsedColumnsSet()
+            if used_columns_set is not None:
+                used_positions_list = [position for position, column in enumerate(header) if column in used_columns_set]
+                header = tuple(header[position] for position in used_positions_list)
+                extrato_rows = (tuple(row[position] for position in used_positions_list) for row in extrato_rows)
+            rows_list = []
+            for row in extrato_rows:
+                rows_list.append(row)
+                if len(rows_list) == chunk_size:
+                    chunk_df = self.__getSheetRowsDataframe(header, rows_list)
+                    yield self.addColumnIfNotExists(self.__events_adjuster.getAdjustedDataframe(chunk_df))
+                    rows_list = []
+            if rows_list:
+                chunk_df = self.__getSheetRowsDataframe(header, rows_list)
+                yield self.addColumnIfNotExists(self.__events_adjuster.getAdjustedDataframe(chunk_df))
+        finally:
+            workbook.close()
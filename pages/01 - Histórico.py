@@ -1,6 +1,9 @@
 import pandas as pd
 import streamlit as st
 
+from common.filter import FilterInterface
+from common.table_view_gui import TableViewGUI
+
 from extrato.lib.extrato_columns import ExtratoColumns
 from extrato.lib.extrato_dataframes_kit import ExtratoKit
 from extrato.lib.extrato_side_bar import ExtratoSideBar
@@ -9,11 +12,14 @@ from extrato.lib.extrato_side_bar import ExtratoSideBar
 class ExtratoRawTableInfo:
     def __init__(self) -> None:
         """Structure used to show an interactive table related to the 'Extrato'."""
-        self.__filtered_fmtdf = ExtratoKit().getFormattedDataframe()
+        self.__extrato_kit = ExtratoKit()
+        self.__filter_object = None
+        self.__table_view_gui = TableViewGUI("extrato_table_view", self.__extrato_kit)
+        self.__hidden_columns_key = "extrato_hidden_columns"
         self.__hideColumns()
 
     def __hideColumns(self):
-        extrato_columns = ExtratoColumns()
+        extrato_columns = ExtratoColumns.getInstance()
         self.__columns_list = extrato_columns.getColumnsNameList()
         self.__columns_list.remove(extrato_columns._contributions_col.getName())
         self.__columns_list.remove(extrato_columns._rescues_col.getName())
@@ -25,19 +31,19 @@ class ExtratoRawTableInfo:
     def __showMainTitle(self) -> None:
         st.write('#### Histórico de transações')
     
+    def getColumnsList(self) -> list:
+        """Return the columns displayed in the table: the hidden columns are not even calculated."""
+        columns_not_displayed = st.session_state.get(self.__hidden_columns_key, [])
+        return [column for column in self.__columns_list if column not in columns_not_displayed]
+
     def __showColumnsViewer(self):
-        # First columns filter to limit the columns displayed
-        self.__filtered_fmtdf = self.__filtered_fmtdf[self.__columns_list]
-        
         # Additional columns filter that works according to the user selection
-        columns_not_displayed = st.multiselect('Ocultar colunas:', self.__columns_list)
-        if columns_not_displayed:
-            if not self.__filtered_fmtdf.empty:
-                columns_displayed = [column for column in self.__columns_list if column not in columns_not_displayed]
-                self.__filtered_fmtdf = self.__filtered_fmtdf[columns_displayed]
+        # The selection of the last rerun was already used by 'getColumnsList', so it is the same one
+        st.multiselect('Ocultar colunas:', self.__columns_list, key=self.__hidden_columns_key)
     
     def __showDataframe(self) -> None:
-        st.write("", self.__filtered_fmtdf.astype(str))
+        # Only the displayed page and columns are read and formatted
+        self.__table_view_gui.showFilteredLines(self.__filter_object, self.getColumnsList())
         expander = st.expander("Informações:")
         expander.write(
             """A tabela acima é uma cópia da planilha __Extrato__, incluindo todas as transações
@@ -45,8 +51,9 @@ class ExtratoRawTableInfo:
             """
         )
 
-    def setDataframe(self, dataframe: pd.DataFrame) -> None:
-        self.__filtered_fmtdf = dataframe
+    def setFilter(self, filter_object: FilterInterface) -> None:
+        """Set the filter with the lines to be shown (see 'TableView.setFilter')."""
+        self.__filter_object = filter_object
     
     def showInfo(self) -> None:
         self.__showMainTitle()
@@ -57,12 +64,12 @@ class ExtratoRawTableInfo:
 class ExtratoHistoryGUI:
     def __init__(self) -> None:
         """Structure used to show tables and filters related to Extrato."""
-        self.__side_bar = ExtratoSideBar()
         self.__table = ExtratoRawTableInfo()
+        self.__side_bar = ExtratoSideBar(search_filter=True, columns_list=self.__table.getColumnsList(), key_prefix="history_side_bar")
         self.__setDataframes()
 
     def __setDataframes(self) -> None:
-        self.__table.setDataframe(self.__side_bar.getFilteredFormattedDataframe())
+        self.__table.setFilter(self.__side_bar.getFilterObject())
 
     def setDataframe(self, dataframe: pd.DataFrame) -> None:
         self.__side_bar.updateDataframe(dataframe)
@@ -15,12 +15,15 @@ class ExtratoAccountInfo:
         - column 'Transferência': positive values (put money in the account)
         - column 'Resgate': negative values (take money out the account)
         """
-        self.__columns_object = ExtratoColumns()
+        self.__columns_object = ExtratoColumns.getInstance()
         self.__statistics = StatisticsInterface(
             self.__columns_object._contributions_col.getName(),
             self.__columns_object._rescues_col.getName(),
         )
 
+    def getColumnsList(self) -> list:
+        return self.__statistics.getColumnsList()
+
     def setDataframe(self, dataframe: pd.DataFrame) -> None:
         self.__statistics.setDataframe(dataframe)
     
@@ -41,8 +44,15 @@ class ExtratoAccountInfo:
 class ExtratoAccountsGUI:
     def __init__(self) -> None:
         """Structure used to show data, graphs and filters related to Extrato."""
-        self.__side_bar = ExtratoSideBar(market_filter=False, ticker_filter=False, operation_filter=False)
+        # Only the columns used by the chart are calculated
         self.__account_info = ExtratoAccountInfo()
+        self.__side_bar = ExtratoSideBar(
+            market_filter=False,
+            ticker_filter=False,
+            operation_filter=False,
+            columns_list=self.__account_info.getColumnsList(),
+            key_prefix="accounts_side_bar",
+        )
         self.__setDataframes()
 
     def __setDataframes(self) -> None:
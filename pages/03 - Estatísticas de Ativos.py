@@ -15,12 +15,15 @@ class ExtratoAssetsInfo:
         - column 'Venda': positive values (put money in the account)
         - column 'Compra': negative values (take money out the account)
         """
-        self.__columns_object = ExtratoColumns()
+        self.__columns_object = ExtratoColumns.getInstance()
         self.__statistics = StatisticsInterface(
             self.__columns_object._sell_price_col.getName(),
             self.__columns_object._buy_price_col.getName(),
         )
         
+    def getColumnsList(self) -> list:
+        return self.__statistics.getColumnsList()
+
     def setDataframe(self, dataframe: pd.DataFrame) -> None:
         self.__statistics.setDataframe(dataframe)
     
@@ -46,12 +49,15 @@ class ExtratoEarnsCostsInfo:
         - column 'Proventos Totais': positive values (put money in the account)
         - column 'Custo Total': negative values (take money out the account)
         """
-        self.__columns_object = ExtratoColumns()
+        self.__columns_object = ExtratoColumns.getInstance()
         self.__statistics = StatisticsInterface(
             self.__columns_object._total_earnings_col.getName(),
             self.__columns_object._total_costs_col.getName(),
         )
         
+    def getColumnsList(self) -> list:
+        return self.__statistics.getColumnsList()
+
     def setDataframe(self, dataframe: pd.DataFrame) -> None:
         self.__statistics.setDataframe(dataframe)
     
@@ -71,9 +77,14 @@ class ExtratoEarnsCostsInfo:
 class ExtratoStatisticsGUI:
     def __init__(self) -> None:
         """Structure used to show data, graphs and filters related to Extrato."""
-        self.__side_bar = ExtratoSideBar(operation_filter=False)
+        # Only the columns used by the charts are calculated
         self.__assets_info = ExtratoAssetsInfo()
         self.__earns_costs_info = ExtratoEarnsCostsInfo()
+        self.__side_bar = ExtratoSideBar(
+            operation_filter=False,
+            columns_list=self.__assets_info.getColumnsList() + self.__earns_costs_info.getColumnsList(),
+            key_prefix="statistics_side_bar",
+        )
         self.__setDataframes()
 
     def __setDataframes(self) -> None:
@@ -1,29 +1,34 @@
 import pandas as pd
 import streamlit as st
 
+from common.filter import FilterInterface
+from common.table_view_gui import TableViewGUI
+
 from positions.lib.closed_columns import ClosedPositionColumns
 from positions.lib.closed_dataframes_kit import ClosedPositionKit
 from positions.lib.closed_side_bar import ClosedPositionSideBar
 
+from Home import SessionStateControl
+
 
 class ClosedPositionsTableInfo:
     def __init__(self) -> None:
         """Structure used to show an interactive table related to the 'Closed Positions'."""
-        self.__filtered_fmtdf = ClosedPositionKit().getFormattedDataframe()
-        self.__columns_list = ClosedPositionColumns().getColumnsNameList()
+        self.__positions_kit = ClosedPositionKit()
+        self.__filter_object = None
+        self.__table_view_gui = TableViewGUI("closed_positions_table_view", self.__positions_kit)
+        self.__columns_list = ClosedPositionColumns.getInstance().getColumnsNameList()
 
     def __showMainTitle(self) -> None:
         st.write('#### Histórico de posições encerradas')
 
-    def __showColumnsViewer(self):
+    def __showColumnsViewer(self) -> list:
         columns_not_displayed = st.multiselect('Ocultar colunas:', self.__columns_list)
-        if columns_not_displayed:
-            if not self.__filtered_fmtdf.empty:
-                columns_displayed = [column for column in self.__columns_list if column not in columns_not_displayed]
-                self.__filtered_fmtdf = self.__filtered_fmtdf[columns_displayed]
+        return [column for column in self.__columns_list if column not in columns_not_displayed]
 
-    def __showDataframe(self) -> None:
-        st.write("", self.__filtered_fmtdf.astype(str))
+    def __showDataframe(self, columns_list: list) -> None:
+        # Only the displayed page and columns are read and formatted
+        self.__table_view_gui.showFilteredLines(self.__filter_object, columns_list)
         expander = st.expander("Informações:")
         expander.write("""A tabela acima mostra todas as __Posições Encerradas__ registradas na planilha __Extrato__.
             As  __Posições Encerradas__ são identificadas a partir das colunas __Ticker__ e __Quantidade__,
@@ -35,13 +40,13 @@ class ClosedPositionsTableInfo:
             """
         )
 
-    def setDataframe(self, dataframe: pd.DataFrame) -> None:
-        self.__filtered_fmtdf = dataframe
+    def setFilter(self, filter_object: FilterInterface) -> None:
+        """Set the filter with the lines to be shown (see 'TableView.setFilter')."""
+        self.__filter_object = filter_object
     
     def showInfo(self) -> None:
         self.__showMainTitle()
-        self.__showColumnsViewer()
-        self.__showDataframe()
+        self.__showDataframe(self.__showColumnsViewer())
 
 
 class ClosedPositionGUI:
@@ -52,7 +57,7 @@ class ClosedPositionGUI:
         self.__setDataframes()
 
     def __setDataframes(self) -> None:
-        self.__table.setDataframe(self.__side_bar.getFilteredFormattedDataframe())
+        self.__table.setFilter(self.__side_bar.getFilterObject())
 
     def setDataframe(self, dataframe: pd.DataFrame) -> None:
         self.__side_bar.updateDataframe(dataframe)
@@ -61,4 +66,4 @@ class ClosedPositionGUI:
 
 
 closed_position_gui = ClosedPositionGUI()
-closed_position_gui.setDataframe(st.session_state.closed_positions_dataframe)
+closed_position_gui.setDataframe(SessionStateControl().getClosedPositionsDataframe())
@@ -0,0 +1,68 @@
+import pandas as pd
+import streamlit as st
+
+from common.filter import FilterInterface
+from common.table_view_gui import TableViewGUI
+
+from positions.lib.open_columns import OpenPositionColumns
+from positions.lib.open_dataframes_kit import OpenPositionKit
+from positions.lib.open_side_bar import OpenPositionSideBar
+
+from Home import SessionStateControl
+
+
+class OpenPositionsTableInfo:
+    def __init__(self) -> None:
+        """Structure used to show an interactive table related to the 'Open Positions'."""
+        self.__positions_kit = OpenPositionKit()
+        self.__filter_object = None
+        self.__table_view_gui = TableViewGUI("open_positions_table_view", self.__positions_kit)
+        self.__columns_list = OpenPositionColumns.getInstance().getColumnsNameList()
+
+    def __showMainTitle(self) -> None:
+        st.write('#### Posições em aberto')
+
+    def __showColumnsViewer(self) -> list:
+        columns_not_displayed = st.multiselect('Ocultar colunas:', self.__columns_list)
+        return [column for column in self.__columns_list if column not in columns_not_displayed]
+
+    def __showDataframe(self, columns_list: list) -> None:
+        # Only the displayed page and columns are read and formatted
+        self.__table_view_gui.showFilteredLines(self.__filter_object, columns_list)
+        expander = st.expander("Informações:")
+        expander.write("""A tabela acima mostra todas as __Posições em Aberto__ registradas na planilha __Extrato__.
+            As __Posições em Aberto__ são identificadas da mesma forma que as __Posições Encerradas__: para cada
+            __Ticker__, a última sequência de operações em que o somatório da __quantidade de compra__ ainda é
+            diferente do somatório da __quantidade de venda__.\n\nA __Quantidade__ é a diferença entre as quantidades
+            de compra e venda; o __Preço Médio c/ Custos__ considera as compras da posição somadas às suas __Taxas__ e
+            __IR__; o __Capital Investido__ é o produto entre ambos.
+            """
+        )
+
+    def setFilter(self, filter_object: FilterInterface) -> None:
+        """Set the filter with the lines to be shown (see 'TableView.setFilter')."""
+        self.__filter_object = filter_object
+    
+    def showInfo(self) -> None:
+        self.__showMainTitle()
+        self.__showDataframe(self.__showColumnsViewer())
+
+
+class OpenPositionGUI:
+    def __init__(self) -> None:
+        """Structure used to show tables and filters related to Open Positions."""
+        self.__side_bar = OpenPositionSideBar()
+        self.__table = OpenPositionsTableInfo()
+        self.__setDataframes()
+
+    def __setDataframes(self) -> None:
+        self.__table.setFilter(self.__side_bar.getFilterObject())
+
+    def setDataframe(self, dataframe: pd.DataFrame) -> None:
+        self.__side_bar.updateDataframe(dataframe)
+        self.__setDataframes()
+        self.__table.showInfo()
+
+
+open_position_gui = OpenPositionGUI()
+open_position_gui.setDataframe(SessionStateControl().getOpenPositionsDataframe())
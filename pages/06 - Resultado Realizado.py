@@ -0,0 +1,58 @@
+import pandas as pd
+import streamlit as st
+
+from common.filter import FilterInterface
+from common.table_view_gui import TableViewGUI
+
+from positions.lib.realized_columns import LotMatchingMethod, RealizedResultColumns
+from positions.lib.realized_dataframes_kit import RealizedResultKit
+
+from Home import SessionStateControl
+
+
+class RealizedResultsTableInfo:
+    def __init__(self) -> None:
+        """Structure used to show an interactive table related to the 'Realized Results'."""
+        self.__results_kit = RealizedResultKit()
+        self.__columns_object = RealizedResultColumns.getInstance()
+        self.__filter_object = FilterInterface(self.__results_kit, self.__columns_object)
+        self.__table_view_gui = TableViewGUI("realized_results_table_view", self.__results_kit)
+
+    def __showMainTitle(self) -> None:
+        st.write('#### Resultado Realizado')
+
+    def __showDataframe(self) -> None:
+        # Only the displayed page is read and formatted
+        self.__table_view_gui.showFilteredLines(self.__filter_object, self.__columns_object.getColumnsNameList())
+        expander = st.expander("Informações:")
+        expander.write("""A tabela acima mostra o __Resultado Realizado__ de cada __Venda__ registrada na planilha __Extrato__.
+            \n\nO __Custo de Aquisição__ é o custo dos lotes comprados (somados às suas __Taxas__ e __IR__) que foram
+            vendidos: pelo método __PEPS__, os lotes mais antigos são vendidos primeiro; pelo método __Preço Médio__,
+            todos os lotes são vendidos pelo seu preço médio. Assim, vendas parciais também têm o seu resultado.
+            """
+        )
+
+    def setDataframe(self, dataframe: pd.DataFrame) -> None:
+        self.__filter_object.updateDataframe(dataframe)
+
+    def showInfo(self) -> None:
+        self.__showMainTitle()
+        self.__showDataframe()
+
+
+class RealizedResultGUI:
+    def __init__(self) -> None:
+        """Structure used to show the Realized Results, given the lots matching method chosen by the User."""
+        self.__session_control = SessionStateControl()
+        self.__table = RealizedResultsTableInfo()
+
+    def __getMatchingMethod(self) -> str:
+        return st.selectbox('Método de apuração:', LotMatchingMethod().getMethodsList(), key="realized_results_method")
+
+    def showInfo(self) -> None:
+        self.__table.setDataframe(self.__session_control.getRealizedResultsDataframe(self.__getMatchingMethod()))
+        self.__table.showInfo()
+
+
+realized_result_gui = RealizedResultGUI()
+realized_result_gui.showInfo()
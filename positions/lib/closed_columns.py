@@ -32,45 +32,65 @@ class ClosedPositionColumns(ColumnsInterface):
 
         # Buy data
         self._quantity_buy_col = self.addRawColumn("Quantidade[C]", "number") # row-by-row
-        self._mean_buy_price_col = self.addRawColumn("Preço Médio[C]", "$") # col-to-col
+        self._mean_buy_price_col = self.addRawColumn(
+            "Preço Médio[C]", "$", "`Preço Total[C]` / `Quantidade[C]`"
+        ) # col-to-col
         self._total_buy_price_col = self.addRawColumn("Preço Total[C]", "$") # row-by-row
         self._taxes_buy_col = self.addRawColumn("Taxas[C]", "$") # row-by-row
         self._IR_buy_col = self.addRawColumn("IR[C]", "$") # row-by-row
-        self._costs_buy_col = self.addRawColumn("Custos[C]", "$") # col-to-col
-        self._mean_costs_buy_price_col = self.addRawColumn("Preço Médio c/ Custos[C]", "$") # col-to-col
-        self._total_costs_buy_price_col = self.addRawColumn("Preço Total c/ Custos[C]", "$") # col-to-col
+        self._costs_buy_col = self.addRawColumn("Custos[C]", "$", "`Taxas[C]` + `IR[C]`") # col-to-col
+        self._mean_costs_buy_price_col = self.addRawColumn(
+            "Preço Médio c/ Custos[C]", "$", "`Preço Total c/ Custos[C]` / `Quantidade[C]`"
+        ) # col-to-col
+        self._total_costs_buy_price_col = self.addRawColumn(
+            "Preço Total c/ Custos[C]", "$", "`Preço Total[C]` + `Custos[C]`"
+        ) # col-to-col
 
         # Sell data
         self._quantity_sell_col = self.addRawColumn("Quantidade[V]", "number") # row-by-row
-        self._mean_sell_price_col = self.addRawColumn("Preço Médio[V]", "$") # col-to-col
+        self._mean_sell_price_col = self.addRawColumn(
+            "Preço Médio[V]", "$", "`Preço Total[V]` / `Quantidade[V]`"
+        ) # col-to-col
         self._total_sell_price_col = self.addRawColumn("Preço Total[V]", "$") # row-by-row
         self._taxes_sell_col = self.addRawColumn("Taxas[V]", "$") # row-by-row
         self._IR_sell_col = self.addRawColumn("IR[V]", "$") # row-by-row
-        self._costs_sell_col = self.addRawColumn("Custos[V]", "$") # col-to-col
-        self._mean_costs_sell_price_col = self.addRawColumn("Preço Médio c/ Custos[V]", "$") # col-to-col
-        self._total_costs_sell_price_col = self.addRawColumn("Preço Total c/ Custos[V]", "$") # col-to-col
+        self._costs_sell_col = self.addRawColumn("Custos[V]", "$", "`Taxas[V]` + `IR[V]`") # col-to-col
+        self._mean_costs_sell_price_col = self.addRawColumn(
+            "Preço Médio c/ Custos[V]", "$", "`Preço Total c/ Custos[V]` / `Quantidade[V]`"
+        ) # col-to-col
+        self._total_costs_sell_price_col = self.addRawColumn(
+            "Preço Total c/ Custos[V]", "$", "`Preço Total[V]` - `Custos[V]`"
+        ) # col-to-col
 
         # Other related taxes during the period
-        self._additional_taxes_col = self.addRawColumn("Taxas Adicionais", "$") # Excluding buy and sell taxes
+        self._additional_taxes_col = self.addRawColumn(
+            "Taxas Adicionais", "$", "`Taxas Totais` - (`Taxas[C]` + `Taxas[V]`)"
+        ) # Excluding buy and sell taxes
         self._total_taxes_col = self.addRawColumn("Taxas Totais", "$")
 
         # Other related IR during the period
-        self._additional_IR_col = self.addRawColumn("IR Adicional", "$") # Excluding buy and sell IR
+        self._additional_IR_col = self.addRawColumn(
+            "IR Adicional", "$", "`IR Total` - (`IR[C]` + `IR[V]`)"
+        ) # Excluding buy and sell IR
         self._total_IR_col = self.addRawColumn("IR Total", "$")
 
         # Total costs
-        self._total_costs_col = self.addRawColumn("Custos Totais", "$") # Total taxes + Total IR
+        self._total_costs_col = self.addRawColumn(
+            "Custos Totais", "$", "`Taxas Totais` + `IR Total`"
+        ) # Total taxes + Total IR
 
         # Earnings during the period
         self._dividends_col = self.addRawColumn("Dividendos", "$")
         self._JCP_col = self.addRawColumn("JCP", "$")
-        self._total_earnings_col = self.addRawColumn("Proventos Totais", "$") # Including all dividends and JCP
+        self._total_earnings_col = self.addRawColumn(
+            "Proventos Totais", "$", "`Dividendos` + `JCP`"
+        ) # Including all dividends and JCP
 
         # Final results
-        self._delta_sell_buy_col = self.addRawColumn("Venda-Compra", "$")
-        self._gross_margin_col = self.addRawColumn("Margem Bruta", "$")
-        self._gross_margin_p_col = self.addRawColumn("Margem Bruta (%)", "%")
-        self._net_margin_col = self.addRawColumn("Margem Líquida", "$")
-        self._net_margin_p_col = self.addRawColumn("Margem Líquida (%)", "%")
+        self._delta_sell_buy_col = self.addRawColumn("Venda-Compra", "$", "`Preço Total[V]` - `Preço Total[C]`")
+        self._gross_margin_col = self.addRawColumn("Margem Bruta", "$", "`Venda-Compra` + `Proventos Totais`")
+        self._gross_margin_p_col = self.addRawColumn("Margem Bruta (%)", "%", "`Margem Bruta` / `Preço Total[C]`")
+        self._net_margin_col = self.addRawColumn("Margem Líquida", "$", "`Margem Bruta` - `Custos Totais`")
+        self._net_margin_p_col = self.addRawColumn("Margem Líquida (%)", "%", "`Margem Líquida` / `Preço Total[C]`")
         # self._benchmark_IPCA_col = self.addRawColumn("IPCA+ (a.a.)", "%") # comparison to IPCA treasury in the period
         # self._benchmark_CDI_col = self.addRawColumn("*CDI (a.a.)", "%") # comparison to CDI in the period
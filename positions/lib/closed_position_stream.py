@@ -0,0 +1,118 @@
+import pandas as pd
+
+from extrato.lib.extrato_columns import ExtratoColumns, ExtratoOperations
+from extrato.lib.extrato_dataframes_kit import ExtratoKit
+
+from positions.lib.closed_dataframes_kit import ClosedPositionKit
+
+
+class ClosedPositionStream:
+    def __init__(self) -> None:
+        """Structure to get the 'Closed Positions' from an Extrato read in chunks.
+
+        The Extrato lines must be sorted by date, as in the User spreadsheet. Only the running state
+        of each ticker is kept: the cumulative buy and sell quantities and the aggregations of its
+        current slice (see 'ExtratoSliceAccumulator'). So, the memory is bounded by the number of
+        tickers, not by the Extrato length.
+
+        Each 'Closed Position' is yielded as soon as its 'Closing Operation' line is read. The slices
+        and values are the same ones calculated by 'ExtratoKit' and 'ClosedPositionKit'.
+        """
+        self.__extrato_columns = ExtratoColumns.getInstance()
+        self.__operations_object = ExtratoOperations()
+        self.__extrato_kit_object = ExtratoKit()
+        self.__closed_kit = ClosedPositionKit()
+        self.__tickers_state_dict = {}
+
+    def setFixedPointMode(self, enabled: bool, decimal_places: int = 8) -> None:
+        """Set the fixed-point mode (see 'DataframesKitInterface.setFixedPointMode')."""
+        self.__closed_kit.setFixedPointMode(enabled, decimal_places)
+
+    def reset(self) -> None:
+        """Forget the running state of all tickers."""
+        self.__tickers_state_dict = {}
+
+
+    """Chunk-by-chunk calculation."""
+
+    def __getNotNanChunkDataframe(self, chunk_df: pd.DataFrame) -> pd.DataFrame:
+        # The same values of 'getNotNanDataframe', used by 'ClosedPositionKit'
+        for column, column_type in self.__extrato_columns.getColumnsTypeDict().items():
+            if self.__extrato_columns.isDateType(column_type):
+                chunk_df[column] = pd.to_datetime(chunk_df[column]).dt.normalize()
+            else:
+                chunk_df[column] = chunk_df[column].fillna(self.__extrato_columns.getColumnsNanDict()[column])
+        return chunk_df
+
+    def __getChunkQuantityList(self, chunk_df: pd.DataFrame, operation: str) -> list:
+        quantity = chunk_df[self.__extrato_columns._quantity_col.getName()].fillna(0).astype(float)
+        if self.__closed_kit.isFixedPointMode():
+            quantity = self.__closed_kit.getFixedPointConverter().getFixedPointSeries(quantity)
+        operation_values = chunk_df[self.__extrato_columns._operation_col.getName()]
+        return quantity.where(operation_values == operation, 0).to_list()
+
+    def __getTickerState(self, ticker: str) -> list:
+        # [cumulative buy, buy compensation, cumulative sell, sell compensation, slice accumulator]
+        if ticker not in self.__tickers_state_dict:
+            self.__tickers_state_dict[ticker] = [0, 0.0, 0, 0.0, None]
+        return self.__tickers_state_dict[ticker]
+
+    def __addQuantity(self, cumulative_quantity, compensation: float, quantity) -> tuple:
+        # The same compensated (Kahan) cumulative sum of the Pandas 'groupby', used to find the slices
+        if self.__closed_kit.isFixedPointMode():
+            return cumulative_quantity + quantity, compensation
+        compensated_quantity = quantity - compensation
+        new_quantity = cumulative_quantity + compensated_quantity
+        return new_quantity, new_quantity - cumulative_quantity - compensated_quantity
+
+    def getClosedPositionsStream(self, extrato_chunks):
+        """Yield a dict for each 'Closed Position' found in the 'extrato_chunks'.
+
+        The 'extrato_chunks' is any iterable of raw Extrato dataframes, such as the generator
+        'ExtratoExcelReader.readExcelFileChunks'. The dicts have the columns aggregated per slice,
+        see 'getClosedPositionsDataframe' to get the formula columns too.
+
+        The running state is kept between calls, so an Extrato can also be given in several calls.
+        """
+        slicer = self.__closed_kit.getExtratoSlicer()
+        result_col_list = slicer.getAggregationsNameList()
+        ticker_col = self.__extrato_columns._ticker_col.getName()
+
+        for chunk_df in extrato_chunks:
+            chunk_df = self.__extrato_kit_object.getCalculatedDataframe(chunk_df)
+            chunk_df = chunk_df.loc[chunk_df[ticker_col].notna()]
+            if chunk_df.empty:
+                continue
+            ticker_list = chunk_df[ticker_col].to_list()
+            buy_quantity_list = self.__getChunkQuantityList(chunk_df, self.__operations_object.getBuyOperation())
+            sell_quantity_list = self.__getChunkQuantityList(chunk_df, self.__operations_object.getSellOperation())
+            aggregation_input_df = slicer.getAggregationInputDataframe(self.__getNotNanChunkDataframe(chunk_df))
+
+            for ticker, buy_quantity, sell_quantity, line_values in zip(
+                ticker_list, buy_quantity_list, sell_quantity_list, aggregation_input_df.itertuples(index=False)
+            ):
+                state = self.__getTickerState(ticker)
+                state[0], state[1] = self.__addQuantity(state[0], state[1], buy_quantity)
+                state[2], state[3] = self.__addQuantity(state[2], state[3], sell_quantity)
+                if state[4] is None:
+                    state[4] = slicer.getSliceAccumulator()
+                state[4].addLine(tuple(line_values))
+
+                # 'Closing Operation': the slice is closed and the next line of the ticker opens a new one
+                if state[0] == state[2]:
+                    yield dict(zip(result_col_list, state[4].getValuesList()))
+                    state[4] = None
+
+    def getClosedPositionsDataframe(self, extrato_chunks) -> pd.DataFrame:
+        """Return the 'Closed Positions' of the 'extrato_chunks', with the formula columns.
+
+        The lines are sorted per ticker (alphabetical order) and date, as in 'ClosedPositionKit'.
+        """
+        slicer = self.__closed_kit.getExtratoSlicer()
+        ticker_col = self.__closed_kit.getColumnsObject()._ticker_col.getName()
+        closed_position_df = pd.DataFrame(
+            list(self.getClosedPositionsStream(extrato_chunks)), columns=slicer.getAggregationsNameList()
+        )
+        closed_position_df = closed_position_df.sort_values(by=ticker_col, kind="mergesort")
+        closed_position_df = self.__closed_kit.getCalculatedDataframe(closed_position_df)
+        return closed_position_df.reset_index(drop=True)
@@ -1,6 +1,9 @@
 import pandas as pd
 import streamlit as st
 
+from common.facet_selector import FacetSelector
+from common.filter import FilterInterface
+
 from positions.lib.closed_columns import ClosedPositionColumns
 from positions.lib.closed_filter import ClosedPositionFilter
 
@@ -18,7 +21,8 @@ class ClosedPositionSideBar:
         - columns_object: any object instance inherited from 'ClosedPositionDBColumns'
         - filter_object: any object instance inherited from 'ClosedPositionDBFilter'
         """
-        self.__columns_object = ClosedPositionColumns()
+        self.__columns_object = ClosedPositionColumns.getInstance()
+        self.__key_prefix = "closed_side_bar"
         self.__filter_object = ClosedPositionFilter()
         self.__market_filter = market_filter
         self.__ticker_filter = ticker_filter
@@ -26,26 +30,25 @@ class ClosedPositionSideBar:
     
     def __showSubHearder(self) -> None:
         st.sidebar.subheader('Filtros')
-    
+
     def __showMarketFilter(self) -> list:
         column = self.__columns_object._market_col.getName()
-        market_default_series = self.__filter_object.getDataframe()[column].drop_duplicates()
-        market_list_filter = st.sidebar.multiselect('Mercado:', market_default_series.sort_values())
+        market_facets_dict = self.__filter_object.getFacetsDict(column)
+        market_list_filter = FacetSelector(self.__key_prefix + "_market").showMultiselect('Mercado:', market_facets_dict)
         self.__filter_object.applyMarketFilter(market_list_filter)
 
     def __showTickerFilter(self) -> str:
         column = self.__columns_object._ticker_col.getName()
-        ticker_default_list = ["Exibir todos"]
-        ticker_default_list.extend(self.__filter_object.getDataframe()[column].drop_duplicates().sort_values())
-        ticker_filter = st.sidebar.selectbox('Ticker:', ticker_default_list)
+        ticker_facets_dict = self.__filter_object.getFacetsDict(column)
+        ticker_filter = FacetSelector(self.__key_prefix + "_ticker").showSelectbox('Ticker:', ticker_facets_dict, "Exibir todos")
         self.__filter_object.applyTickerFilter(ticker_filter)
     
     def __showPeriodFilter(self) -> tuple:
         initial_date_column = self.__columns_object._initial_date_col.getName()
         final_date_column = self.__columns_object._final_date_col.getName()
-        start_date = self.__filter_object.getDataframe()[initial_date_column].min()
-        end_date = self.__filter_object.getDataframe()[final_date_column].max()
-        if self.__filter_object.getDataframe().empty:
+        start_date = self.__filter_object.getDateBounds(initial_date_column)[0]
+        end_date = self.__filter_object.getDateBounds(final_date_column)[1]
+        if self.__filter_object.isEmpty():
             date_option = st.sidebar.slider('Período:', disabled=True)
             init_date = None
             finish_date = None
@@ -72,8 +75,15 @@ class ClosedPositionSideBar:
         self.__filter_object.updateDataframe(dataframe)
         self.__showSideBar()
     
+    def getFilterObject(self) -> FilterInterface:
+        """Return the filter with the lines selected in the Side Bar, such as for a 'TableView'."""
+        return self.__filter_object
+
     def getFilteredDataframe(self) -> pd.DataFrame:
-        return self.__filter_object.getDataframe().copy()
+        return self.__filter_object.getDataframe()
+
+    def getFilteredVersion(self) -> tuple:
+        return self.__filter_object.getFilteredVersion()
     
     def getFilteredFormattedDataframe(self) -> pd.DataFrame:
-        return self.__filter_object.getFormattedDataframe().copy()
+        return self.__filter_object.getFormattedDataframe()
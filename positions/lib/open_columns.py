@@ -0,0 +1,49 @@
+from common.columns import ColumnsInterface
+
+
+class OpenPositionColumns(ColumnsInterface):
+    def __init__(self) -> None:
+        """Structure to define all columns related to 'Open Position Database'.
+        
+        'Open Position' means the last interval of 'buy' and 'sell' operations of a ticker
+        where 'buy_quantity.sum()' is not equal to 'sell_quantity.sum()' yet.
+        
+        All values related to the 'Open Position' are registered in the User Extrato
+        spreadsheet.
+        """
+        super().__init__()
+
+        # Columns for Ticker classification
+        self._market_col = self.addRawColumn("Mercado", "string") # row-by-row
+        self._ticker_col = self.addRawColumn("Ticker", "string") # row-by-row
+        self._indexer_col = self.addRawColumn("Indexador", "string") # row-by-row
+
+        # Dates
+        self._initial_date_col = self.addRawColumn("Data Inicial", "date") # row-by-row: first buy
+
+        # Current position
+        self._quantity_col = self.addRawColumn("Quantidade", "number", "`Quantidade[C]` - `Quantidade[V]`") # col-to-col
+        self._mean_costs_buy_price_col = self.addRawColumn(
+            "Preço Médio c/ Custos", "$", "(`Preço Total[C]` + `Custos[C]`) / `Quantidade[C]`"
+        ) # col-to-col
+        self._invested_capital_col = self.addRawColumn(
+            "Capital Investido", "$", "`Preço Médio c/ Custos` * `Quantidade`"
+        ) # col-to-col
+
+        # Buy data
+        self._quantity_buy_col = self.addRawColumn("Quantidade[C]", "number") # row-by-row
+        self._total_buy_price_col = self.addRawColumn("Preço Total[C]", "$") # row-by-row
+        self._taxes_buy_col = self.addRawColumn("Taxas[C]", "$") # row-by-row
+        self._IR_buy_col = self.addRawColumn("IR[C]", "$") # row-by-row
+        self._costs_buy_col = self.addRawColumn("Custos[C]", "$", "`Taxas[C]` + `IR[C]`") # col-to-col
+
+        # Sell data
+        self._quantity_sell_col = self.addRawColumn("Quantidade[V]", "number") # row-by-row
+        self._total_sell_price_col = self.addRawColumn("Preço Total[V]", "$") # row-by-row
+
+        # Earnings during the period
+        self._dividends_col = self.addRawColumn("Dividendos", "$") # row-by-row
+        self._JCP_col = self.addRawColumn("JCP", "$") # row-by-row
+        self._total_earnings_col = self.addRawColumn(
+            "Proventos Totais", "$", "`Dividendos` + `JCP`"
+        ) # Including all dividends and JCP
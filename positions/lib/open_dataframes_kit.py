@@ -0,0 +1,27 @@
+from extrato.lib.extrato_columns import ExtratoColumns, ExtratoOperations, InvestmentPositionType
+from extrato.lib.extrato_dataframes_kit import ExtratoSlicer
+
+from positions.lib.open_columns import OpenPositionColumns
+from positions.lib.position_dataframes_kit import PositionKit
+
+
+class OpenPositionKit(PositionKit):
+    def __init__(self) -> None:
+        """Structure to handle a Pandas dataframe to show Open Positions."""
+        self.__columns_object = OpenPositionColumns.getInstance()
+        self.__extrato_columns = ExtratoColumns.getInstance()
+        self.__operations_object = ExtratoOperations()
+        super().__init__(self.__columns_object, InvestmentPositionType().getOpenedPosition())
+
+
+    """Slice-by-slice calculation."""
+
+    def _addPeriodAggregations(self, extrato_slicer: ExtratoSlicer) -> None:
+        """Method Overridden from 'PositionKit' class."""
+        # Initial Date: the first buy of the position
+        extrato_slicer.addAggregation(
+            self.__columns_object._initial_date_col.getName(),
+            self.__extrato_columns._date_col,
+            "min",
+            self.__operations_object.getBuyOperation(),
+        )
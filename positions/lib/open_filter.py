@@ -0,0 +1,19 @@
+import pandas as pd
+
+from common.filter import FilterInterface
+
+from positions.lib.open_columns import OpenPositionColumns
+from positions.lib.open_dataframes_kit import OpenPositionKit
+
+
+class OpenPositionFilter(FilterInterface):
+    def __init__(self) -> None:
+        """Structure to apply filters based on 'Open Position' objects."""
+        self.__columns_object = OpenPositionColumns.getInstance()
+        self.__df_interface_object = OpenPositionKit()
+        super().__init__(self.__df_interface_object, self.__columns_object)
+
+    def applyPeriodFilter(self, start_date: pd.Timestamp, end_date: pd.Timestamp) -> None:
+        initial_date_column = self.__columns_object._initial_date_col.getName()
+        if start_date and end_date:
+            self.applyDateRangeFilter(initial_date_column, start_date, end_date)
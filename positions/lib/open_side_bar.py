@@ -0,0 +1,82 @@
+import pandas as pd
+import streamlit as st
+
+from common.facet_selector import FacetSelector
+from common.filter import FilterInterface
+
+from positions.lib.open_columns import OpenPositionColumns
+from positions.lib.open_filter import OpenPositionFilter
+
+
+class OpenPositionSideBar:
+    def __init__(
+        self,
+        market_filter = True,
+        ticker_filter = True,
+        period_filter = True,
+    ) -> None:
+        """Structure to draw an 'Open Position Filter' Side Bar."""
+        self.__columns_object = OpenPositionColumns.getInstance()
+        self.__key_prefix = "open_side_bar"
+        self.__filter_object = OpenPositionFilter()
+        self.__market_filter = market_filter
+        self.__ticker_filter = ticker_filter
+        self.__period_filter = period_filter
+    
+    def __showSubHearder(self) -> None:
+        st.sidebar.subheader('Filtros')
+
+    def __showMarketFilter(self) -> list:
+        column = self.__columns_object._market_col.getName()
+        market_facets_dict = self.__filter_object.getFacetsDict(column)
+        market_list_filter = FacetSelector(self.__key_prefix + "_market").showMultiselect('Mercado:', market_facets_dict)
+        self.__filter_object.applyMarketFilter(market_list_filter)
+
+    def __showTickerFilter(self) -> str:
+        column = self.__columns_object._ticker_col.getName()
+        ticker_facets_dict = self.__filter_object.getFacetsDict(column)
+        ticker_filter = FacetSelector(self.__key_prefix + "_ticker").showSelectbox('Ticker:', ticker_facets_dict, "Exibir todos")
+        self.__filter_object.applyTickerFilter(ticker_filter)
+    
+    def __showPeriodFilter(self) -> tuple:
+        initial_date_column = self.__columns_object._initial_date_col.getName()
+        start_date, end_date = self.__filter_object.getDateBounds(initial_date_column)
+        if self.__filter_object.isEmpty():
+            date_option = st.sidebar.slider('Período:', disabled=True)
+            init_date = None
+            finish_date = None
+        elif start_date == end_date:
+            date_option = st.sidebar.slider('Período:', disabled=True)
+            init_date = date_option
+            finish_date = date_option
+        else:
+            date_option = st.sidebar.slider('Período:', min_value=start_date, max_value=end_date, value=(start_date, end_date))
+            init_date = date_option[0]
+            finish_date = date_option[1]
+        self.__filter_object.applyPeriodFilter(init_date, finish_date)
+    
+    def __showSideBar(self) -> None:
+        self.__showSubHearder()
+        if self.__market_filter:
+            self.__showMarketFilter()
+        if self.__ticker_filter:
+            self.__showTickerFilter()
+        if self.__period_filter:
+            self.__showPeriodFilter()
+    
+    def updateDataframe(self, dataframe: pd.DataFrame) -> None:
+        self.__filter_object.updateDataframe(dataframe)
+        self.__showSideBar()
+    
+    def getFilterObject(self) -> FilterInterface:
+        """Return the filter with the lines selected in the Side Bar, such as for a 'TableView'."""
+        return self.__filter_object
+
+    def getFilteredDataframe(self) -> pd.DataFrame:
+        return self.__filter_object.getDataframe()
+
+    def getFilteredVersion(self) -> tuple:
+        return self.__filter_object.getFilteredVersion()
+    
+    def getFilteredFormattedDataframe(self) -> pd.DataFrame:
+        return self.__filter_object.getFormattedDataframe()
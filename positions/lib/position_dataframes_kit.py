@@ -0,0 +1,180 @@
+import pandas as pd
+
+from common.columns import ColumnsInterface
+from common.dataframes_kit import DataframesKitInterface
+from common.raw_column import RawColumn
+
+from extrato.lib.extrato_columns import ExtratoColumns, ExtratoOperations
+from extrato.lib.extrato_dataframes_kit import ExtratoKit, ExtratoSlicer
+
+
+class PositionKit(DataframesKitInterface):
+    def __init__(self, columns_object: ColumnsInterface, position_type: str) -> None:
+        """Structure to handle a Pandas dataframe with one line per Extrato slice of a position type.
+
+        The slices are found by the 'ExtratoKit' and aggregated by the 'ExtratoSlicer' in a single
+        'groupby' pass. The aggregations shared by all the positions are defined here (see
+        '_setSlicerAggregations'): the subclasses add only their own columns, in the
+        '_addPeriodAggregations' and '_addCostsAggregations' hooks. Then, the formula columns are
+        calculated from the aggregated columns.
+
+        The 'ExtratoKit' and the 'ExtratoSlicer' are created only when they are needed, such as in
+        'setExtratoDataframe': creating the kit does not calculate anything. Kits with other lines than
+        the slices (such as the 'RealizedResultKit') override '_getPositionDataframe'.
+
+        Args:
+        - columns_object: any instance based on 'ColumnsInterface' class
+        - position_type (str): any position string related to the 'InvestmentPositionType' class (None if
+        the slices are not aggregated)
+        """
+        self.__position_type = position_type
+        self.__extrato_columns = ExtratoColumns.getInstance()
+        self.__operations_object = ExtratoOperations()
+        self.__extrato_kit_object = None
+        self.__extrato_slicer = None
+        self.__fixed_point_arguments = (False, 8)
+        self.__parallel_arguments = (False, None)
+        super().__init__(columns_object)
+
+    def __applyKitModes(self) -> None:
+        self.__extrato_kit_object.setFixedPointMode(*self.__fixed_point_arguments)
+        self.__extrato_kit_object.setParallelMode(*self.__parallel_arguments)
+
+    def __applySlicerModes(self) -> None:
+        self.__extrato_slicer.setFixedPointConverter(self.getFixedPointConverter())
+        self.__extrato_slicer.setPartitionExecutor(self.getExtratoKit().getPartitionExecutor())
+
+
+    """Slice-by-slice calculation."""
+
+    def __addAggregation(self, column: RawColumn, extrato_column: RawColumn, aggregation: str, operation: str = "ALL") -> None:
+        self.__extrato_slicer.addAggregation(column.getName(), extrato_column, aggregation, operation)
+
+    def __setTickerClassificationColumns(self) -> None:
+        columns_object = self.getColumnsObject()
+        extrato_columns = self.__extrato_columns
+
+        # Market, Ticker and Indexer
+        self.__addAggregation(columns_object._market_col, extrato_columns._market_col, "first")
+        self.__addAggregation(columns_object._ticker_col, extrato_columns._ticker_col, "first")
+        self.__addAggregation(columns_object._indexer_col, extrato_columns._indexer_col, "first")
+
+    def __setBuyColumns(self) -> None:
+        columns_object = self.getColumnsObject()
+        extrato_columns = self.__extrato_columns
+        buy_operation = self.__operations_object.getBuyOperation()
+
+        # Quantity, Total Price, IR and Taxes
+        self.__addAggregation(columns_object._quantity_buy_col, extrato_columns._quantity_col, "sum", buy_operation)
+        self.__addAggregation(columns_object._total_buy_price_col, extrato_columns._buy_price_col, "sum", buy_operation)
+        self.__addAggregation(columns_object._IR_buy_col, extrato_columns._IR_col, "sum", buy_operation)
+        self.__addAggregation(columns_object._taxes_buy_col, extrato_columns._taxes_col, "sum", buy_operation)
+
+    def __setSellColumns(self) -> None:
+        columns_object = self.getColumnsObject()
+        extrato_columns = self.__extrato_columns
+        sell_operation = self.__operations_object.getSellOperation()
+
+        # Quantity and Total Price
+        self.__addAggregation(columns_object._quantity_sell_col, extrato_columns._quantity_col, "sum", sell_operation)
+        self.__addAggregation(columns_object._total_sell_price_col, extrato_columns._sell_price_col, "sum", sell_operation)
+
+    def __setIncomeColumns(self) -> None:
+        columns_object = self.getColumnsObject()
+        extrato_columns = self.__extrato_columns
+
+        # Dividends and JCP
+        self.__addAggregation(columns_object._dividends_col, extrato_columns._dividends_col, "sum")
+        self.__addAggregation(columns_object._JCP_col, extrato_columns._JCP_col, "sum")
+
+    def _addPeriodAggregations(self, extrato_slicer: ExtratoSlicer) -> None:
+        """Add the aggregations of the position period, such as its dates. There are none by default."""
+
+    def _addCostsAggregations(self, extrato_slicer: ExtratoSlicer) -> None:
+        """Add the aggregations of the position costs, besides the buy ones. There are none by default."""
+
+    def _setSlicerAggregations(self) -> None:
+        """Add the aggregations of each slice to the 'ExtratoSlicer', in the order of the columns."""
+        self.__setTickerClassificationColumns()
+        self._addPeriodAggregations(self.__extrato_slicer)
+        self.__setBuyColumns()
+        self.__setSellColumns()
+        self._addCostsAggregations(self.__extrato_slicer)
+        self.__setIncomeColumns()
+
+    def _calculateEmptyResults(self) -> None:
+        """Method Overridden from 'DataframesKitInterface' class."""
+        self.__addValuesToCalculatedColumns()
+        self.formatDataframes()
+
+
+    """Main frames for calculation."""
+
+    def _getPositionDataframe(self) -> pd.DataFrame:
+        """Return the lines of the kit, calculated from the 'ExtratoKit' (see 'getExtratoKit').
+        
+        By default, all the slices of the position type are aggregated in a single 'groupby' pass.
+        """
+        extrato_slicer = self.getExtratoSlicer()
+        extrato_slicer.setExtratoDataframe(self.getExtratoKit().getNotNanDataframe())
+        return extrato_slicer.getAggregatedDataframe(self.__position_type)
+
+    def __addValuesToCalculatedColumns(self) -> None:
+        self._raw_df = self.addColumnIfNotExists(self._getPositionDataframe())
+        self.calculateFormulaColumns()
+        self.resetDataframeIndex()
+
+    def _updatePositions(self) -> None:
+        """Calculate the kit lines again from the 'ExtratoKit', such as after a change of the calculation parameters."""
+        self.__addValuesToCalculatedColumns()
+        self.formatDataframes()
+
+
+    def getPositionType(self) -> str:
+        return self.__position_type
+
+    def getExtratoKit(self) -> ExtratoKit:
+        """Return the 'ExtratoKit' where the slices are found."""
+        # The modes set before the creation are applied to the new kit
+        if self.__extrato_kit_object is None:
+            self.__extrato_kit_object = ExtratoKit()
+            self.__applyKitModes()
+        return self.__extrato_kit_object
+
+    def getExtratoSlicer(self) -> ExtratoSlicer:
+        """Return the 'ExtratoSlicer' with the aggregations of each position."""
+        if self.__extrato_slicer is None:
+            self.__extrato_slicer = ExtratoSlicer()
+            self._setSlicerAggregations()
+            self.__applySlicerModes()
+        return self.__extrato_slicer
+
+    def setFixedPointMode(self, enabled: bool, decimal_places: int = 8) -> None:
+        """Method Overridden from 'DataframesKitInterface' class.
+
+        The mode is also applied to the slices calculation. It takes effect in the next 'setExtratoDataframe'.
+        """
+        super().setFixedPointMode(enabled, decimal_places)
+        self.__fixed_point_arguments = (enabled, decimal_places)
+        if self.__extrato_kit_object is not None:
+            self.__applyKitModes()
+        if self.__extrato_slicer is not None:
+            self.__applySlicerModes()
+
+    def setParallelMode(self, enabled: bool, max_workers: int = None) -> None:
+        """Enable or disable the parallel mode (see 'ExtratoKit.setParallelMode').
+
+        The mode is applied to the slices calculation and aggregation. It takes effect in the next 'setExtratoDataframe'.
+        """
+        self.__parallel_arguments = (enabled, max_workers)
+        if self.__extrato_kit_object is not None:
+            self.__applyKitModes()
+        if self.__extrato_slicer is not None:
+            self.__applySlicerModes()
+
+    def setExtratoDataframe(self, dataframe: pd.DataFrame) -> None:
+        # The source is hashed once, by the 'ExtratoKit'
+        extrato_kit_object = self.getExtratoKit()
+        extrato_kit_object.setDataframe(dataframe)
+        self._setSourceVersion(extrato_kit_object.getSourceVersion())
+        self._updatePositions()
@@ -0,0 +1,64 @@
+from common.columns import ColumnsInterface
+
+
+class LotMatchingMethod:
+    def __init__(self) -> None:
+        """Structure to define possible methods to match the sold quantities against the bought lots."""
+        self.__methods_list = []
+        self.__fifo = self.__addMatchingMethod("PEPS") # 'Primeiro que Entra, Primeiro que Sai' (FIFO)
+        self.__mean_price = self.__addMatchingMethod("Preço Médio")
+
+    def __addMatchingMethod(self, method_string: str) -> str:
+        self.__methods_list.append(method_string)
+        return method_string
+
+    def getMethodsList(self) -> list:
+        return self.__methods_list.copy()
+
+    def getFifoMethod(self) -> str:
+        return self.__fifo
+
+    def getMeanPriceMethod(self) -> str:
+        return self.__mean_price
+
+
+class RealizedResultColumns(ColumnsInterface):
+    def __init__(self) -> None:
+        """Structure to define all columns related to 'Realized Result Database'.
+        
+        'Realized Result' means the result of each 'sell' operation, given the cost of the
+        bought lots matched against the sold quantity. So, partial sells have their results
+        even when the position is still open.
+        
+        All values related to the 'Realized Result' are registered in the User Extrato
+        spreadsheet.
+        """
+        super().__init__()
+
+        # Date of the sell operation
+        self._date_col = self.addRawColumn("Data", "date") # row-by-row
+
+        # Columns for Ticker classification
+        self._market_col = self.addRawColumn("Mercado", "string") # row-by-row
+        self._ticker_col = self.addRawColumn("Ticker", "string") # row-by-row
+        self._slice_index_col = self.addRawColumn("Posição", "number") # row-by-row
+
+        # Sell data
+        self._quantity_sell_col = self.addRawColumn("Quantidade[V]", "number") # row-by-row
+        self._total_sell_price_col = self.addRawColumn("Preço Total[V]", "$") # row-by-row
+        self._costs_sell_col = self.addRawColumn("Custos[V]", "$") # row-by-row
+        self._total_costs_sell_price_col = self.addRawColumn(
+            "Preço Total c/ Custos[V]", "$", "`Preço Total[V]` - `Custos[V]`"
+        ) # col-to-col
+
+        # Cost of the matched lots, including the buy costs
+        self._acquisition_cost_col = self.addRawColumn("Custo de Aquisição", "$") # row-by-row
+
+        # Final results
+        self._result_col = self.addRawColumn(
+            "Resultado", "$", "`Preço Total c/ Custos[V]` - `Custo de Aquisição`"
+        ) # col-to-col
+        self._result_p_col = self.addRawColumn("Resultado (%)", "%", "`Resultado` / `Custo de Aquisição`") # col-to-col
+
+        # Quantity still open after the sell operation
+        self._remaining_quantity_col = self.addRawColumn("Quantidade Remanescente", "number") # row-by-row
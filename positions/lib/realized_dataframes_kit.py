@@ -0,0 +1,189 @@
+from collections import deque
+
+import pandas as pd
+
+from extrato.lib.extrato_columns import ExtratoColumns, ExtratoOperations
+
+from positions.lib.position_dataframes_kit import PositionKit
+from positions.lib.realized_columns import LotMatchingMethod, RealizedResultColumns
+
+
+class LotMatcher:
+    def __init__(self, matching_method: str) -> None:
+        """Structure to match the sold quantities of a ticker against its bought lots.
+        
+        The bought lots are kept in a 'deque' as [quantity, total cost] items:
+        - 'PEPS' (FIFO): every buy is a new lot; sells consume the oldest lots first
+        - 'Preço Médio': every buy is merged in a single lot; sells consume it at the mean price
+        
+        Args:
+        - matching_method (str): any method string related to the 'LotMatchingMethod' class
+        """
+        if matching_method not in LotMatchingMethod().getMethodsList():
+            msg = "The " + str(matching_method) + " is not a valid matching method. See the LotMatchingMethod class."
+            raise ValueError(msg)
+        self.__merge_lots = matching_method == LotMatchingMethod().getMeanPriceMethod()
+        self.__lots = deque()
+        self.__quantity = 0.0
+
+    def reset(self) -> None:
+        self.__lots.clear()
+        self.__quantity = 0.0
+
+    def addLot(self, quantity: float, total_cost: float) -> None:
+        """Register a bought lot, where 'total_cost' includes the buy costs."""
+        if self.__merge_lots and self.__lots:
+            self.__lots[0][0] += quantity
+            self.__lots[0][1] += total_cost
+        else:
+            self.__lots.append([quantity, total_cost])
+        self.__quantity += quantity
+
+    def matchQuantity(self, quantity: float) -> float:
+        """Remove the 'quantity' from the bought lots and return its cost.
+        
+        Quantities sold beyond the bought lots have no cost.
+        """
+        matched_cost = 0.0
+        while quantity > 0 and self.__lots:
+            lot = self.__lots[0]
+            if quantity < lot[0]:
+                lot_cost = lot[1] * quantity / lot[0]
+                lot[0] -= quantity
+                lot[1] -= lot_cost
+                matched_cost += lot_cost
+                self.__quantity -= quantity
+                quantity = 0
+            else:
+                matched_cost += lot[1]
+                quantity -= lot[0]
+                self.__quantity -= lot[0]
+                self.__lots.popleft()
+        if not self.__lots:
+            self.__quantity = 0.0
+        return matched_cost
+
+    def getQuantity(self) -> float:
+        return self.__quantity
+
+
+class RealizedResultKit(PositionKit):
+    def __init__(self, matching_method: str = "Preço Médio") -> None:
+        """Structure to handle a Pandas dataframe to show the Realized Result of each sell operation.
+        
+        The Extrato lines are sorted per ticker and date (the same order used to find the slices),
+        then the lots of each ticker are matched in a single pass. The lines are the sell operations,
+        not the slices: see '_getPositionDataframe'.
+        
+        Args:
+        - matching_method (str): any method string related to the 'LotMatchingMethod' class
+        """
+        self.__columns_object = RealizedResultColumns.getInstance()
+        self.__extrato_columns = ExtratoColumns.getInstance()
+        self.__operations_object = ExtratoOperations()
+        self.__matching_method = matching_method
+        self.__lot_matcher = LotMatcher(matching_method)
+        super().__init__(self.__columns_object, None)
+
+
+    """Row-by-row calculation."""
+
+    def __getSortedExtratoDataframe(self) -> pd.DataFrame:
+        # Only the lines with ticker are taken from the 'ExtratoKit', already sorted: the whole Extrato is not copied
+        extrato_kit_object = self.getExtratoKit()
+        ticker_col = self.__extrato_columns._ticker_col.getName()
+        date_col = self.__extrato_columns._date_col.getName()
+        
+        ticker_mask = extrato_kit_object.getRawColumnSeries(ticker_col).notna()
+        df = pd.DataFrame({
+            ticker_col: extrato_kit_object.getNotNanColumnSeries(ticker_col),
+            date_col: extrato_kit_object.getNotNanColumnSeries(date_col),
+        }).loc[ticker_mask.to_numpy()]
+        df = df.sort_values(by=date_col, kind="mergesort")
+        df = df.sort_values(by=ticker_col, kind="mergesort")
+        return extrato_kit_object.getNotNanDataframeLines(df.index)
+
+    def __getMatchedSellsDataframe(self, extrato_df: pd.DataFrame) -> pd.DataFrame:
+        extrato_columns = self.__extrato_columns
+        buy_operation = self.__operations_object.getBuyOperation()
+        sell_operation = self.__operations_object.getSellOperation()
+
+        # Input columns
+        ticker_list = extrato_df[extrato_columns._ticker_col.getName()].to_list()
+        operation_list = extrato_df[extrato_columns._operation_col.getName()].to_list()
+        quantity_list = extrato_df[extrato_columns._quantity_col.getName()].to_list()
+        total_price_list = extrato_df[extrato_columns._total_price_col.getName()].to_list()
+        total_costs_list = (
+            extrato_df[extrato_columns._taxes_col.getName()] + extrato_df[extrato_columns._IR_col.getName()]
+        ).to_list()
+
+        # Output columns
+        sell_line_list = []
+        acquisition_cost_list = []
+        remaining_quantity_list = []
+
+        current_ticker = None
+        for line, (ticker, operation, quantity, total_price, total_costs) in enumerate(
+            zip(ticker_list, operation_list, quantity_list, total_price_list, total_costs_list)
+        ):
+            if ticker != current_ticker:
+                self.__lot_matcher.reset()
+                current_ticker = ticker
+            
+            if operation == buy_operation:
+                self.__lot_matcher.addLot(quantity, total_price + total_costs)
+            elif operation == sell_operation:
+                acquisition_cost_list.append(self.__lot_matcher.matchQuantity(quantity))
+                remaining_quantity_list.append(self.__lot_matcher.getQuantity())
+                sell_line_list.append(line)
+
+        sells_df = extrato_df.iloc[sell_line_list]
+        sells_costs_list = [total_costs_list[line] for line in sell_line_list]
+        return pd.DataFrame({
+            self.__columns_object._date_col.getName(): sells_df[extrato_columns._date_col.getName()],
+            self.__columns_object._market_col.getName(): sells_df[extrato_columns._market_col.getName()],
+            self.__columns_object._ticker_col.getName(): sells_df[extrato_columns._ticker_col.getName()],
+            self.__columns_object._slice_index_col.getName(): sells_df[extrato_columns._slice_index_col.getName()],
+            self.__columns_object._quantity_sell_col.getName(): sells_df[extrato_columns._quantity_col.getName()],
+            self.__columns_object._total_sell_price_col.getName(): sells_df[extrato_columns._total_price_col.getName()],
+            self.__columns_object._costs_sell_col.getName(): sells_costs_list,
+            self.__columns_object._acquisition_cost_col.getName(): acquisition_cost_list,
+            self.__columns_object._remaining_quantity_col.getName(): remaining_quantity_list,
+        })
+
+
+    """Main frames for calculation."""
+
+    def _getPositionDataframe(self) -> pd.DataFrame:
+        """Method Overridden from 'PositionKit' class."""
+        return self.__getMatchedSellsDataframe(self.__getSortedExtratoDataframe())
+
+    def _setSourceVersion(self, source_version: str) -> None:
+        """Method Overridden from 'DataframesKitInterface' class."""
+        # The results of the same Extrato depend on the matching method
+        if source_version is not None:
+            source_version = source_version + "_" + self.__matching_method
+        super()._setSourceVersion(source_version)
+
+    def getMatchingMethod(self) -> str:
+        return self.__matching_method
+
+    def setMatchingMethod(self, matching_method: str) -> None:
+        """Set the 'LotMatchingMethod' and recalculate the Realized Result.
+        
+        The sell lines do not change: only the matched columns and the formula columns depending on them are calculated.
+        """
+        self.__lot_matcher = LotMatcher(matching_method)
+        self.__matching_method = matching_method
+        self._setSourceVersion(self.getExtratoKit().getSourceVersion())
+        matched_sells_df = self._getPositionDataframe()
+        matched_columns_list = [
+            self.__columns_object._acquisition_cost_col.getName(),
+            self.__columns_object._remaining_quantity_col.getName(),
+        ]
+        raw_df = self.getRawDataframe()
+        for column in matched_columns_list:
+            raw_df[column] = matched_sells_df[column].to_numpy()
+        self._raw_df = raw_df
+        self.calculateFormulaColumns(changed_columns=matched_columns_list)
+        self.formatDataframes()
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+
+class SampleExtrato:
+    """Structure used to create random Extrato dataframes for the tests, with the columns of the Extrato file."""
+
+    @staticmethod
+    def getDataframe(tickers_number: int = 20, lines_number: int = 2000, seed: int = 0, unique_dates: bool = True) -> pd.DataFrame:
+        """Return an Extrato with buys, sells, earnings, fees, transfers and redemptions.
+
+        The sells never exceed the bought quantity, so the slices of each ticker are closed when
+        the quantity goes back to zero. With 'unique_dates' False, many lines share the same date.
+        """
+        rng = np.random.default_rng(seed)
+        tickers_list = ["T" + str(number).zfill(3) for number in range(tickers_number)]
+        quantities_dict = {ticker: 0 for ticker in tickers_list}
+        lines_list = []
+        for line in range(lines_number):
+            line_random = rng.random()
+            if line_random < 0.05:
+                lines_list.append({"Operação": "Transferência", "Quantidade": 1, "Preço Unitário": float(rng.integers(100, 5000))})
+                continue
+            if line_random < 0.07:
+                lines_list.append({"Operação": "Resgate", "Quantidade": 1, "Preço Unitário": float(rng.integers(100, 5000))})
+                continue
+            ticker = tickers_list[rng.integers(tickers_number)]
+            market = "Ações" if int(ticker[1:]) % 2 else "FII"
+            operation_random = rng.random()
+            if operation_random < 0.1:
+                lines_list.append({
+                    "Mercado": market, "Ticker": ticker, "Operação": "Provento",
+                    "Dividendos": float(rng.integers(1, 100)), "JCP": float(rng.integers(0, 3)),
+                })
+            elif operation_random < 0.15:
+                lines_list.append({"Mercado": market, "Ticker": ticker, "Operação": "Cobrança", "Taxas": 1.5})
+            elif quantities_dict[ticker] > 0 and operation_random < 0.55:
+                quantity = quantities_dict[ticker] if rng.random() < 0.5 else int(rng.integers(1, quantities_dict[ticker] + 1))
+                quantities_dict[ticker] -= quantity
+                lines_list.append({
+                    "Mercado": market, "Ticker": ticker, "Operação": "Venda", "Quantidade": quantity,
+                    "Preço Unitário": round(float(rng.uniform(5, 50)), 2), "Taxas": 0.5, "IR": float(rng.integers(0, 3)),
+                })
+            else:
+                quantity = int(rng.integers(1, 200))
+                quantities_dict[ticker] += quantity
+                lines_list.append({
+                    "Mercado": market, "Ticker": ticker, "Operação": "Compra", "Quantidade": quantity,
+                    "Preço Unitário": round(float(rng.uniform(5, 50)), 2), "Taxas": 0.5,
+                })
+        df = pd.DataFrame(lines_list)
+        first_date = pd.Timestamp("2015-01-01")
+        if unique_dates:
+            df.insert(0, "Data", first_date + pd.to_timedelta(np.arange(len(df)), unit="h"))
+        else:
+            days_array = np.sort(rng.integers(0, max(len(df) // 3, 1), len(df)))
+            df.insert(0, "Data", first_date + pd.to_timedelta(days_array, unit="D"))
+        df["Notas"] = np.where(rng.random(len(df)) < 0.1, "Nota de teste", np.nan)
+        return df
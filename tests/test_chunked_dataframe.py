@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from common.chunked_dataframe import ChunkedDataframe
+
+
+class TestChunkedDataframe:
+    def __getDataframe(self, first_line: int, lines_number: int) -> pd.DataFrame:
+        lines_index = pd.RangeIndex(first_line, first_line + lines_number)
+        return pd.DataFrame({"Valor": [float(line) for line in lines_index], "Nome": [f"L{line}" for line in lines_index]}, index=lines_index)
+
+    def testAppendedLines(self):
+        base_df = self.__getDataframe(0, 5)
+        chunked_df = ChunkedDataframe(base_df)
+        updated_df = chunked_df.getUpdatedDataframe(self.__getDataframe(5, 3)).getUpdatedDataframe(self.__getDataframe(8, 2))
+        assert updated_df.getLinesNumber() == 10
+        assert updated_df.getIndexMaximum() == 9
+        pd.testing.assert_frame_equal(updated_df.getDataframe(), self.__getDataframe(0, 10))
+        # The original object and its lines are not changed
+        assert chunked_df.getLinesNumber() == 5
+        assert chunked_df.getDataframe() is base_df
+
+    def testChangedLines(self):
+        base_df = self.__getDataframe(0, 4)
+        changed_df = pd.DataFrame({"Nome": ["X1", "X5"]}, index=[1, 5])
+        chunked_df = ChunkedDataframe(base_df).getUpdatedDataframe(self.__getDataframe(4, 2), changed_df)
+        expected_df = self.__getDataframe(0, 6)
+        expected_df.loc[[1, 5], "Nome"] = ["X1", "X5"]
+        pd.testing.assert_frame_equal(chunked_df.getLines([5, 0, 1]), expected_df.loc[[5, 0, 1]])
+        pd.testing.assert_frame_equal(chunked_df.getDataframe(), expected_df)
+        assert base_df.loc[1, "Nome"] == "L1"
+
+    def testLinesWithoutConcatenation(self):
+        chunked_df = ChunkedDataframe(self.__getDataframe(0, 3)).getUpdatedDataframe(self.__getDataframe(3, 3))
+        pd.testing.assert_frame_equal(chunked_df.getLines([4, 2]), self.__getDataframe(0, 6).loc[[4, 2]])
+        assert chunked_df.getLines([]).empty
+        assert len(vars(chunked_df)["_ChunkedDataframe__chunks_list"]) == 2
+
+    def testRows(self):
+        # The rows are taken by position from each chunk, in the given order, with the changed values
+        changed_df = pd.DataFrame({"Valor": [-2.0]}, index=[2])
+        chunked_df = (
+            ChunkedDataframe(self.__getDataframe(0, 3))
+            .getUpdatedDataframe(self.__getDataframe(3, 0))
+            .getUpdatedDataframe(self.__getDataframe(3, 4), changed_df)
+        )
+        expected_df = self.__getDataframe(0, 7)
+        expected_df.loc[2, "Valor"] = -2.0
+        positions_array = np.array([6, 0, 2, 4])
+        pd.testing.assert_frame_equal(chunked_df.getRows(positions_array), expected_df.take(positions_array))
+        assert chunked_df.getRows(np.array([], dtype=int)).empty
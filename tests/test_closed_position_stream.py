@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+
+from extrato.lib.extrato_xls_reader import ExtratoExcelReader
+
+from positions.lib.closed_dataframes_kit import ClosedPositionKit
+from positions.lib.closed_position_stream import ClosedPositionStream
+
+from tests.sample_extrato import SampleExtrato
+
+
+class TestClosedPositionStream:
+    # The closed positions of the Extrato chunks must be the same of the 'ClosedPositionKit'
+    @pytest.mark.parametrize("unique_dates, fixed_point", [(True, False), (False, False), (False, True)])
+    def testClosedPositions(self, tmp_path, unique_dates, fixed_point):
+        df = SampleExtrato.getDataframe(lines_number=1500, seed=50, unique_dates=unique_dates)
+        file = str(tmp_path / "extrato.xlsx")
+        df.to_excel(file, index=False)
+
+        reader = ExtratoExcelReader()
+        reader.readExcelFile(file)
+        kit = ClosedPositionKit()
+        kit.setFixedPointMode(fixed_point)
+        kit.setExtratoDataframe(reader.getRawDataframe())
+
+        stream = ClosedPositionStream()
+        stream.setFixedPointMode(fixed_point)
+        stream_df = stream.getClosedPositionsDataframe(reader.readExcelFileChunks(file, 300))
+        pd.testing.assert_frame_equal(kit.getRawDataframe()[stream_df.columns], stream_df, check_dtype=False)
+
+    def testChunksInSeveralCalls(self):
+        df = SampleExtrato.getDataframe(lines_number=1000, seed=51)
+        stream = ClosedPositionStream()
+        positions_list = list(stream.getClosedPositionsStream([df.iloc[:400]]))
+        positions_list += list(stream.getClosedPositionsStream([df.iloc[400:700], df.iloc[700:]]))
+        assert len(positions_list) > 0
+        stream.reset()
+        assert positions_list == list(stream.getClosedPositionsStream([df]))
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.columns import ColumnsInterface
+from common.dataframes_kit import DataframesKitInterface
+
+
+class SampleColumns(ColumnsInterface):
+    def __init__(self) -> None:
+        """Structure to define columns with formulas, declared out of the calculation order."""
+        super().__init__()
+        self._margin_col = self.addRawColumn("Margem", "%", "`Resultado` / `Custo`")
+        self._result_col = self.addRawColumn("Resultado", "$", "`Venda` - `Custo`")
+        self._cost_col = self.addRawColumn("Custo", "$", "`Quantidade` * `Preço`")
+        self._quantity_col = self.addRawColumn("Quantidade", "number")
+        self._price_col = self.addRawColumn("Preço", "$")
+        self._sell_col = self.addRawColumn("Venda", "$")
+        self._notes_col = self.addRawColumn("Notas", "string")
+
+
+class CircularColumns(ColumnsInterface):
+    def __init__(self) -> None:
+        """Structure to define columns whose formulas depend on each other."""
+        super().__init__()
+        self.addRawColumn("A", "number", "`B` + 1")
+        self.addRawColumn("B", "number", "`A` + 1")
+
+
+class TestColumnsInterface:
+    def testFormulaColumnsOrder(self):
+        columns_object = SampleColumns()
+        formula_columns_list = [raw_column.getName() for raw_column in columns_object.getFormulaColumnsList()]
+        assert formula_columns_list == ["Custo", "Resultado", "Margem"]
+
+    def testChangedColumns(self):
+        columns_object = SampleColumns()
+        assert [raw_column.getName() for raw_column in columns_object.getFormulaColumnsList(["Venda"])] == ["Resultado", "Margem"]
+        assert columns_object.getFormulaColumnsList(["Notas"]) == []
+
+    def testRequiredColumns(self):
+        columns_object = SampleColumns()
+        assert columns_object.getRequiredColumnsList(["Margem"]) == ["Margem", "Resultado", "Custo", "Quantidade", "Preço", "Venda"]
+        assert columns_object.getRequiredColumnsList(["Notas", "Título"]) == ["Notas"]
+
+    def testCircularReference(self):
+        with pytest.raises(ValueError):
+            CircularColumns().getFormulaColumnsList()
+
+    def testSingleInstance(self):
+        assert SampleColumns.getInstance() is SampleColumns.getInstance()
+        assert SampleColumns.getInstance() is not CircularColumns.getInstance()
+
+
+class TestFormulaColumns:
+    def testCalculatedDataframe(self):
+        # Divisions by zero are replaced by NaN
+        kit = DataframesKitInterface(SampleColumns.getInstance())
+        df = pd.DataFrame({"Quantidade": [10.0, 0.0], "Preço": [2.0, 5.0], "Venda": [25.0, 3.0]})
+        calculated_df = kit.getCalculatedDataframe(df)
+        assert calculated_df["Custo"].to_list() == [20.0, 0.0]
+        assert calculated_df["Resultado"].to_list() == [5.0, 3.0]
+        assert calculated_df["Margem"].iloc[0] == 0.25
+        assert np.isnan(calculated_df["Margem"].iloc[1])
+        assert "Custo" not in df.columns
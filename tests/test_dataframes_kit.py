@@ -0,0 +1,144 @@
+import pandas as pd
+import pytest
+
+from common.dataframes_kit import DataframesKitInterface
+from common.lru_cache import SharedResultCache
+
+from extrato.lib.extrato_dataframes_kit import ExtratoKit
+from extrato.lib.extrato_filter import ExtratoFilter
+
+from tests.sample_extrato import SampleExtrato
+
+
+class TestDataframeFingerprint:
+    def testSameContents(self):
+        df = SampleExtrato.getDataframe(lines_number=300)
+        fingerprint = DataframesKitInterface.getDataframeFingerprint(df)
+        assert DataframesKitInterface.getDataframeFingerprint(df.copy()) == fingerprint
+
+    def testChangedContents(self):
+        df = SampleExtrato.getDataframe(lines_number=300)
+        fingerprint = DataframesKitInterface.getDataframeFingerprint(df)
+
+        changed_value_df = df.copy()
+        changed_value_df.loc[10, "Quantidade"] = 12345
+        changed_type_df = df.astype({"Taxas": object})
+        reindexed_df = df.set_axis(df.index + 1)
+        for changed_df in (changed_value_df, changed_type_df, reindexed_df, df.iloc[:-1]):
+            assert DataframesKitInterface.getDataframeFingerprint(changed_df) != fingerprint
+
+    def testUnhashableContents(self):
+        df = pd.DataFrame({"a": [[1], [2]]})
+        fingerprint = DataframesKitInterface.getDataframeFingerprint(df)
+        assert fingerprint.startswith("unhashable_")
+        assert DataframesKitInterface.getDataframeFingerprint(df) != fingerprint
+
+    def testSourceNotChanged(self):
+        df = SampleExtrato.getDataframe(lines_number=300)
+        df_copy = df.copy()
+        kit = ExtratoKit()
+        kit.setDataframe(df)
+        pd.testing.assert_frame_equal(df, df_copy)
+        assert df.attrs == {}
+        assert kit.getSourceVersion() == DataframesKitInterface.getDataframeFingerprint(df)
+
+
+class TestKitResultsCache:
+    def testRestoredResults(self):
+        df = SampleExtrato.getDataframe(lines_number=500, seed=1)
+        kit = ExtratoKit()
+        kit.setDataframe(df)
+        hits_number = SharedResultCache.getInstance().getHitsNumber()
+        restored_kit = ExtratoKit()
+        restored_kit.setDataframe(df.copy())
+        assert SharedResultCache.getInstance().getHitsNumber() == hits_number + 1
+        assert restored_kit.getRawDataframe().equals(kit.getRawDataframe())
+        assert restored_kit.getDatasetVersion() == kit.getDatasetVersion()
+        assert restored_kit.getInvertedIndex("Ticker") is kit.getInvertedIndex("Ticker")
+
+    def testReadOnlyRestoredResults(self):
+        df = SampleExtrato.getDataframe(lines_number=300, seed=4)
+        ExtratoKit().setDataframe(df)
+        restored_kit = ExtratoKit()
+        restored_kit.setDataframe(df)
+        with pytest.raises(ValueError):
+            restored_kit.getInvertedIndex("Ticker").getPositionsArray(["T001"])[0] = -1
+
+        # The kit users get copies they can change
+        raw_df = restored_kit.getRawDataframe()
+        raw_df.loc[0, "Quantidade"] = 12345
+        assert restored_kit.getRawDataframe().loc[0, "Quantidade"] != 12345
+
+    def testIndexesInCacheBudget(self):
+        # The indexes are kept as their own cache entries, sized when they are built
+        df = SampleExtrato.getDataframe(lines_number=2000, seed=5)
+        shared_cache = SharedResultCache.getInstance()
+        shared_cache.clear()
+        kit = ExtratoKit()
+        kit.setDataframe(df)
+        total_bytes = shared_cache.getTotalBytes()
+        entries_number = shared_cache.getEntriesNumber()
+        token_index = kit.getTokenIndex(["Notas", "Ticker"])
+        assert shared_cache.getEntriesNumber() == entries_number + 1
+        assert shared_cache.getTotalBytes() == total_bytes + SharedResultCache.getValueBytes(token_index)
+
+    def testResultsKey(self):
+        # The projection and the fixed-point mode are part of the key
+        df = SampleExtrato.getDataframe(lines_number=500, seed=2)
+        kit = ExtratoKit()
+        kit.setDataframe(df)
+        projected_kit = ExtratoKit()
+        projected_kit.setColumnsProjection(["Data", "Ticker"])
+        projected_kit.setDataframe(df)
+        assert list(projected_kit.getNotNanDataframe().columns) == ["Data", "Ticker"]
+        fixed_point_kit = ExtratoKit()
+        fixed_point_kit.setFixedPointMode(True)
+        fixed_point_kit.setDataframe(df)
+        assert fixed_point_kit.getRawDataframe() is not kit.getRawDataframe()
+
+    def testAppendDoesNotChangeCachedResults(self):
+        df = SampleExtrato.getDataframe(lines_number=1000, seed=3)
+        kit = ExtratoKit()
+        kit.setDataframe(df.iloc[:800])
+        raw_df = kit.getRawDataframe().copy()
+        kit.appendDataframe(df.iloc[800:])
+
+        restored_kit = ExtratoKit()
+        restored_kit.setDataframe(df.iloc[:800])
+        assert restored_kit.getRawDataframe().equals(raw_df)
+        restored_kit.appendDataframe(df.iloc[800:])
+        assert restored_kit.getRawDataframe().equals(kit.getRawDataframe())
+
+
+class TestEmptyKit:
+    def testEmptyResultsCalculatedOnce(self, monkeypatch):
+        # The first kit of the class calculates the empty dataframes; the next ones (and their filters) only restore them
+        ExtratoKit()
+
+        def raiseCalculationError(*args):
+            raise AssertionError("The empty results must not be calculated again")
+
+        monkeypatch.setattr(ExtratoKit, "_calculateEmptyResults", raiseCalculationError)
+        kit = ExtratoKit()
+        assert kit.getRawDataframe().empty
+        assert {"Preço Total", "Posição", "Tipo de Posição"} <= set(kit.getRawDataframe().columns)
+        extrato_filter = ExtratoFilter()
+        assert extrato_filter.getLinesNumber() == 0
+
+    def testEmptyResultsNotChanged(self):
+        # Setting and appending lines in a kit does not change the empty results of the next kits
+        df = pd.DataFrame({
+            "Data": pd.to_datetime(["2022-09-01", "2022-09-15", "2022-10-03"]),
+            "Mercado": "Ações",
+            "Ticker": "BBAS3",
+            "Operação": ["Compra", "Compra", "Venda"],
+            "Quantidade": [30.0, 20.0, 50.0],
+            "Preço Unitário": [33.0, 35.0, 41.0],
+        })
+        kit = ExtratoKit()
+        kit.setDataframe(df.iloc[:2])
+        kit.appendDataframe(df.iloc[2:])
+        assert kit.getRawDataframe()["Tipo de Posição"].notna().all()
+        empty_kit = ExtratoKit()
+        assert empty_kit.getRawDataframe().empty
+        assert empty_kit.getNotNanDataframe().empty
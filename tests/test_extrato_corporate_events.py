@@ -0,0 +1,37 @@
+import pandas as pd
+
+from extrato.lib.extrato_corporate_events import CorporateEventType, CorporateEventsAdjuster
+
+
+class TestCorporateEventsAdjuster:
+    def __getExtratoDataframe(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            "Data": pd.to_datetime(["2020-01-01", "2020-03-01", "2020-06-01", "2020-01-05"]),
+            "Mercado": "Ações",
+            "Ticker": ["PETR4", "PETR4", "PETR4", "VALE3"],
+            "Operação": "Compra",
+            "Quantidade": [10.0, 10.0, 10.0, 4.0],
+            "Preço Unitário": [20.0, 30.0, 40.0, 50.0],
+        })
+
+    def testAdjustedLines(self):
+        # The lines before each event are expressed in the quantities after it
+        event_type = CorporateEventType()
+        events_df = pd.DataFrame({
+            "Data": pd.to_datetime(["2020-02-01", "2020-05-01"]),
+            "Ticker": "PETR4",
+            "Evento": [event_type.getSplitEvent(), event_type.getReverseSplitEvent()],
+            "Fator": [2.0, 0.5],
+        })
+        extrato_df = self.__getExtratoDataframe()
+        adjuster = CorporateEventsAdjuster()
+        adjuster.setEventsDataframe(events_df)
+        adjusted_df = adjuster.getAdjustedDataframe(extrato_df)
+        assert adjusted_df["Quantidade"].to_list() == [10.0, 5.0, 10.0, 4.0]
+        assert adjusted_df["Preço Unitário"].to_list() == [20.0, 60.0, 40.0, 50.0]
+        pd.testing.assert_frame_equal(extrato_df, self.__getExtratoDataframe())
+
+    def testNoEvents(self):
+        extrato_df = self.__getExtratoDataframe()
+        adjusted_df = CorporateEventsAdjuster().getAdjustedDataframe(extrato_df)
+        pd.testing.assert_frame_equal(adjusted_df, extrato_df)
@@ -0,0 +1,150 @@
+import pandas as pd
+import pytest
+
+from extrato.lib.extrato_columns import InvestmentPositionType
+from extrato.lib.extrato_dataframes_kit import ExtratoKit
+from extrato.lib.extrato_xls_reader import ExtratoExcelReader
+
+from tests.sample_extrato import SampleExtrato
+
+
+class TestExtratoSlices:
+    def __getExpectedSlicesList(self, df: pd.DataFrame) -> list:
+        # Line by line: the lines of a ticker (in date order) are a slice until the bought and sold quantities are equal
+        ticker_df = df.loc[df["Ticker"].notna()].sort_values(by="Data", kind="mergesort")
+        slices_list = []
+        tickers_state_dict = {}
+        for line, ticker, operation, quantity in zip(
+            ticker_df.index, ticker_df["Ticker"], ticker_df["Operação"], ticker_df["Quantidade"].fillna(0)
+        ):
+            buy_quantity, sell_quantity, slice_lines_list = tickers_state_dict.get(ticker, (0, 0, []))
+            buy_quantity += quantity if operation == "Compra" else 0
+            sell_quantity += quantity if operation == "Venda" else 0
+            slice_lines_list = slice_lines_list + [line]
+            if buy_quantity == sell_quantity:
+                slices_list.append((tuple(slice_lines_list), True))
+                slice_lines_list = []
+            tickers_state_dict[ticker] = (buy_quantity, sell_quantity, slice_lines_list)
+        slices_list += [(tuple(state[2]), False) for state in tickers_state_dict.values() if state[2]]
+        return sorted(slices_list)
+
+    @pytest.mark.parametrize("seed, unique_dates", [(70, True), (71, False)])
+    def testSlices(self, seed, unique_dates):
+        df = SampleExtrato.getDataframe(lines_number=2000, seed=seed, unique_dates=unique_dates)
+        kit = ExtratoKit()
+        kit.setDataframe(df)
+        raw_df = kit.getRawDataframe().loc[df["Ticker"].notna()]
+
+        closed_position = InvestmentPositionType().getClosedPosition()
+        slices_list = sorted(
+            (tuple(slice_df.index), bool((slice_df["Tipo de Posição"] == closed_position).all()))
+            for slice_index, slice_df in raw_df.groupby("Posição")
+        )
+        assert slices_list == self.__getExpectedSlicesList(df)
+        assert raw_df.groupby("Posição")["Ticker"].nunique().eq(1).all()
+
+
+class TestExtratoKitAppend:
+    # The appended kit must have the same results of the whole Extrato, except the slice indexes order
+    def __getSlicesSet(self, raw_df: pd.DataFrame) -> set:
+        return set(raw_df.groupby("Posição").apply(lambda slice_df: tuple(slice_df.index)))
+
+    @pytest.mark.parametrize("unique_dates, fixed_point", [(True, False), (False, False), (False, True)])
+    def testAppendedLines(self, unique_dates, fixed_point):
+        df = SampleExtrato.getDataframe(lines_number=2000, seed=10, unique_dates=unique_dates)
+        if fixed_point:
+            df["Quantidade"] = df["Quantidade"] * 0.1
+        full_kit = ExtratoKit()
+        full_kit.setFixedPointMode(fixed_point)
+        full_kit.setDataframe(df)
+        appended_kit = ExtratoKit()
+        appended_kit.setFixedPointMode(fixed_point)
+        appended_kit.setDataframe(df.iloc[:700])
+        for start, end in [(700, 701), (701, 1200), (1200, 1990), (1990, 2000)]:
+            appended_kit.appendDataframe(df.iloc[start:end])
+
+        full_df = full_kit.getRawDataframe()
+        appended_df = appended_kit.getRawDataframe()
+        assert list(appended_df.index) == list(range(len(df)))
+        assert self.__getSlicesSet(appended_df) == self.__getSlicesSet(full_df)
+        pd.testing.assert_frame_equal(
+            appended_df.drop(columns="Posição"), full_df.drop(columns="Posição"), check_dtype=False
+        )
+        pd.testing.assert_frame_equal(
+            appended_kit.getFormattedDataframe().drop(columns="Posição"),
+            full_kit.getFormattedDataframe().drop(columns="Posição"),
+        )
+
+    def testAppendedLinesRead(self):
+        # The lines read before the whole dataframe (which concatenates the appended lines) are the same
+        df = SampleExtrato.getDataframe(tickers_number=5, lines_number=400, seed=11)
+        full_kit = ExtratoKit()
+        full_kit.setDataframe(df)
+        appended_kit = ExtratoKit()
+        appended_kit.setDataframe(df.iloc[:300])
+        appended_kit.appendDataframe(df.iloc[300:])
+        closed_lines_index = appended_kit.getNewClosedLinesIndex()
+        assert closed_lines_index.min() < 300
+
+        lines_index = closed_lines_index.append(pd.Index([0, 399]))
+        appended_lines_df = appended_kit.getNotNanDataframeLines(lines_index).drop(columns="Posição")
+        pd.testing.assert_frame_equal(appended_lines_df, full_kit.getNotNanDataframeLines(lines_index).drop(columns="Posição"))
+
+    def testNewClosedLines(self):
+        df = pd.DataFrame({
+            "Data": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"]),
+            "Mercado": "Ações",
+            "Ticker": "PETR4",
+            "Operação": ["Compra", "Compra", "Venda"],
+            "Quantidade": [10.0, 5.0, 15.0],
+            "Preço Unitário": [20.0, 21.0, 25.0],
+        })
+        position_type = InvestmentPositionType()
+        kit = ExtratoKit()
+        kit.setDataframe(df.iloc[:2])
+        assert set(kit.getRawDataframe()["Tipo de Posição"]) == {position_type.getOpenedPosition()}
+        kit.appendDataframe(df.iloc[2:])
+        assert list(kit.getNewClosedLinesIndex()) == [0, 1, 2]
+        assert set(kit.getRawDataframe()["Tipo de Posição"]) == {position_type.getClosedPosition()}
+
+
+class TestExtratoKitProjection:
+    # The projected kit must have the same values of the whole kit, in the required columns
+    @pytest.mark.parametrize("columns_list", [
+        ["Data", "Transferência", "Resgate"],
+        ["Data", "Mercado", "Ticker", "Compra", "Venda", "Proventos Totais", "Custo Total"],
+        ["Data", "Ticker", "Posição", "Tipo de Posição"],
+    ])
+    def testProjectedColumns(self, columns_list):
+        df = SampleExtrato.getDataframe(lines_number=1500, seed=20, unique_dates=False)
+        df["Coluna extra"] = 1
+        full_kit = ExtratoKit()
+        full_kit.setDataframe(df)
+        projected_kit = ExtratoKit()
+        projected_kit.setColumnsProjection(columns_list)
+        projected_kit.setDataframe(df)
+
+        projected_df = projected_kit.getNotNanDataframe()
+        assert set(columns_list) <= set(projected_df.columns)
+        assert "Coluna extra" not in projected_df.columns
+        full_df = full_kit.getNotNanDataframe()[list(projected_df.columns)]
+        assert projected_df.equals(full_df)
+        assert projected_kit.getFormattedDataframe(projected_df.iloc[:50]).equals(full_kit.getFormattedDataframe(full_df.iloc[:50]))
+
+    def testReadProjectedColumns(self, tmp_path):
+        df = SampleExtrato.getDataframe(lines_number=300, seed=21)
+        df["Coluna extra"] = 1
+        file = str(tmp_path / "extrato.xlsx")
+        df.to_excel(file, index=False)
+
+        full_reader = ExtratoExcelReader()
+        full_reader.readExcelFile(file)
+        projected_reader = ExtratoExcelReader()
+        projected_reader.setColumnsProjection(["Data", "Transferência", "Resgate"])
+        projected_reader.readExcelFile(file)
+
+        projected_df = projected_reader.getRawDataframe()
+        assert "Coluna extra" not in projected_df.columns
+        full_df = full_reader.getCalculatedDataframe(full_reader.getRawDataframe())
+        projected_df = projected_reader.getCalculatedDataframe(projected_df)
+        assert projected_df.equals(full_df[projected_df.columns])
@@ -0,0 +1,30 @@
+from common.facet_selection import FacetSelection
+
+
+class TestFacetSelection:
+    def testSelectedOption(self):
+        session_state = {}
+        selection = FacetSelection(session_state, "history_side_bar_ticker_selection")
+        assert selection.getSelectedOption(["Exibir todos", "BBAS3", "KNRI11"], "Exibir todos") == "Exibir todos"
+        selection.setSelection("KNRI11")
+        assert selection.getSelectedOption(["Exibir todos", "BBAS3", "KNRI11"], "Exibir todos") == "KNRI11"
+        # A value filtered out by the other widgets gives back the 'all_option', but stays kept
+        assert selection.getSelectedOption(["Exibir todos", "BBAS3"], "Exibir todos") == "Exibir todos"
+        assert session_state["history_side_bar_ticker_selection"] == "KNRI11"
+
+    def testSelectedList(self):
+        selection = FacetSelection({}, "history_side_bar_market_selection")
+        assert selection.getSelectedList(["Ações", "FII"]) == []
+        selection.setSelection(["Tesouro Direto", "FII"])
+        assert selection.getSelectedList(["Ações", "FII", "Tesouro Direto"]) == ["Tesouro Direto", "FII"]
+        assert selection.getSelectedList(["Ações", "FII"]) == ["FII"]
+
+    def testSelectionsPerPage(self):
+        # Pages giving their own key prefix to the Side Bar do not share the selections
+        session_state = {}
+        history_selection = FacetSelection(session_state, "history_side_bar_market_selection")
+        statistics_selection = FacetSelection(session_state, "statistics_side_bar_market_selection")
+        history_selection.setSelection(["Ações"])
+        assert statistics_selection.getSelectedList(["Ações", "FII"]) == []
+        statistics_selection.setSelection(["FII"])
+        assert history_selection.getSelectedList(["Ações", "FII"]) == ["Ações"]
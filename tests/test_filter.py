@@ -0,0 +1,157 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from extrato.lib.extrato_dataframes_kit import ExtratoKit
+from extrato.lib.extrato_filter import ExtratoFilter
+
+from tests.sample_extrato import SampleExtrato
+
+
+class TestExtratoFilter:
+    def __getFilter(self, df: pd.DataFrame) -> ExtratoFilter:
+        extrato_filter = ExtratoFilter()
+        extrato_filter.updateDataframe(df)
+        return extrato_filter
+
+    def __applyFilters(self, extrato_filter: ExtratoFilter) -> None:
+        extrato_filter.applyMarketFilter(["Ações"])
+        extrato_filter.applyDateFilter(datetime.date(2015, 1, 10), datetime.date(2015, 2, 20))
+        extrato_filter.applySearchFilter("nota")
+
+    def testFilteredLines(self):
+        df = SampleExtrato.getDataframe(lines_number=2000, seed=30)
+        extrato_filter = self.__getFilter(df)
+        self.__applyFilters(extrato_filter)
+
+        kit = ExtratoKit()
+        kit.setDataframe(df)
+        main_df = kit.getNotNanDataframe()
+        dates_series = pd.to_datetime(main_df["Data"]).dt.normalize()
+        expected_mask = (
+            (main_df["Mercado"] == "Ações")
+            & (dates_series >= pd.Timestamp("2015-01-10"))
+            & (dates_series <= pd.Timestamp("2015-02-20"))
+            & main_df["Notas"].astype(str).str.contains("Nota")
+        )
+        filtered_df = extrato_filter.getDataframe()
+        assert len(filtered_df) > 0
+        assert filtered_df.equals(main_df.loc[expected_mask.to_numpy()])
+
+    def testCachedFilterChain(self, monkeypatch):
+        # The same chain on the same dataset takes the row ids from the cache, without the indexes
+        df = SampleExtrato.getDataframe(lines_number=2000, seed=31)
+        extrato_filter = self.__getFilter(df)
+        self.__applyFilters(extrato_filter)
+
+        def raiseIndexError(*args):
+            raise AssertionError("The index must not be used")
+
+        cached_filter = self.__getFilter(df.copy())
+        for method_name in ("getInvertedIndex", "getSortedDateIndex", "getTokenIndex"):
+            monkeypatch.setattr(ExtratoKit, method_name, raiseIndexError)
+        self.__applyFilters(cached_filter)
+        assert np.array_equal(cached_filter.getRowsArray(), extrato_filter.getRowsArray())
+        assert cached_filter.getFilteredVersion() == extrato_filter.getFilteredVersion()
+
+    def testNotNanDataframeNotCopied(self, monkeypatch):
+        # The filter keeps only row ids: the lines are read from the kit, never the whole not NaN dataframe
+        df = SampleExtrato.getDataframe(tickers_number=8, lines_number=1200, seed=35)
+        expected_df = self.__getFilter(df).getDataframe()
+
+        def raiseCopyError(*args):
+            raise AssertionError("The not NaN dataframe must not be copied")
+
+        monkeypatch.setattr(ExtratoKit, "getNotNanDataframe", raiseCopyError)
+        extrato_filter = self.__getFilter(df)
+        extrato_filter.applyTickerFilter("T003")
+        ticker_mask = (expected_df["Ticker"] == "T003").to_numpy()
+        assert extrato_filter.getColumnSeries("Ticker").eq("T003").all()
+        assert extrato_filter.getDataframe().equals(expected_df.loc[ticker_mask])
+
+    def testChainPrefixReused(self, monkeypatch):
+        # When only the last filter changes, the previous filters are not applied again
+        df = SampleExtrato.getDataframe(tickers_number=6, lines_number=1500, seed=36, unique_dates=False)
+        extrato_filter = self.__getFilter(df)
+        extrato_filter.applyMarketFilter(["FII"])
+        extrato_filter.applyDateFilter(datetime.date(2015, 1, 1), datetime.date(2015, 1, 31))
+        market_filter = self.__getFilter(df)
+        market_filter.applyMarketFilter(["FII"])
+
+        def raiseIndexError(*args):
+            raise AssertionError("The market filter must not be applied again")
+
+        monkeypatch.setattr(ExtratoKit, "getInvertedIndex", raiseIndexError)
+        other_filter = self.__getFilter(df)
+        other_filter.applyMarketFilter(["FII"])
+        other_filter.applyDateFilter(datetime.date(2015, 2, 1), datetime.date(2015, 2, 28))
+        dates_series = pd.to_datetime(other_filter.getColumnSeries("Data"))
+        assert ((dates_series >= pd.Timestamp("2015-02-01")) & (dates_series <= pd.Timestamp("2015-02-28"))).all()
+        assert len(other_filter.getRowsArray()) > 0
+        assert set(other_filter.getRowsArray()) <= set(market_filter.getRowsArray())
+        assert not set(other_filter.getRowsArray()) & set(extrato_filter.getRowsArray())
+
+    def testFilteredVersion(self):
+        df = SampleExtrato.getDataframe(lines_number=1000, seed=32)
+        extrato_filter = self.__getFilter(df)
+        unfiltered_version = extrato_filter.getFilteredVersion()
+        extrato_filter.applyTickerFilter("T001")
+        ticker_version = extrato_filter.getFilteredVersion()
+        assert ticker_version != unfiltered_version
+
+        other_filter = self.__getFilter(SampleExtrato.getDataframe(lines_number=1000, seed=33))
+        other_filter.applyTickerFilter("T001")
+        assert other_filter.getFilteredVersion() != ticker_version
+
+        # A mask can not be identified: the version is taken from the row ids
+        extrato_filter._applyMask(extrato_filter.getColumnSeries("Operação") == "Compra")
+        mask_version = extrato_filter.getFilteredVersion()
+        assert mask_version is not None and mask_version != ticker_version
+
+    @pytest.mark.parametrize("query", ["", "  ", "!"])
+    def testQueryWithoutWords(self, query):
+        df = SampleExtrato.getDataframe(lines_number=500, seed=34)
+        extrato_filter = self.__getFilter(df)
+        unfiltered_version = extrato_filter.getFilteredVersion()
+        extrato_filter.applySearchFilter(query)
+        assert len(extrato_filter.getRowsArray()) == len(df)
+        assert extrato_filter.getFilteredVersion() == unfiltered_version
+
+
+class TestFacets:
+    def __getFilter(self) -> ExtratoFilter:
+        df = pd.DataFrame({
+            "Data": pd.to_datetime(["2023-01-02", "2023-01-03", "2023-01-05", "2023-02-01", "2023-02-07", "2023-03-10"]),
+            "Mercado": ["FII", "Ações", "FII", "Ações", "Ações", "FII"],
+            "Ticker": ["XPML11", "WEGE3", "XPML11", "EGIE3", "WEGE3", "VISC11"],
+            "Operação": ["Compra", "Compra", "Provento", "Compra", "Venda", "Compra"],
+            "Quantidade": [10.0, 50.0, None, 30.0, 50.0, 8.0],
+            "Preço Unitário": [101.0, 37.0, None, 42.0, 39.0, 118.0],
+            "Dividendos": [None, None, 8.5, None, None, None],
+        })
+        extrato_filter = ExtratoFilter()
+        extrato_filter.updateDataframe(df)
+        return extrato_filter
+
+    def testCountsOfSelectedLines(self):
+        extrato_filter = self.__getFilter()
+        assert extrato_filter.getFacetsDict("Ticker") == {"EGIE3": 1, "VISC11": 1, "WEGE3": 2, "XPML11": 2}
+        extrato_filter.applyMarketFilter(["FII"])
+        assert extrato_filter.getFacetsDict("Ticker") == {"VISC11": 1, "XPML11": 2}
+        assert extrato_filter.getFacetsDict("Operação") == {"Compra": 2, "Provento": 1}
+
+    def testMemoizedFacets(self, monkeypatch):
+        # The facets of the same dataset and filters are not counted again, and the callers get copies
+        self.__getFilter().getFacetsDict("Mercado")
+        extrato_filter = self.__getFilter()
+
+        def raiseIndexError(*args):
+            raise AssertionError("The facets must not be counted again")
+
+        monkeypatch.setattr(ExtratoKit, "getInvertedIndex", raiseIndexError)
+        facets_dict = extrato_filter.getFacetsDict("Mercado")
+        assert facets_dict == {"Ações": 3, "FII": 3}
+        facets_dict["Ações"] = 0
+        assert extrato_filter.getFacetsDict("Mercado")["Ações"] == 3
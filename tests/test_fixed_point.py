@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.fixed_point import FixedPointConverter
+
+from extrato.lib.extrato_columns import InvestmentPositionType
+from extrato.lib.extrato_dataframes_kit import ExtratoKit
+
+
+class TestFixedPointConverter:
+    def testScaledIntegers(self):
+        converter = FixedPointConverter(8)
+        fixed_point_series = converter.getFixedPointSeries(pd.Series([0.1, 0.2, None, -1.5], index=[3, 4, 5, 6]))
+        assert fixed_point_series.dtype == np.int64
+        assert fixed_point_series.to_list() == [10000000, 20000000, 0, -150000000]
+        assert fixed_point_series.index.to_list() == [3, 4, 5, 6]
+        assert fixed_point_series[3] + fixed_point_series[4] == converter.getFixedPointSeries(pd.Series([0.3]))[0]
+        assert converter.getFloatSeries(fixed_point_series).to_list() == [0.1, 0.2, 0.0, -1.5]
+        assert converter.getFloatValue(10000000) == 0.1
+
+    def testInt64Overflow(self):
+        # Values (or sums of values) that could wrap around the 'int64' range raise an error
+        converter = FixedPointConverter(8)
+        with pytest.raises(ValueError, match="Quantidade"):
+            converter.getFixedPointSeries(pd.Series([1e11, 1.0], name="Quantidade"))
+        with pytest.raises(ValueError):
+            converter.getFixedPointSeries(pd.Series([3e10, -3e10]))
+        with pytest.raises(ValueError):
+            converter.getFixedPointSeries(pd.Series([np.inf]))
+        assert converter.getFixedPointSeries(pd.Series([3e10, 1e10])).dtype == np.int64
+        assert FixedPointConverter(2).getFixedPointSeries(pd.Series([1e11, 1e11])).sum() == 2 * 10**13
+
+
+class TestFixedPointMode:
+    def testClosingOperation(self):
+        # 0.1 + 0.2 is not 0.3 as float, but the scaled integers are exact
+        df = pd.DataFrame({
+            "Data": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"]),
+            "Mercado": "Tesouro Direto",
+            "Ticker": "TESOURO IPCA+ 2035",
+            "Operação": ["Compra", "Compra", "Venda"],
+            "Quantidade": [0.1, 0.2, 0.3],
+            "Preço Unitário": [2000.0, 2100.0, 2500.0],
+        })
+        kit = ExtratoKit()
+        kit.setFixedPointMode(True)
+        kit.setDataframe(df)
+        assert set(kit.getRawDataframe()["Tipo de Posição"]) == {InvestmentPositionType().getClosedPosition()}
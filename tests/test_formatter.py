@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from common.formatter import SeriesFormatter, SingleFormatter
+
+
+class TestSingleFormatter:
+    def testMoneyString(self):
+        formatter = SingleFormatter()
+        assert formatter.getMoneyString(1234.5) == "R$ 1.234,50"
+        assert formatter.getMoneyString(-1234567.891) == "-R$ 1.234.567,89"
+        assert formatter.getMoneyString(-0.5) == "-R$ 0,50"
+        assert formatter.getMoneyString("") == "R$ 0,00"
+        assert formatter.getMoneyString("abc") is None
+
+    def testPercentageString(self):
+        formatter = SingleFormatter()
+        assert formatter.getPercentageString(0.1234) == "12.34%"
+        assert formatter.getPercentageString(-0.05) == "-5.00%"
+        assert formatter.getPercentageString("") == ""
+
+    def testNumberString(self):
+        formatter = SingleFormatter()
+        assert formatter.getNumberString(1234567.0) == "1234567"
+        assert formatter.getNumberString(-2.5) == "-2,5"
+
+
+class TestSeriesFormatter:
+    # The 'SeriesFormatter' must build the same strings of the 'SingleFormatter', value by value
+    def __getValuesSeries(self) -> pd.Series:
+        rng = np.random.default_rng(0)
+        random_values = np.concatenate([
+            rng.uniform(-1e6, 1e6, 2000),
+            np.round(rng.uniform(-1000, 1000, 2000), 2),
+            np.round(rng.uniform(-1000, 1000, 2000), 3),
+            rng.uniform(-1, 1, 2000),
+            rng.integers(-10**9, 10**9, 2000).astype(float),
+        ])
+        special_values = [
+            0.0, -0.0, 0.005, 0.015, 0.125, -0.125, 2.675, 999.995, 1e9 + 0.5,
+            1e10, 1e12, 1e15, -1e15, 1e300, np.nan, np.inf, -np.inf,
+        ]
+        return pd.Series(np.concatenate([random_values, special_values]))
+
+    def __assertSameStrings(self, series: pd.Series, series_function, single_function) -> None:
+        expected_list = [single_function(value) for value in series.to_list()]
+        result_series = series_function(series)
+        assert result_series.index.equals(series.index)
+        assert result_series.to_list() == expected_list
+
+    def testMoneySeries(self):
+        single_formatter = SingleFormatter()
+        self.__assertSameStrings(
+            self.__getValuesSeries(), SeriesFormatter().getMoneySeries, single_formatter.getMoneyString
+        )
+
+    def testPercentageSeries(self):
+        single_formatter = SingleFormatter()
+        self.__assertSameStrings(
+            self.__getValuesSeries() / 100, SeriesFormatter().getPercentageSeries, single_formatter.getPercentageString
+        )
+
+    def testNumberSeries(self):
+        single_formatter = SingleFormatter()
+        self.__assertSameStrings(
+            self.__getValuesSeries(), SeriesFormatter().getNumberSeries, single_formatter.getNumberString
+        )
+
+    def testNonNumericValues(self):
+        # Strings are formatted one by one, as the 'SingleFormatter' does
+        series = pd.Series([1.5, "", "abc"], index=[10, 20, 30], dtype=object)
+        money_series = SeriesFormatter().getMoneySeries(series)
+        assert money_series.to_list() == ["R$ 1,50", "R$ 0,00", None]
+        assert money_series.index.equals(series.index)
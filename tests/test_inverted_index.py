@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from common.inverted_index import InvertedIndex
+
+
+class TestInvertedIndex:
+    def __getSeries(self) -> pd.Series:
+        rng = np.random.default_rng(0)
+        values_array = rng.choice(np.array(["PETR4", "VALE3", "ITSA4", "BBAS3", None], dtype=object), 1000)
+        return pd.Series(values_array)
+
+    def testValuesAndCounts(self):
+        series = self.__getSeries()
+        index = InvertedIndex(series)
+        assert index.getLinesNumber() == len(series)
+        assert index.getValuesList() == sorted(series.dropna().unique())
+        assert index.getCountsDict() == series.value_counts().sort_index().to_dict()
+        assert index.getCount("PETR4") == (series == "PETR4").sum()
+        assert index.getCount("XXXX3") == 0
+
+    def testCountsOfLines(self):
+        series = self.__getSeries()
+        index = InvertedIndex(series)
+        positions_array = np.arange(0, 1000, 7)
+        assert index.getCountsDict(positions_array) == series.iloc[positions_array].value_counts().sort_index().to_dict()
+
+    def testPositions(self):
+        series = self.__getSeries()
+        index = InvertedIndex(series)
+        for values_list in (["PETR4"], ["VALE3", "BBAS3"], ["XXXX3"], []):
+            expected_array = np.flatnonzero(series.isin(values_list).to_numpy())
+            assert np.array_equal(index.getPositionsArray(values_list), expected_array)
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.lru_cache import LRUCache, SharedResultCache
+
+
+class TestLRUCache:
+    def testLeastRecentlyUsedEviction(self):
+        cache = LRUCache(max_entries=2)
+        cache.setValue("a", 1)
+        cache.setValue("b", 2)
+        assert cache.getValue("a") == 1
+        cache.setValue("c", 3)
+        assert cache.getValue("b") is None
+        assert cache.getValue("a") == 1
+        assert cache.getValue("c") == 3
+        assert cache.getEntriesNumber() == 2
+        assert (cache.getHitsNumber(), cache.getMissesNumber()) == (3, 1)
+
+    def testReplacedValue(self):
+        cache = LRUCache(max_entries=2)
+        cache.setValue("a", 1)
+        cache.setValue("a", 10)
+        assert cache.getValue("a") == 10
+        assert cache.getEntriesNumber() == 1
+
+    def testMemoryLimit(self):
+        array = np.zeros(100, dtype=np.int64)
+        cache = LRUCache(max_entries=10, max_bytes=2 * array.nbytes)
+        cache.setValue("a", array)
+        cache.setValue("b", array.copy())
+        cache.setValue("c", array.copy())
+        assert cache.getValue("a") is None
+        assert cache.getEntriesNumber() == 2
+        assert cache.getTotalBytes() == 2 * array.nbytes
+
+        # Values larger than the limit are not kept
+        cache.setValue("d", np.zeros(1000, dtype=np.int64))
+        assert cache.getValue("d") is None
+        assert cache.getEntriesNumber() == 2
+
+    def testValueBytes(self):
+        df = pd.DataFrame({"a": np.arange(10)})
+        array = np.zeros(10)
+        assert LRUCache.getValueBytes((df, {"x": array})) == LRUCache.getValueBytes(df) + array.nbytes
+        assert LRUCache.getValueBytes("text") == 0
+
+    def testClear(self):
+        cache = LRUCache(max_bytes=1000)
+        cache.setValue("a", np.zeros(10))
+        cache.clear()
+        assert cache.getEntriesNumber() == 0
+        assert cache.getTotalBytes() == 0
+
+
+class TestSharedResultCache:
+    def testSingleInstance(self):
+        assert SharedResultCache.getInstance() is SharedResultCache.getInstance()
+
+    def testReadOnlyValues(self):
+        # The kept values are shared by the sessions: changing them in place must fail
+        df = pd.DataFrame({"Valor": [1.0, 2.0], "Data": pd.to_datetime(["2020-01-01", "2020-01-02"])})
+        array = np.arange(3)
+        SharedResultCache.getInstance().setValue(("test", "read_only"), {"df": df, "arrays": [array]})
+        with pytest.raises(ValueError):
+            df.loc[0, "Valor"] = 5.0
+        with pytest.raises(ValueError):
+            df["Data"].to_numpy()[0] = np.datetime64("2021-01-01")
+        with pytest.raises(ValueError):
+            array[0] = 10
+        copied_df = df.copy()
+        copied_df.loc[0, "Valor"] = 5.0
+        assert df["Valor"].to_list() == [1.0, 2.0]
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from common.parallel import PartitionExecutor
+
+from positions.lib.closed_dataframes_kit import ClosedPositionKit
+
+from tests.sample_extrato import SampleExtrato
+
+
+class TestPartitionExecutor:
+    def __getSortedDataframe(self, lines_number: int) -> pd.DataFrame:
+        rng = np.random.default_rng(60)
+        return pd.DataFrame({"Ticker": np.sort(rng.choice(list("abcdefghij"), lines_number))})
+
+    def testPartitions(self):
+        df = self.__getSortedDataframe(10000)
+        partitions_list = PartitionExecutor(4, 1000).getPartitionsList(df, "Ticker")
+        assert len(partitions_list) > 1
+        assert pd.concat(partitions_list).equals(df)
+        for partition, next_partition in zip(partitions_list[:-1], partitions_list[1:]):
+            assert set(partition["Ticker"]).isdisjoint(set(next_partition["Ticker"]))
+
+    def testSmallDataframe(self):
+        # Medium Extratos are not worth the processes overhead with the default partition length
+        df = self.__getSortedDataframe(48000)
+        partitions_list = PartitionExecutor(4).getPartitionsList(df, "Ticker")
+        assert len(partitions_list) == 1
+        assert partitions_list[0] is df
+
+    def testMapPartitions(self):
+        df = self.__getSortedDataframe(4000)
+        executor = PartitionExecutor(2, 1000)
+        partitions_list = executor.getPartitionsList(df, "Ticker")
+        assert executor.mapPartitions(len, partitions_list) == [len(partition) for partition in partitions_list]
+
+    def testParallelAggregation(self):
+        # The slices aggregated in partitions must be the same of the current process
+        df = SampleExtrato.getDataframe(lines_number=3000, seed=61)
+        kit = ClosedPositionKit()
+        kit.setExtratoDataframe(df)
+        parallel_kit = ClosedPositionKit()
+        parallel_kit.getExtratoSlicer().setPartitionExecutor(PartitionExecutor(2, 500))
+        parallel_kit.setExtratoDataframe(df)
+        pd.testing.assert_frame_equal(parallel_kit.getRawDataframe(), kit.getRawDataframe())
@@ -0,0 +1,141 @@
+import pandas as pd
+import pytest
+
+from positions.lib.closed_dataframes_kit import ClosedPositionKit
+from positions.lib.open_dataframes_kit import OpenPositionKit
+
+from tests.sample_extrato import SampleExtrato
+
+
+class TestPositionKit:
+    def __getExtratoDataframe(self) -> pd.DataFrame:
+        # PETR4: one closed position (3 lines) and one open position; VALE3: one open position
+        return pd.DataFrame({
+            "Data": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04", "2020-01-05"]),
+            "Mercado": "Ações",
+            "Ticker": ["PETR4", "PETR4", "PETR4", "PETR4", "VALE3"],
+            "Operação": ["Compra", "Compra", "Venda", "Compra", "Compra"],
+            "Quantidade": [10.0, 10.0, 20.0, 5.0, 3.0],
+            "Preço Unitário": [20.0, 30.0, 25.0, 30.0, 60.0],
+            "Taxas": [1.0, 1.0, 1.0, 0.0, 0.0],
+        })
+
+    def testClosedPositions(self):
+        kit = ClosedPositionKit()
+        kit.setExtratoDataframe(self.__getExtratoDataframe())
+        closed_df = kit.getRawDataframe()
+        assert closed_df["Ticker"].to_list() == ["PETR4"]
+        position = closed_df.iloc[0]
+        assert (position["Data Inicial"], position["Data Final"]) == (pd.Timestamp("2020-01-01"), pd.Timestamp("2020-01-03"))
+        assert (position["Quantidade[C]"], position["Preço Total[C]"], position["Taxas[C]"]) == (20.0, 500.0, 2.0)
+        assert (position["Quantidade[V]"], position["Preço Total[V]"], position["Taxas[V]"]) == (20.0, 500.0, 1.0)
+        assert position["Preço Médio c/ Custos[C]"] == pytest.approx(25.1)
+        assert position["Margem Líquida"] == pytest.approx(-3.0)
+
+    def testClosedPositionsAggregatedPerSlice(self):
+        # ITUB4 is closed twice; the Treasury Bond lines are between the ITUB4 lines
+        df = pd.DataFrame({
+            "Data": pd.to_datetime([
+                "2019-02-01", "2019-02-10", "2019-03-01", "2019-03-20", "2019-04-15",
+                "2019-05-20", "2019-06-03", "2019-07-01", "2019-08-01",
+            ]),
+            "Mercado": ["Tesouro Direto", "Ações", "Tesouro Direto", "Ações", "Ações", "Tesouro Direto", "Ações", "Ações", "Ações"],
+            "Ticker": ["TESOURO IPCA+ 2029", "ITUB4", "TESOURO IPCA+ 2029", "ITUB4", "ITUB4", "TESOURO IPCA+ 2029", "ITUB4", "ITUB4", "ITUB4"],
+            "Operação": ["Compra", "Compra", "Compra", "Provento", "Venda", "Venda", "Compra", "Cobrança", "Venda"],
+            "Rentabilidade Contratada": [4.5, None, 4.1, None, None, None, None, None, None],
+            "Indexador": ["IPCA", None, "IPCA", None, None, None, None, None, None],
+            "Quantidade": [0.5, 100.0, 1.5, None, 100.0, 2.0, 40.0, None, 40.0],
+            "Preço Unitário": [2000.0, 22.0, 2100.0, None, 25.0, 2300.0, 30.0, None, 27.5],
+            "Taxas": [0.0, 4.0, 0.0, None, 5.0, 1.0, 2.0, 3.0, 2.0],
+            "IR": [0.0, 0.0, 0.0, None, 6.0, 40.0, 0.0, None, 0.0],
+            "Dividendos": [None, None, None, 12.0, None, None, None, None, None],
+            "JCP": [None, None, None, 3.0, None, None, None, None, None],
+        })
+        kit = ClosedPositionKit()
+        kit.setExtratoDataframe(df)
+        closed_df = kit.getRawDataframe().set_index(["Ticker", "Data Inicial"])
+        assert len(closed_df) == 3
+
+        first_position = closed_df.loc[("ITUB4", pd.Timestamp("2019-02-10"))]
+        assert first_position["Data Final"] == pd.Timestamp("2019-04-15")
+        assert (first_position["Preço Total[C]"], first_position["Preço Total[V]"]) == (2200.0, 2500.0)
+        assert (first_position["Taxas Totais"], first_position["IR Total"], first_position["Proventos Totais"]) == (9.0, 6.0, 15.0)
+        assert first_position["Margem Líquida"] == 300.0 - 15.0 + 15.0
+
+        # The 'Cobrança' taxes are only in the total taxes
+        second_position = closed_df.loc[("ITUB4", pd.Timestamp("2019-06-03"))]
+        assert (second_position["Quantidade[C]"], second_position["Quantidade[V]"]) == (40.0, 40.0)
+        assert (second_position["Taxas[C]"], second_position["Taxas[V]"], second_position["Taxas Adicionais"]) == (2.0, 2.0, 3.0)
+        assert second_position["Venda-Compra"] == -100.0
+
+        # The yields and the index come from the buy lines
+        bond_position = closed_df.loc[("TESOURO IPCA+ 2029", pd.Timestamp("2019-02-01"))]
+        assert (bond_position["Mercado"], bond_position["Indexador"]) == ("Tesouro Direto", "IPCA")
+        assert (bond_position["Yield Mínimo"], bond_position["Yield Máximo"]) == (4.1, 4.5)
+        assert (bond_position["Preço Total[C]"], bond_position["Preço Médio[C]"]) == (4150.0, 2075.0)
+        assert (bond_position["IR[V]"], bond_position["Custos[V]"]) == (40.0, 41.0)
+
+    def testOpenPositions(self):
+        kit = OpenPositionKit()
+        kit.setExtratoDataframe(self.__getExtratoDataframe())
+        open_df = kit.getRawDataframe()
+        assert open_df["Ticker"].to_list() == ["PETR4", "VALE3"]
+        assert open_df["Quantidade"].to_list() == [5.0, 3.0]
+        assert open_df["Capital Investido"].to_list() == [150.0, 180.0]
+
+    def testSharedAndOwnAggregations(self):
+        # Both kits have the shared aggregations (such as the incomes); only the closed one has the sell costs
+        df = pd.DataFrame({
+            "Data": pd.to_datetime(["2021-03-02", "2021-03-05", "2021-03-06", "2021-03-09"]),
+            "Mercado": "FII",
+            "Ticker": "HGLG11",
+            "Operação": ["Compra", "Provento", "Provento", "Venda"],
+            "Quantidade": [4.0, None, None, 1.0],
+            "Preço Unitário": [150.0, None, None, 160.0],
+            "Dividendos": [None, 2.0, 3.5, None],
+            "IR": [0.0, 0.0, 0.0, 0.5],
+        })
+        open_kit = OpenPositionKit()
+        open_kit.setExtratoDataframe(df)
+        open_position = open_kit.getRawDataframe().iloc[0]
+        assert open_position["Data Inicial"] == pd.Timestamp("2021-03-02")
+        assert (open_position["Quantidade[C]"], open_position["Quantidade[V]"], open_position["Preço Total[V]"]) == (4.0, 1.0, 160.0)
+        assert open_position["Dividendos"] == 5.5
+        assert "IR[V]" not in open_kit.getRawDataframe().columns
+
+        df["Quantidade"] = [4.0, None, None, 4.0]
+        closed_kit = ClosedPositionKit()
+        closed_kit.setExtratoDataframe(df)
+        closed_position = closed_kit.getRawDataframe().iloc[0]
+        assert (closed_position["Data Inicial"], closed_position["Data Final"]) == (pd.Timestamp("2021-03-02"), pd.Timestamp("2021-03-09"))
+        assert (closed_position["IR[V]"], closed_position["IR Total"], closed_position["Dividendos"]) == (0.5, 0.5, 5.5)
+
+    def testExtratoObjectsCreatedWhenNeeded(self):
+        # The 'ExtratoSlicer' (and its aggregations) is created only when the slices are aggregated
+        kit = ClosedPositionKit()
+        assert vars(kit)["_PositionKit__extrato_kit_object"] is None
+        kit.getExtratoKit()
+        assert vars(kit)["_PositionKit__extrato_slicer"] is None
+        kit.setExtratoDataframe(self.__getExtratoDataframe())
+        assert vars(kit)["_PositionKit__extrato_slicer"] is not None
+
+    def testEmptyKit(self):
+        # Creating a kit does not calculate anything: the empty results are shared by the kits of the class
+        kit = ClosedPositionKit()
+        assert kit.getRawDataframe().empty
+        assert list(kit.getRawDataframe().columns) == list(ClosedPositionKit().getRawDataframe().columns)
+
+    @pytest.mark.parametrize("kit_class", [ClosedPositionKit, OpenPositionKit])
+    def testFixedPointModeBeforeExtratoObjects(self, kit_class):
+        # The mode set before the 'ExtratoKit' is created must be applied to it
+        df = SampleExtrato.getDataframe(lines_number=1500, seed=40)
+        df["Quantidade"] = df["Quantidade"] * 0.1
+        kit = kit_class()
+        kit.setFixedPointMode(True)
+        kit.setExtratoDataframe(df)
+        assert kit.getExtratoKit().isFixedPointMode()
+        other_kit = kit_class()
+        other_kit.getExtratoKit()
+        other_kit.setFixedPointMode(True)
+        other_kit.setExtratoDataframe(df)
+        pd.testing.assert_frame_equal(kit.getRawDataframe(), other_kit.getRawDataframe())
@@ -0,0 +1,117 @@
+import pandas as pd
+import pytest
+
+from positions.lib.position_dataframes_kit import PositionKit
+from positions.lib.realized_columns import LotMatchingMethod
+from positions.lib.realized_dataframes_kit import LotMatcher, RealizedResultKit
+
+
+class TestLotMatcher:
+    def testFifoMatching(self):
+        lot_matcher = LotMatcher(LotMatchingMethod().getFifoMethod())
+        lot_matcher.addLot(10, 200.0)
+        lot_matcher.addLot(10, 300.0)
+        assert lot_matcher.matchQuantity(15) == pytest.approx(350.0)
+        assert lot_matcher.getQuantity() == 5
+        assert lot_matcher.matchQuantity(5) == pytest.approx(150.0)
+        assert lot_matcher.getQuantity() == 0
+
+    def testMeanPriceMatching(self):
+        lot_matcher = LotMatcher(LotMatchingMethod().getMeanPriceMethod())
+        lot_matcher.addLot(10, 200.0)
+        lot_matcher.addLot(10, 300.0)
+        assert lot_matcher.matchQuantity(15) == pytest.approx(375.0)
+        assert lot_matcher.matchQuantity(5) == pytest.approx(125.0)
+
+    def testSellBeyondLots(self):
+        # Quantities sold beyond the bought lots have no cost
+        lot_matcher = LotMatcher(LotMatchingMethod().getFifoMethod())
+        lot_matcher.addLot(10, 200.0)
+        assert lot_matcher.matchQuantity(15) == pytest.approx(200.0)
+        assert lot_matcher.getQuantity() == 0
+        assert lot_matcher.matchQuantity(5) == 0.0
+
+    def testInvalidMethod(self):
+        with pytest.raises(ValueError):
+            LotMatcher("UEPS")
+
+
+class TestRealizedResultKit:
+    def __getExtratoDataframe(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            "Data": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04", "2020-01-05"]),
+            "Mercado": "Ações",
+            "Ticker": ["PETR4", "PETR4", "VALE3", "PETR4", "PETR4"],
+            "Operação": ["Compra", "Compra", "Compra", "Venda", "Venda"],
+            "Quantidade": [10.0, 10.0, 7.0, 15.0, 5.0],
+            "Preço Unitário": [20.0, 30.0, 50.0, 40.0, 40.0],
+        })
+
+    @pytest.mark.parametrize("matching_method, acquisition_cost_list, result_list", [
+        ("PEPS", [350.0, 150.0], [250.0, 50.0]),
+        ("Preço Médio", [375.0, 125.0], [225.0, 75.0]),
+    ])
+    def testRealizedResults(self, matching_method, acquisition_cost_list, result_list):
+        kit = RealizedResultKit(matching_method)
+        kit.setExtratoDataframe(self.__getExtratoDataframe())
+        realized_df = kit.getRawDataframe()
+        assert realized_df["Ticker"].to_list() == ["PETR4", "PETR4"]
+        assert realized_df["Custo de Aquisição"].to_list() == pytest.approx(acquisition_cost_list)
+        assert realized_df["Quantidade Remanescente"].to_list() == [5.0, 0.0]
+        assert realized_df["Resultado"].to_list() == pytest.approx(result_list)
+
+    def testMatchingMethodChange(self):
+        kit = RealizedResultKit(LotMatchingMethod().getFifoMethod())
+        kit.setExtratoDataframe(self.__getExtratoDataframe())
+        kit.setMatchingMethod(LotMatchingMethod().getMeanPriceMethod())
+        assert kit.getRawDataframe()["Custo de Aquisição"].to_list() == pytest.approx([375.0, 125.0])
+
+    def testPositionKit(self):
+        # The 'ExtratoKit' is created only when the Extrato is set, and its lines without ticker are skipped
+        kit = RealizedResultKit()
+        assert isinstance(kit, PositionKit)
+        assert kit.getRawDataframe().empty
+        assert vars(kit)["_PositionKit__extrato_kit_object"] is None
+
+        df = pd.DataFrame({
+            "Data": pd.to_datetime(["2022-05-02", "2022-05-03", "2022-05-04", "2022-05-06"]),
+            "Mercado": ["Renda Fixa", "Ações", None, "Ações"],
+            "Ticker": ["CDB X", "ITSA4", None, "ITSA4"],
+            "Operação": ["Compra", "Compra", "Transferência", "Venda"],
+            "Quantidade": [1.0, 100.0, None, 40.0],
+            "Preço Unitário": [1000.0, 9.0, None, 10.0],
+            "Taxas": [0.0, 2.0, None, 1.0],
+        })
+        kit.setExtratoDataframe(df)
+        realized_df = kit.getRawDataframe()
+        assert realized_df["Ticker"].to_list() == ["ITSA4"]
+        assert realized_df["Custo de Aquisição"].to_list() == pytest.approx([(900.0 + 2.0) * 0.4])
+        assert realized_df["Resultado"].to_list() == pytest.approx([400.0 - 1.0 - 360.8])
+
+    def testDatasetVersionPerMethod(self):
+        # The same Extrato has different results (and indexes) for each matching method
+        fifo_kit = RealizedResultKit(LotMatchingMethod().getFifoMethod())
+        fifo_kit.setExtratoDataframe(self.__getExtratoDataframe())
+        mean_price_kit = RealizedResultKit(LotMatchingMethod().getMeanPriceMethod())
+        mean_price_kit.setExtratoDataframe(self.__getExtratoDataframe())
+        assert fifo_kit.getDatasetVersion() != mean_price_kit.getDatasetVersion()
+        fifo_kit.setMatchingMethod(LotMatchingMethod().getMeanPriceMethod())
+        assert fifo_kit.getDatasetVersion() == mean_price_kit.getDatasetVersion()
+        assert fifo_kit.getMatchingMethod() == LotMatchingMethod().getMeanPriceMethod()
+
+    def testMatchingMethodChangedColumns(self):
+        # Only the formula columns depending on the matched columns are calculated again
+        kit = RealizedResultKit(LotMatchingMethod().getFifoMethod())
+        kit.setExtratoDataframe(self.__getExtratoDataframe())
+        changed_columns_list = []
+        calculate_formula_columns = kit.calculateFormulaColumns
+        def calculateFormulaColumns(changed_columns=None):
+            changed_columns_list.append(changed_columns)
+            calculate_formula_columns(changed_columns)
+        kit.calculateFormulaColumns = calculateFormulaColumns
+        kit.setMatchingMethod(LotMatchingMethod().getMeanPriceMethod())
+        assert changed_columns_list == [["Custo de Aquisição", "Quantidade Remanescente"]]
+
+        other_kit = RealizedResultKit(LotMatchingMethod().getMeanPriceMethod())
+        other_kit.setExtratoDataframe(self.__getExtratoDataframe())
+        pd.testing.assert_frame_equal(kit.getRawDataframe(), other_kit.getRawDataframe())
@@ -0,0 +1,137 @@
+import hashlib
+import os
+
+import pandas as pd
+import pytest
+
+from common.lru_cache import SharedResultCache
+from common.session_state_cache import SessionStateCache
+
+from extrato.lib.extrato_xls_reader import ExtratoExcelReader
+
+from positions.lib.closed_dataframes_kit import ClosedPositionKit
+from positions.lib.position_dataframes_kit import PositionKit
+from positions.lib.realized_dataframes_kit import RealizedResultKit
+
+
+class TestSessionStateCache:
+    @pytest.fixture(autouse=True)
+    def clearSharedCache(self):
+        SharedResultCache.getInstance().clear()
+        yield
+        SharedResultCache.getInstance().clear()
+
+    def __writeExtratoFile(self, file: str, sell_price: float = 30.0) -> str:
+        pd.DataFrame({
+            "Data": pd.to_datetime(["2021-03-01", "2021-04-05", "2021-06-10", "2021-07-01", "2021-08-20"]),
+            "Mercado": ["FII", "FII", "Ações", "FII", "Ações"],
+            "Ticker": ["HGLG11", "HGLG11", "WEGE3", "HGLG11", "WEGE3"],
+            "Operação": ["Compra", "Compra", "Compra", "Venda", "Venda"],
+            "Quantidade": [10, 5, 100, 15, 40],
+            "Preço Unitário": [160.0, 170.0, 28.0, 180.0, sell_price],
+            "Taxas": [0.5, 0.5, 1.0, 0.5, 1.0],
+            "IR": [0.0, 0.0, 0.0, 3.0, 0.0],
+        }).to_excel(file, index=False)
+        return file
+
+    def __countCalls(self, monkeypatch, owner, method_name: str) -> list:
+        calls_list = []
+        method = getattr(owner, method_name)
+
+        def countedMethod(*args, **kwargs):
+            calls_list.append(args)
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(owner, method_name, countedMethod)
+        return calls_list
+
+    def testSameFileNotHashedAgain(self, tmp_path, monkeypatch):
+        # An unchanged path (same modification time and size) is neither hashed nor read again
+        file = self.__writeExtratoFile(str(tmp_path / "extrato.xlsx"))
+        hash_calls_list = self.__countCalls(monkeypatch, hashlib, "sha256")
+        read_calls_list = self.__countCalls(monkeypatch, ExtratoExcelReader, "readExcelFile")
+        session_state = {}
+        for _ in range(3):
+            SessionStateCache(session_state).setUploadedFile(file)
+        assert (len(hash_calls_list), len(read_calls_list)) == (1, 1)
+        assert list(session_state["extrato_dataframe"]["Ticker"]) == ["HGLG11", "HGLG11", "WEGE3", "HGLG11", "WEGE3"]
+
+        # A changed file is hashed and read again
+        self.__writeExtratoFile(file, sell_price=25.0)
+        os.utime(file, ns=(0, os.stat(file).st_mtime_ns + 10**9))
+        SessionStateCache(session_state).setUploadedFile(file)
+        assert (len(hash_calls_list), len(read_calls_list)) == (2, 2)
+        assert session_state["extrato_dataframe"]["Preço Unitário"].iloc[-1] == 25.0
+
+    def testCopiedFileKeepsDataframe(self, tmp_path, monkeypatch):
+        # A copy of the same content is hashed but not read: only the path in the Session State is updated
+        file = self.__writeExtratoFile(str(tmp_path / "extrato.xlsx"))
+        copied_file = str(tmp_path / "extrato_copia.xlsx")
+        with open(file, "rb") as source, open(copied_file, "wb") as destination:
+            destination.write(source.read())
+        session_state = {}
+        SessionStateCache(session_state).setUploadedFile(file)
+        extrato_df = session_state["extrato_dataframe"]
+        read_calls_list = self.__countCalls(monkeypatch, ExtratoExcelReader, "readExcelFile")
+        SessionStateCache(session_state).setUploadedFile(copied_file)
+        assert len(read_calls_list) == 0
+        assert session_state["extrato_file_path"] == copied_file
+        assert session_state["extrato_dataframe"] is extrato_df
+        # The unchanged copy is not hashed again; going back to the first file hashes it, and updates the path
+        hash_calls_list = self.__countCalls(monkeypatch, hashlib, "sha256")
+        SessionStateCache(session_state).setUploadedFile(copied_file)
+        assert len(hash_calls_list) == 0
+        SessionStateCache(session_state).setUploadedFile(file)
+        assert len(hash_calls_list) == 1
+        assert session_state["extrato_file_path"] == file
+        assert session_state["extrato_dataframe"] is extrato_df
+
+    def testSessionsShareDataframes(self, tmp_path, monkeypatch):
+        # Another session opening the same file uses the dataframes of the 'SharedResultCache'
+        file = self.__writeExtratoFile(str(tmp_path / "extrato.xlsx"))
+        first_session = SessionStateCache({})
+        first_session.setUploadedFile(file)
+        closed_df = first_session.getClosedPositionsDataframe()
+        read_calls_list = self.__countCalls(monkeypatch, ExtratoExcelReader, "readExcelFile")
+        kit_calls_list = self.__countCalls(monkeypatch, ClosedPositionKit, "setExtratoDataframe")
+        second_session = SessionStateCache({})
+        second_session.setUploadedFile(file)
+        assert second_session.getClosedPositionsDataframe() is closed_df
+        assert (len(read_calls_list), len(kit_calls_list)) == (0, 0)
+
+    def testDerivedDataframesOnDemand(self, tmp_path, monkeypatch):
+        # The positions are calculated when they are asked, once per file and matching method
+        file = self.__writeExtratoFile(str(tmp_path / "extrato.xlsx"))
+        kit_calls_list = self.__countCalls(monkeypatch, RealizedResultKit, "setExtratoDataframe")
+        session_state = {}
+        session_cache = SessionStateCache(session_state)
+        session_cache.setUploadedFile(file)
+        assert "closed_positions_dataframe" not in session_state
+        closed_df = session_cache.getClosedPositionsDataframe()
+        assert list(closed_df["Ticker"]) == ["HGLG11"]
+        assert session_cache.getClosedPositionsDataframe() is closed_df
+
+        fifo_df = session_cache.getRealizedResultsDataframe("PEPS")
+        average_df = session_cache.getRealizedResultsDataframe("Preço Médio")
+        assert session_cache.getRealizedResultsDataframe("PEPS") is fifo_df
+        assert len(kit_calls_list) == 2
+        assert list(fifo_df["Ticker"]) == list(average_df["Ticker"]) == ["HGLG11", "WEGE3"]
+
+    def testPositionsOfChangedFile(self, tmp_path, monkeypatch):
+        # Uploading a file only reads it; the positions kept for the previous file are calculated again when asked
+        first_file = self.__writeExtratoFile(str(tmp_path / "extrato_2021.xlsx"))
+        second_file = self.__writeExtratoFile(str(tmp_path / "extrato_2022.xlsx"), sell_price=26.0)
+        session_state = {}
+        session_cache = SessionStateCache(session_state)
+        session_cache.setUploadedFile(first_file)
+        first_open_df = session_cache.getOpenPositionsDataframe()
+        assert list(first_open_df["Ticker"]) == ["WEGE3"]
+
+        kit_calls_list = self.__countCalls(monkeypatch, PositionKit, "setExtratoDataframe")
+        session_cache.setUploadedFile(second_file)
+        assert len(kit_calls_list) == 0
+        assert session_state["open_positions_dataframe"][1] is first_open_df
+        second_open_df = session_cache.getOpenPositionsDataframe()
+        assert second_open_df is not first_open_df
+        assert list(second_open_df["Quantidade"]) == [60.0]
+        assert "closed_positions_dataframe" not in session_state
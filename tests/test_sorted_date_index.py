@@ -0,0 +1,51 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.sorted_date_index import SortedDateIndex
+
+
+class TestSortedDateIndex:
+    def __getSeries(self, sorted_dates: bool) -> pd.Series:
+        rng = np.random.default_rng(1)
+        dates_series = pd.Series(pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 400, 500), unit="D"))
+        if sorted_dates:
+            dates_series = dates_series.sort_values(ignore_index=True)
+        dates_series[[5, 50]] = pd.NaT
+        return dates_series
+
+    @pytest.mark.parametrize("sorted_dates", [True, False])
+    def testPositions(self, sorted_dates):
+        series = self.__getSeries(sorted_dates)
+        index = SortedDateIndex(series)
+        for start_date, end_date in [
+            (None, None),
+            (datetime.date(2020, 3, 1), datetime.date(2020, 6, 30)),
+            (datetime.date(2020, 3, 1), None),
+            (None, datetime.date(2020, 1, 1)),
+            (datetime.date(2021, 1, 1), datetime.date(2020, 1, 1)),
+        ]:
+            expected_mask = series.notna()
+            if start_date is not None:
+                expected_mask &= series >= pd.Timestamp(start_date)
+            if end_date is not None:
+                expected_mask &= series <= pd.Timestamp(end_date)
+            assert np.array_equal(index.getPositionsArray(start_date, end_date), np.flatnonzero(expected_mask.to_numpy()))
+
+    @pytest.mark.parametrize("sorted_dates", [True, False])
+    def testBounds(self, sorted_dates):
+        series = self.__getSeries(sorted_dates)
+        index = SortedDateIndex(series)
+        assert index.getBounds() == (series.min().date(), series.max().date())
+        positions_array = np.arange(100, 200)
+        lines_series = series.iloc[positions_array]
+        assert index.getBounds(positions_array) == (lines_series.min().date(), lines_series.max().date())
+        assert index.getBounds(np.array([5, 50])) == (None, None)
+
+    def testEmptyDates(self):
+        index = SortedDateIndex(pd.Series([pd.NaT, pd.NaT]))
+        assert index.getFirstDate() is None
+        assert index.getLastDate() is None
+        assert len(index.getPositionsArray()) == 0
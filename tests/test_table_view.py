@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from common.table_view import TableView
+
+from extrato.lib.extrato_dataframes_kit import ExtratoKit
+from extrato.lib.extrato_filter import ExtratoFilter
+
+from tests.sample_extrato import SampleExtrato
+
+
+class TestTableView:
+    def __getDataframe(self) -> pd.DataFrame:
+        rng = np.random.default_rng(80)
+        return pd.DataFrame({
+            "Ticker": rng.choice(["PETR4", "VALE3", "ITSA4"], 120),
+            "Valor": rng.integers(0, 50, 120).astype(float),
+        }, index=np.arange(1000, 1120))
+
+    def testPages(self):
+        df = self.__getDataframe()
+        table_view = TableView(page_size=50)
+        table_view.setDataframe(df)
+        assert table_view.getLinesNumber() == 120
+        assert table_view.getPagesNumber() == 3
+        assert table_view.getPageDataframe(1).equals(df.iloc[50:100])
+        assert table_view.getPageDataframe(10).equals(df.iloc[100:])
+        assert table_view.getPageDataframe(-1).equals(df.iloc[:50])
+
+    def testSortedPages(self):
+        df = self.__getDataframe()
+        table_view = TableView(page_size=50)
+        table_view.setDataframe(df)
+        sorted_df = df.sort_values(by="Valor", kind="mergesort")
+        assert table_view.getPageDataframe(0, "Valor").equals(sorted_df.iloc[:50])
+        descending_df = df.iloc[::-1].sort_values(by="Valor", ascending=False, kind="mergesort")
+        assert table_view.getPageDataframe(2, "Valor", ascending=False)["Valor"].equals(descending_df.iloc[100:]["Valor"])
+
+    def testVersion(self):
+        # The sorted orders are kept while the version does not change
+        df = self.__getDataframe()
+        table_view = TableView(page_size=10)
+        table_view.setDataframe(df, version=("filter", 1))
+        table_view.getPageDataframe(0, "Valor")
+        changed_df = df.assign(Valor=-df["Valor"])
+        table_view.setDataframe(changed_df, version=("filter", 1))
+        kept_order_df = changed_df.loc[df.sort_values(by="Valor", kind="mergesort").index]
+        assert table_view.getPageDataframe(0, "Valor").equals(kept_order_df.iloc[:10])
+        table_view.setDataframe(changed_df, version=("filter", 2))
+        assert table_view.getPageDataframe(0, "Valor").equals(changed_df.sort_values(by="Valor", kind="mergesort").iloc[:10])
+
+    def testContentsVersion(self):
+        # Without a version, the dataframe contents are the version
+        df = self.__getDataframe()
+        table_view = TableView(page_size=10)
+        table_view.setDataframe(df)
+        table_view.getPageDataframe(0, "Valor")
+        changed_df = df.assign(Valor=-df["Valor"])
+        table_view.setDataframe(changed_df)
+        assert table_view.getPageDataframe(0, "Valor").equals(changed_df.sort_values(by="Valor", kind="mergesort").iloc[:10])
+
+
+class TestFilteredTableView:
+    def __getFilter(self) -> ExtratoFilter:
+        df = SampleExtrato.getDataframe(tickers_number=10, lines_number=1500, seed=81, unique_dates=False)
+        extrato_filter = ExtratoFilter()
+        extrato_filter.updateDataframe(df)
+        extrato_filter.applyMarketFilter(["Ações", "FII"])
+        return extrato_filter
+
+    def testPagesWithoutFilteredDataframe(self, monkeypatch):
+        # Only the lines of the page are read from the filter: the filtered dataframe is never built
+        extrato_filter = self.__getFilter()
+        filtered_df = extrato_filter.getDataframe()[["Data", "Ticker", "Quantidade"]]
+
+        def raiseDataframeError(*args):
+            raise AssertionError("The filtered dataframe must not be built")
+
+        monkeypatch.setattr(ExtratoFilter, "getDataframe", raiseDataframeError)
+        monkeypatch.setattr(ExtratoKit, "getNotNanDataframe", raiseDataframeError)
+        table_view = TableView(page_size=100)
+        table_view.setFilter(self.__getFilter(), ["Data", "Ticker", "Quantidade"])
+        assert table_view.getLinesNumber() == len(filtered_df) > 300
+        assert table_view.getPageDataframe(2).equals(filtered_df.iloc[200:300])
+        sorted_df = filtered_df.sort_values(by="Quantidade", kind="mergesort")
+        assert table_view.getPageDataframe(1, "Quantidade").equals(sorted_df.iloc[100:200])
+
+    def testFilteredVersion(self):
+        # The sorted orders are calculated again when the filtered lines change
+        extrato_filter = self.__getFilter()
+        table_view = TableView(page_size=20)
+        table_view.setFilter(extrato_filter, ["Ticker", "Quantidade"])
+        table_view.getPageDataframe(0, "Quantidade")
+        extrato_filter.applyTickerFilter("T004")
+        table_view.setFilter(extrato_filter, ["Ticker", "Quantidade"])
+        ticker_df = extrato_filter.getDataframe()[["Ticker", "Quantidade"]]
+        assert table_view.getLinesNumber() == len(ticker_df)
+        assert table_view.getPageDataframe(0, "Quantidade").equals(ticker_df.sort_values(by="Quantidade", kind="mergesort").iloc[:20])
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from common.token_index import TokenIndex
+
+
+class TestTokenIndex:
+    def testTokens(self):
+        assert TokenIndex.getTokensList("Dividendos  RECEBIDOS, ação!") == ["dividendos", "recebidos", "acao"]
+        assert TokenIndex.getTokensList("   ") == []
+
+    def testPositions(self):
+        notes_series = pd.Series(["Dividendos recebidos", np.nan, "Ação bonificada", "dividendo extra", "Subscrição"])
+        tickers_series = pd.Series(["PETR4", "PETR4", "VALE3", "PETR3", np.nan])
+        index = TokenIndex([notes_series, tickers_series])
+        assert index.getPositionsArray("petr div").tolist() == [0, 3]
+        assert index.getPositionsArray("acao").tolist() == [2]
+        assert index.getPositionsArray("PETR4").tolist() == [0, 1]
+        assert index.getPositionsArray("xyz").tolist() == []
+        assert index.getPositionsArray(" , ") is None
+
+    def testSearchedLines(self):
+        # Each word must be the beginning of a token of the line, in any of the columns
+        rng = np.random.default_rng(2)
+        words_array = np.array(["compra", "venda", "dividendos", "taxa", "petr4", "vale3"], dtype=object)
+        texts_series = pd.Series([" ".join(rng.choice(words_array, 2)) for line in range(300)])
+        index = TokenIndex([texts_series])
+        for query in ("div", "pe ven", "taxa compra", "v"):
+            expected_mask = texts_series.apply(
+                lambda text: all(any(token.startswith(word) for token in text.split()) for word in query.split())
+            )
+            assert np.array_equal(index.getPositionsArray(query), np.flatnonzero(expected_mask.to_numpy()))